@@ -2,7 +2,10 @@ from langchain_core.prompts import PromptTemplate
 from langgraph.types import Command
 
 from app.core.azure_openai_client import AzureOpenAIClient
+from app.domain.enums import LLMProfile
 from app.domain.models.conversation_state import ConversationState
+from app.services.answer_synthesizer_service import AnswerSynthesizerService
+from app.services.context_builder_service import ContextBuilderService
 
 
 class ConversationResponseAgent:
@@ -10,30 +13,42 @@ class ConversationResponseAgent:
     Agent responsible for generating conversational responses based on retrieved information.
 
     This agent takes user questions and relevant context to provide meaningful answers.
-    It handles cases where information is available or unavailable.
+    It handles cases where information is available or unavailable. Answers
+    that need no language model, such as single team facts, are synthesized
+    without calling it.
     """
 
-    def __init__(self, openai_client: AzureOpenAIClient) -> None:
+    def __init__(
+        self,
+        openai_client: AzureOpenAIClient,
+        context_builder: ContextBuilderService | None = None,
+        answer_synthesizer: AnswerSynthesizerService | None = None,
+    ) -> None:
         """
         Initialize the conversation response agent.
 
         Args:
             openai_client: Azure OpenAI client for LLM operations
+            context_builder: Optional builder that trims retrieved context to a token budget
+            answer_synthesizer: Optional synthesizer of answers tried before the LLM
         """
         self._response_template = PromptTemplate(
-            input_variables=["user_question", "context_data"],
+            input_variables=["conversation_history", "user_question", "context_data"],
             template=(
                 "You are a conversational agent.\n\n"
                 "RULES:\n"
                 '- If context_data is None or empty: respond "This question is not relevant to the system."\n'
                 "- If context_data is provided: use it to give a concise, helpful answer to the user question.\n\n"
+                "{conversation_history}"
                 "User question: {user_question}\n"
                 "Context data: {context_data}\n\n"
                 "Response:"
             ),
         )
 
-        self._llm = openai_client.get_llm_instance
+        self._llm = openai_client.get_llm(LLMProfile.ANSWER)
+        self._context_builder = context_builder
+        self._answer_synthesizer = answer_synthesizer
 
     async def generate_response(self, conversation_state: ConversationState) -> Command:
         """
@@ -45,9 +60,31 @@ class ConversationResponseAgent:
         Returns:
             Command with the generated response
         """
+        context_data = (
+            self._context_builder.build_context(conversation_state)
+            if self._context_builder is not None
+            else conversation_state.retrieved_context
+        )
+
+        if self._answer_synthesizer is not None and (
+            synthesized_answer := self._answer_synthesizer.try_synthesize(
+                conversation_state, context_data
+            )
+        ):
+            return Command(update={"final_answer": synthesized_answer})
+
+        conversation_history = (
+            "Earlier in this conversation:\n"
+            + "\n".join(conversation_state.session_summary)
+            + "\n\n"
+            if conversation_state.session_summary
+            else ""
+        )
+
         formatted_prompt = self._response_template.format(
+            conversation_history=conversation_history,
             user_question=conversation_state.user_question,
-            context_data=conversation_state.retrieved_context,
+            context_data=context_data,
         )
 
         result = await self._llm.ainvoke(formatted_prompt)
@@ -1,14 +1,23 @@
+import asyncio
 import json
+import logging
 import uuid
+from typing import Any
 
-from langchain.agents import initialize_agent, AgentType
 from langchain_core.messages import SystemMessage
 from langgraph.types import Command
+from pydantic import BaseModel
 
 from app.core.azure_openai_client import AzureOpenAIClient
+from app.domain.enums import FootballAgentMode, LLMProfile
 from app.domain.models.conversation_state import ConversationState
+from app.domain.models.football_tool_plan import FootballToolPlan
 from app.tools.football_api_tools import FootballAPITools
 
+logger = logging.getLogger(__name__)
+
+_MAX_PLANNED_TOOL_CALLS = 3
+
 
 class FootballDataAgent:
     """
@@ -16,10 +25,17 @@ class FootballDataAgent:
 
     Uses football-specific tools to search and retrieve team information
     from external APIs without generating synthetic data.
+
+    In single-shot mode, plans longer than the tool call limit are cut off
+    and counted, and questions the planner extracts nothing from are handed
+    to the tool agent loop, which is built on first use.
     """
 
     def __init__(
-        self, openai_client: AzureOpenAIClient, football_tools: FootballAPITools
+        self,
+        openai_client: AzureOpenAIClient,
+        football_tools: FootballAPITools,
+        mode: FootballAgentMode = FootballAgentMode.SINGLE_SHOT,
     ) -> None:
         """
         Initialize the football data agent.
@@ -27,7 +43,50 @@ class FootballDataAgent:
         Args:
             openai_client: Azure OpenAI client for LLM operations
             football_tools: Tools for football data operations
+            mode: Execution strategy, single-shot planning or the tool agent loop
+        """
+        self._mode = mode
+        self._football_tools = football_tools
+        self._planning_llm = openai_client.get_llm(LLMProfile.TOOL_PLANNING)
+        self._agent = None
+
+        self._plans = 0
+        self._truncated_plans = 0
+        self._dropped_tool_calls = 0
+        self._empty_plan_fallbacks = 0
+
+        if mode == FootballAgentMode.SINGLE_SHOT:
+            self._planner = self._planning_llm.with_structured_output(
+                FootballToolPlan, method="function_calling"
+            )
+        else:
+            self._agent = self._build_tool_agent()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get single-shot planning statistics.
+
+        Returns:
+            Number of plans, plans cut off at the tool call limit with the
+            calls they lost, and empty plans handed to the tool agent
         """
+        return {
+            "plans": self._plans,
+            "truncated_plans": self._truncated_plans,
+            "dropped_tool_calls": self._dropped_tool_calls,
+            "empty_plan_fallbacks": self._empty_plan_fallbacks,
+            "max_planned_tool_calls": _MAX_PLANNED_TOOL_CALLS,
+        }
+
+    def _build_tool_agent(self) -> Any:
+        """
+        Build the LangChain functions agent running the tool loop.
+
+        Returns:
+            Agent executor calling the football tools
+        """
+        from langchain.agents import initialize_agent, AgentType
+
         system_prompt = SystemMessage(
             content=(
                 "You are FootballDataAgent. Your ONLY job is to call exactly one tool "
@@ -35,15 +94,21 @@ class FootballDataAgent:
                 "Tools:\n"
                 "  1) search_teams_by_name(team_name: str)\n"
                 "  2) get_team_details_by_id(team_id: str)\n"
+                "  3) get_upcoming_matches(team_name: str)\n"
+                "  4) get_recent_results(team_name: str)\n"
+                "  5) get_league_table(league_name: str)\n"
             )
         )
 
-        self._agent = initialize_agent(
+        return initialize_agent(
             tools=[
-                football_tools.search_teams_by_name,
-                football_tools.get_team_details_by_id,
+                self._football_tools.search_teams_by_name,
+                self._football_tools.get_team_details_by_id,
+                self._football_tools.get_upcoming_matches,
+                self._football_tools.get_recent_results,
+                self._football_tools.get_league_table,
             ],
-            llm=openai_client.get_llm_instance,
+            llm=self._planning_llm,
             agent=AgentType.OPENAI_FUNCTIONS,
             verbose=True,
             system_messages=[system_prompt],
@@ -61,7 +126,15 @@ class FootballDataAgent:
         Returns:
             Command directing to the next step with retrieved data
         """
-        result = await self._agent.ainvoke(conversation_state.user_question)
+        result = None
+        if self._mode == FootballAgentMode.SINGLE_SHOT:
+            result = await self._run_single_shot_plan(conversation_state.user_question)
+            if not result:
+                self._empty_plan_fallbacks += 1
+        if not result:
+            if self._agent is None:
+                self._agent = await asyncio.to_thread(self._build_tool_agent)
+            result = await self._agent.ainvoke(conversation_state.user_question)
 
         msg = {
             "role": "tool",
@@ -72,3 +145,105 @@ class FootballDataAgent:
             goto="conversational_agent",
             update={"retrieved_context": [msg]},
         )
+
+    async def _run_single_shot_plan(self, user_question: str) -> list[dict[str, Any]]:
+        """
+        Plan tool calls with one structured LLM call and execute them directly.
+
+        Args:
+            user_question: Question asked by the user
+
+        Returns:
+            Raw tool results paired with the tool name and input, empty if
+            the planner extracted nothing from the question
+        """
+        plan: FootballToolPlan = await self._planner.ainvoke(
+            "Extract the football teams and leagues the user asks about.\n"
+            "- team_names: team names exactly as a fan would write them, without commentary\n"
+            "- team_ids: only numeric TheSportsDB IDs that appear literally in the question\n"
+            "- upcoming_match_teams: teams whose next matches or fixtures are asked for\n"
+            "- recent_result_teams: teams whose latest results are asked for\n"
+            "- league_tables: leagues whose table or standings are asked for\n\n"
+            f'User question: "{user_question}"'
+        )
+
+        planned_calls = (
+            [
+                (self._football_tools.get_upcoming_matches, {"team_name": team_name})
+                for team_name in self._deduplicate_names(plan.upcoming_match_teams)
+            ]
+            + [
+                (self._football_tools.get_recent_results, {"team_name": team_name})
+                for team_name in self._deduplicate_names(plan.recent_result_teams)
+            ]
+            + [
+                (self._football_tools.get_league_table, {"league_name": league_name})
+                for league_name in self._deduplicate_names(plan.league_tables)
+            ]
+            + [
+                (
+                    self._football_tools.get_team_details_by_id,
+                    {"team_id": team_id.strip()},
+                )
+                for team_id in dict.fromkeys(plan.team_ids)
+            ]
+            + [
+                (self._football_tools.search_teams_by_name, {"team_name": team_name})
+                for team_name in self._deduplicate_names(plan.team_names)
+            ]
+        )
+        self._plans += 1
+        if len(planned_calls) > _MAX_PLANNED_TOOL_CALLS:
+            self._truncated_plans += 1
+            self._dropped_tool_calls += len(planned_calls) - _MAX_PLANNED_TOOL_CALLS
+            logger.warning(
+                "Dropping %d of %d planned football tool calls",
+                len(planned_calls) - _MAX_PLANNED_TOOL_CALLS,
+                len(planned_calls),
+            )
+            planned_calls = planned_calls[:_MAX_PLANNED_TOOL_CALLS]
+
+        outputs = await asyncio.gather(
+            *(tool.ainvoke(tool_input) for tool, tool_input in planned_calls)
+        )
+
+        return [
+            {
+                "tool": tool.name,
+                "input": tool_input,
+                "output": self._to_serializable(output),
+            }
+            for (tool, tool_input), output in zip(planned_calls, outputs)
+        ]
+
+    @staticmethod
+    def _deduplicate_names(names: list[str]) -> list[str]:
+        """
+        Strip names and drop empty and case-insensitive duplicates.
+
+        Args:
+            names: Team or league names extracted by the planner
+
+        Returns:
+            Unique names in their original order
+        """
+        unique_names: dict[str, str] = {}
+        for name in names:
+            if name.strip():
+                unique_names.setdefault(name.strip().casefold(), name.strip())
+        return list(unique_names.values())
+
+    @staticmethod
+    def _to_serializable(tool_output: Any) -> Any:
+        """
+        Convert tool output into JSON-serializable data.
+
+        Args:
+            tool_output: Value returned by a football tool
+
+        Returns:
+            Plain data structure suitable for json.dumps
+        """
+        if isinstance(tool_output, BaseModel):
+            return tool_output.model_dump()
+        return tool_output
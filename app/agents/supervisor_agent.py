@@ -2,7 +2,9 @@ from langgraph.types import Command
 
 from app.core.azure_openai_client import AzureOpenAIClient
 from app.domain.models.conversation_state import ConversationState
-from app.domain.enums import WorkflowRouteDecision
+from app.domain.enums import LLMProfile, WorkflowRouteDecision
+from app.services.fixtures_store_service import FixturesStoreService
+from app.services.route_classifier_service import RouteClassifierService
 
 
 class SupervisorAgent:
@@ -13,14 +15,24 @@ class SupervisorAgent:
     based on content analysis and context requirements.
     """
 
-    def __init__(self, openai_client: AzureOpenAIClient) -> None:
+    def __init__(
+        self,
+        openai_client: AzureOpenAIClient,
+        route_classifier: RouteClassifierService | None = None,
+        fixtures_store: FixturesStoreService | None = None,
+    ) -> None:
         """
         Initialize the routing supervisor agent.
 
         Args:
             openai_client: Azure OpenAI client for decision-making
+            route_classifier: Optional local classifier tried before the LLM
+            fixtures_store: Optional local store answering fixture and table
+                questions, which are then routed to the football data agent
         """
         self._openai_client = openai_client
+        self._route_classifier = route_classifier
+        self._fixtures_store = fixtures_store
 
     async def determine_routing_decision(
         self, conversation_state: ConversationState
@@ -34,6 +46,20 @@ class SupervisorAgent:
         Returns:
             Command directing to the appropriate agent(s)
         """
+        if self._fixtures_store is not None and self._fixtures_store.can_answer(
+            conversation_state.user_question
+        ):
+            return self._build_routing_command(
+                WorkflowRouteDecision.FOOTBALL_DATA.value
+            )
+
+        if self._route_classifier is not None and (
+            local_decision := self._route_classifier.try_classify(
+                conversation_state.user_question
+            )
+        ):
+            return self._build_routing_command(local_decision.value)
+
         routing_prompt = (
             "You are the SupervisorAgent. Your ONLY task is to analyze if the user's question is about football/soccer and choose the appropriate routing token.\n\n"
             "FOOTBALL TOPICS include: teams, players, matches, scores, leagues, transfers, statistics, fixtures, results, standings, etc.\n\n"
@@ -49,13 +75,28 @@ class SupervisorAgent:
             "CRITICAL: Output ONLY the token, nothing else:"
         )
 
-        routing_decision = await self._openai_client.get_llm_instance.ainvoke(
+        routing_decision = await self._openai_client.get_llm(
+            LLMProfile.ROUTING
+        ).ainvoke(
             routing_prompt,
         )
         final_decision = routing_decision.content.strip().lower()
 
         conversation_state.current_route_decision = final_decision
 
+        return self._build_routing_command(final_decision)
+
+    @staticmethod
+    def _build_routing_command(final_decision: str) -> Command:
+        """
+        Build the command that dispatches to the selected agent(s).
+
+        Args:
+            final_decision: Routing token chosen for the question
+
+        Returns:
+            Command directing to the appropriate agent(s)
+        """
         if final_decision == WorkflowRouteDecision.COMBINED_APPROACH:
             return Command(
                 goto=["search_agent", "fotmob_agent"],
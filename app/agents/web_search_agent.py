@@ -1,10 +1,10 @@
 import json
 import uuid
 
-from langchain_tavily import TavilySearch
 from langgraph.types import Command
 
 from app.domain.models.conversation_state import ConversationState
+from app.services.web_search_service import WebSearchService
 
 
 class WebSearchAgent:
@@ -15,9 +15,14 @@ class WebSearchAgent:
     focusing on retrieving relevant information from the internet.
     """
 
-    def __init__(self) -> None:
-        """Initialize the web search agent with general search capability."""
-        self._search_tool = TavilySearch(topic="general")
+    def __init__(self, web_search_service: WebSearchService) -> None:
+        """
+        Initialize the web search agent.
+
+        Args:
+            web_search_service: Service running cached, deduplicated web searches
+        """
+        self._web_search_service = web_search_service
 
     async def search_web_content(
         self, conversation_state: ConversationState
@@ -31,12 +36,13 @@ class WebSearchAgent:
         Returns:
             Command directing to conversation agent with search results
         """
-        football_query = f"football soccer {conversation_state.user_question}"
-        raw_results = await self._search_tool.ainvoke(football_query)
+        search_results = await self._web_search_service.search(
+            conversation_state.user_question
+        )
 
         msg = {
             "role": "tool",
-            "content": json.dumps(raw_results, ensure_ascii=False),
+            "content": json.dumps(search_results, ensure_ascii=False),
             "tool_call_id": str(uuid.uuid4()),
         }
 
@@ -1,3 +1,5 @@
 from app.api.chat_router import ChatRouter
+from app.api.metrics_router import MetricsRouter
+from app.api.stats_router import StatsRouter
 
-__all__ = ["ChatRouter"]
+__all__ = ["ChatRouter", "MetricsRouter", "StatsRouter"]
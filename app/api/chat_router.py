@@ -1,54 +1,573 @@
-from fastapi import APIRouter
-
-from app.core.graph_builder import GraphBuilder
-from app.domain.models.conversation_state import ConversationState
-from app.domain.models.user_question import UserQuestion
-
-
-class ChatRouter:
-    """
-    API router for chat-related endpoints.
-
-    Handles HTTP requests for chat functionality and coordinates
-    with the workflow orchestrator to process user queries.
-    """
-
-    def __init__(self, graph_builder: GraphBuilder) -> None:
-        """
-        Initialize the chat API router.
-
-        Args:
-            graph_builder: Main workflow orchestrator for processing requests
-        """
-        self._api_router = APIRouter(prefix="/api/v1", tags=["Chat"])
-        self._graph_builder = graph_builder
-
-    def get_configured_router(self) -> APIRouter:
-        """
-        Get the configured API router with registered endpoints.
-
-        Returns:
-            Configured FastAPI router
-        """
-        self._api_router.post("/chat")(self.process_chat_message)
-        return self._api_router
-
-    async def process_chat_message(
-        self, user_question: UserQuestion
-    ) -> dict[str, dict[str, str]]:
-        """
-        Process incoming chat messages and return responses.
-
-        Args:
-            user_question: User's question wrapped in the schema
-
-        Returns:
-            Structured response containing the answer
-        """
-        initial_state = ConversationState(
-            user_question=user_question.question,
-        )
-
-        final_result = await self._graph_builder.execute_workflow(initial_state)
-
-        return {"data": {"answer": final_result.get("final_answer")}}
+import asyncio
+import json
+import logging
+import time
+from typing import Annotated, Any, AsyncIterator, Callable
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from app.core.graph_builder import GraphBuilder
+from app.domain.enums import ChatJobStatus, StreamEventType
+from app.domain.models.conversation_state import ConversationState
+from app.domain.models.user_question import UserQuestion, UserQuestionBatch
+from app.services.answer_cache_service import AnswerCacheService
+from app.services.chat_job_service import ChatJob, ChatJobService
+from app.utils.admission_controller import AdmissionController, AdmissionRejectedError
+from app.utils.sampling_profiler import SamplingProfiler
+
+logger = logging.getLogger(__name__)
+
+
+class _ReleasingStreamingResponse(StreamingResponse):
+    """
+    Streaming response running a callback once it has been sent or abandoned.
+
+    The callback also runs when the client disconnects before the body is
+    iterated, in which case the body generator never starts and its own
+    cleanup code never runs.
+    """
+
+    def __init__(
+        self,
+        content: AsyncIterator[str],
+        on_close: Callable[[], None],
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(content, **kwargs)
+        self._on_close = on_close
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self._on_close()
+
+
+class ChatRouter:
+    """
+    API router for chat-related endpoints.
+
+    Handles HTTP requests for chat functionality and coordinates
+    with the workflow orchestrator to process user queries. Workflow runs
+    pass through admission control; answers served from the cache do not.
+    """
+
+    def __init__(
+        self,
+        graph_builder: GraphBuilder,
+        answer_cache: AnswerCacheService | None = None,
+        batch_max_concurrency: int = 8,
+        admission_controller: AdmissionController | None = None,
+        request_deadline_seconds: float = 0.0,
+        chat_jobs: ChatJobService | None = None,
+        job_max_wait_seconds: float = 30.0,
+        profiler: SamplingProfiler | None = None,
+        response_class: type[JSONResponse] = JSONResponse,
+    ) -> None:
+        """
+        Initialize the chat API router.
+
+        Args:
+            graph_builder: Main workflow orchestrator for processing requests
+            answer_cache: Optional cache of final answers consulted before the workflow
+            batch_max_concurrency: Maximum number of workflows run at once per batch
+            admission_controller: Optional limit on concurrently running workflows
+            request_deadline_seconds: Time budget of a request from its arrival;
+                0 disables deadlines
+            chat_jobs: Optional worker pool running asynchronous chat jobs
+            job_max_wait_seconds: Upper bound of the long-poll wait of job lookups
+            profiler: Optional sampling profiler for requests asking to be profiled
+            response_class: Response class rendering the JSON chat responses
+        """
+        self._api_router = APIRouter(
+            prefix="/api/v1", tags=["Chat"], default_response_class=response_class
+        )
+        self._graph_builder = graph_builder
+        self._answer_cache = answer_cache
+        self._batch_max_concurrency = batch_max_concurrency
+        self._admission_controller = admission_controller
+        self._request_deadline_seconds = request_deadline_seconds
+        self._chat_jobs = chat_jobs
+        self._job_max_wait_seconds = job_max_wait_seconds
+        self._profiler = profiler
+
+    def get_configured_router(self) -> APIRouter:
+        """
+        Get the configured API router with registered endpoints.
+
+        Returns:
+            Configured FastAPI router
+        """
+        self._api_router.post("/chat")(self.process_chat_message)
+        self._api_router.post("/chat/stream")(self.stream_chat_message)
+        self._api_router.post("/chat/batch")(self.process_chat_batch)
+        if self._chat_jobs is not None:
+            self._api_router.post("/chat/jobs", status_code=202)(self.submit_chat_job)
+            self._api_router.get("/chat/jobs/{job_id}")(self.get_chat_job)
+        return self._api_router
+
+    async def process_chat_message(
+        self,
+        user_question: UserQuestion,
+        profile: bool = False,
+        x_profile: Annotated[bool, Header()] = False,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Process incoming chat messages and return responses.
+
+        With the `profile` query flag or the `X-Profile` header, the event
+        loop is sampled while the request runs and the profile is returned
+        next to the answer. The profile covers all work on the loop in that
+        time, including concurrently served requests. Profiles are
+        rate-limited; a request that is not profiled gets a `rate_limited`
+        profile status instead.
+
+        Args:
+            user_question: User's question wrapped in the schema
+            profile: Whether to profile the request
+            x_profile: Whether to profile the request, as a header
+
+        Returns:
+            Structured response containing the answer and, if requested, the profile
+
+        Raises:
+            HTTPException: 429 or 503 with Retry-After when the service is saturated,
+                504 when the request deadline passes before an answer exists
+        """
+        profile_session = None
+        if self._profiler is not None and (profile or x_profile):
+            profile_session = self._profiler.start()
+
+        try:
+            final_answer = await self._answer_question(
+                user_question.question, user_question.session_id
+            )
+        except AdmissionRejectedError as exc:
+            raise self._build_rejection_response(exc) from None
+        except TimeoutError:
+            raise HTTPException(
+                status_code=504, detail="Request deadline exceeded"
+            ) from None
+        finally:
+            profile_data = (
+                self._profiler.stop(profile_session)
+                if profile_session is not None
+                else None
+            )
+
+        response_data: dict[str, Any] = {"answer": final_answer}
+        if self._profiler is not None and (profile or x_profile):
+            response_data["profile"] = (
+                {"status": "captured", **profile_data}
+                if profile_data is not None
+                else {"status": "rate_limited"}
+            )
+        return {"data": response_data}
+
+    async def process_chat_batch(
+        self, question_batch: UserQuestionBatch
+    ) -> dict[str, dict[str, list[dict[str, str | None]]]]:
+        """
+        Process a batch of chat messages and return per-question results.
+
+        Identical questions of the same session are answered once, and the
+        remaining workflows run concurrently up to the configured limit so they
+        share cached and in-flight upstream lookups.
+
+        Args:
+            question_batch: Batch of user questions wrapped in the schema
+
+        Returns:
+            Structured response with one result per question, in request order;
+            failed questions carry a fixed error message instead of an answer
+        """
+        question_keys = [
+            (user_question.session_id, self._get_batch_key(user_question.question))
+            for user_question in question_batch.questions
+        ]
+        unique_questions = dict(zip(question_keys, question_batch.questions))
+
+        semaphore = asyncio.Semaphore(self._batch_max_concurrency)
+
+        async def answer_with_limit(user_question: UserQuestion) -> str | None:
+            async with semaphore:
+                return await self._answer_question(
+                    user_question.question, user_question.session_id
+                )
+
+        outcomes = await asyncio.gather(
+            *(
+                answer_with_limit(user_question)
+                for user_question in unique_questions.values()
+            ),
+            return_exceptions=True,
+        )
+        outcomes_by_key = dict(zip(unique_questions, outcomes))
+
+        results = []
+        for user_question, question_key in zip(question_batch.questions, question_keys):
+            question = user_question.question
+            outcome = outcomes_by_key[question_key]
+            if isinstance(outcome, BaseException):
+                results.append(
+                    {"question": question, "error": self._describe_batch_error(outcome)}
+                )
+            else:
+                results.append({"question": question, "answer": outcome})
+
+        return {"data": {"results": results}}
+
+    async def submit_chat_job(
+        self, user_question: UserQuestion
+    ) -> dict[str, dict[str, str]]:
+        """
+        Queue a chat message for asynchronous processing.
+
+        The answer is produced by a job worker and fetched with the returned
+        job id, so the client does not wait for the workflow.
+
+        Args:
+            user_question: User's question wrapped in the schema
+
+        Returns:
+            Structured response containing the job id and status
+
+        Raises:
+            HTTPException: 429 with Retry-After when the job queue is full
+        """
+        try:
+            job = await self._chat_jobs.submit(
+                lambda: self._answer_job_question(
+                    user_question.question, user_question.session_id
+                )
+            )
+        except AdmissionRejectedError as exc:
+            raise self._build_rejection_response(exc) from None
+        return {"data": {"job_id": job.job_id, "status": job.status.value}}
+
+    async def get_chat_job(
+        self, job_id: str, wait_seconds: float = 0.0
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get the status and result of a chat job.
+
+        With a wait time the request is held until the job finishes or the
+        wait time, capped at the configured maximum, passes.
+
+        Args:
+            job_id: Identifier returned when the job was submitted
+            wait_seconds: Maximum time to wait for an unfinished job
+
+        Returns:
+            Structured response containing the job status and, once
+            finished, its answer or error
+
+        Raises:
+            HTTPException: 404 when the job is unknown or its result expired
+        """
+        job = await self._chat_jobs.get(
+            job_id, min(wait_seconds, self._job_max_wait_seconds)
+        )
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return {"data": self._serialize_job(job)}
+
+    async def stream_chat_message(
+        self, user_question: UserQuestion
+    ) -> StreamingResponse:
+        """
+        Process incoming chat messages and stream progress and answer tokens.
+
+        Events are sent as Server-Sent Events: `progress` when a workflow step
+        finishes, `token` for each generated answer fragment and a final `done`
+        event with the complete answer.
+
+        Args:
+            user_question: User's question wrapped in the schema
+
+        Returns:
+            Streaming response with the `text/event-stream` media type
+
+        Raises:
+            HTTPException: 429 or 503 with Retry-After when the service is saturated
+        """
+        initial_state = ConversationState(
+            user_question=user_question.question,
+            session_id=user_question.session_id,
+            deadline=self._get_deadline(),
+        )
+
+        response_options: dict[str, Any] = {
+            "media_type": "text/event-stream",
+            "headers": {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        }
+        answer_cache = self._answer_cache if initial_state.session_id is None else None
+        if answer_cache is not None and (
+            cached_answer := await answer_cache.get(initial_state.user_question)
+        ):
+            return StreamingResponse(
+                self._generate_cached_server_sent_events(cached_answer),
+                **response_options,
+            )
+
+        server_sent_events = self._generate_server_sent_events(
+            initial_state, answer_cache
+        )
+        if self._admission_controller is None:
+            return StreamingResponse(server_sent_events, **response_options)
+
+        try:
+            admitted_at = await self._admission_controller.acquire()
+        except AdmissionRejectedError as exc:
+            raise self._build_rejection_response(exc) from None
+        try:
+            return _ReleasingStreamingResponse(
+                server_sent_events,
+                lambda: self._admission_controller.release(admitted_at),
+                **response_options,
+            )
+        except BaseException:
+            self._admission_controller.release(admitted_at)
+            raise
+
+    async def _answer_question(
+        self, question: str, session_id: str | None = None
+    ) -> str | None:
+        """
+        Answer a single question from the answer cache or by running the workflow.
+
+        Turns of a session depend on the earlier turns and bypass the answer
+        cache. Partial answers, given after a data agent missed the deadline,
+        are not cached.
+
+        Args:
+            question: Question asked by the user
+            session_id: Optional session the question belongs to
+
+        Returns:
+            Final answer produced for the question
+
+        Raises:
+            AdmissionRejectedError: If the workflow is not admitted in time
+        """
+        deadline = self._get_deadline()
+        answer_cache = self._answer_cache if session_id is None else None
+        if answer_cache is not None and (
+            cached_answer := await answer_cache.get(question)
+        ):
+            return cached_answer
+
+        initial_state = ConversationState(
+            user_question=question,
+            session_id=session_id,
+            deadline=deadline,
+        )
+
+        started_at = time.perf_counter()
+        if self._admission_controller is None:
+            final_result = await self._graph_builder.execute_workflow(initial_state)
+        else:
+            async with self._admission_controller.admit():
+                final_result = await self._graph_builder.execute_workflow(initial_state)
+        final_answer = final_result.get("final_answer")
+
+        if (
+            answer_cache is not None
+            and final_answer
+            and not final_result.get("partial")
+        ):
+            await answer_cache.set(
+                question,
+                final_answer,
+                final_result.get("current_route_decision"),
+                time.perf_counter() - started_at,
+            )
+
+        return final_answer
+
+    async def _answer_job_question(
+        self, question: str, session_id: str | None
+    ) -> str | None:
+        """
+        Answer the question of a chat job.
+
+        Args:
+            question: Question asked by the user
+            session_id: Optional session the question belongs to
+
+        Returns:
+            Final answer produced for the question
+
+        Raises:
+            TimeoutError: If the request deadline passes before an answer exists
+        """
+        try:
+            return await self._answer_question(question, session_id)
+        except TimeoutError:
+            raise TimeoutError("Request deadline exceeded") from None
+
+    @staticmethod
+    def _serialize_job(job: ChatJob) -> dict[str, Any]:
+        """
+        Convert a chat job into its response representation.
+
+        Args:
+            job: Chat job in its current state
+
+        Returns:
+            Job id and status, plus the answer or error of a finished job
+        """
+        job_data: dict[str, Any] = {"job_id": job.job_id, "status": job.status.value}
+        if job.status == ChatJobStatus.SUCCEEDED:
+            job_data["answer"] = job.answer
+        elif job.status == ChatJobStatus.FAILED:
+            job_data["error"] = job.error
+        return job_data
+
+    def _get_deadline(self) -> float | None:
+        """
+        Get the deadline of a request arriving now.
+
+        The deadline is always passed explicitly so that a session turn never
+        inherits the checkpointed deadline of an earlier turn.
+
+        Returns:
+            time.monotonic() timestamp, or None if deadlines are disabled
+        """
+        if self._request_deadline_seconds <= 0:
+            return None
+        return time.monotonic() + self._request_deadline_seconds
+
+    def _get_batch_key(self, question: str) -> str:
+        """
+        Get the key under which identical questions of a batch are merged.
+
+        Args:
+            question: Question asked by the user
+
+        Returns:
+            Normalized question when the answer cache is enabled, stripped
+            text otherwise
+        """
+        if self._answer_cache is not None:
+            return self._answer_cache.normalize_question(question)
+        return question.strip()
+
+    async def _generate_cached_server_sent_events(
+        self, cached_answer: str
+    ) -> AsyncIterator[str]:
+        """
+        Send a cached answer as Server-Sent Events frames.
+
+        Args:
+            cached_answer: Answer found in the answer cache
+
+        Yields:
+            Encoded token and done frames
+        """
+        yield self._format_server_sent_event(
+            StreamEventType.TOKEN, {"token": cached_answer}
+        )
+        yield self._format_server_sent_event(
+            StreamEventType.DONE, {"answer": cached_answer}
+        )
+
+    async def _generate_server_sent_events(
+        self,
+        initial_state: ConversationState,
+        answer_cache: AnswerCacheService | None,
+    ) -> AsyncIterator[str]:
+        """
+        Translate workflow stream events into Server-Sent Events frames.
+
+        Args:
+            initial_state: Starting state for the workflow execution
+            answer_cache: Answer cache receiving the final answer, if any
+
+        Yields:
+            Encoded Server-Sent Events frames
+        """
+        started_at = time.perf_counter()
+        try:
+            async for event_type, payload in self._graph_builder.stream_workflow(
+                initial_state
+            ):
+                if (
+                    event_type == StreamEventType.DONE
+                    and answer_cache is not None
+                    and payload.get("answer")
+                    and not payload.get("partial")
+                ):
+                    await answer_cache.set(
+                        initial_state.user_question,
+                        payload["answer"],
+                        payload.get("route"),
+                        time.perf_counter() - started_at,
+                    )
+                yield self._format_server_sent_event(event_type, payload)
+        except Exception as exc:
+            yield self._format_server_sent_event(
+                StreamEventType.ERROR, {"detail": str(exc) or type(exc).__name__}
+            )
+
+    @staticmethod
+    def _describe_batch_error(error: BaseException) -> str:
+        """
+        Map the failure of a batch question to a client-facing message.
+
+        Unexpected errors are logged and reported without their details,
+        like the 500 response of the single-question endpoint.
+
+        Args:
+            error: Exception raised while answering the question
+
+        Returns:
+            Fixed error message
+        """
+        if isinstance(error, AdmissionRejectedError):
+            return error.detail
+        if isinstance(error, TimeoutError):
+            return "Request deadline exceeded"
+        if isinstance(error, asyncio.CancelledError):
+            return "Request cancelled"
+
+        logger.error("Batch question failed", exc_info=error)
+        return "Internal server error"
+
+    @staticmethod
+    def _build_rejection_response(
+        rejection: AdmissionRejectedError,
+    ) -> HTTPException:
+        """
+        Build the HTTP error returned for a request that was not admitted.
+
+        Args:
+            rejection: Rejection raised by the admission controller
+
+        Returns:
+            HTTP exception carrying the status code and a Retry-After header
+        """
+        return HTTPException(
+            status_code=rejection.status_code,
+            detail=rejection.detail,
+            headers={"Retry-After": str(rejection.retry_after)},
+        )
+
+    @staticmethod
+    def _format_server_sent_event(
+        event_type: StreamEventType, payload: dict[str, Any]
+    ) -> str:
+        """
+        Encode a single Server-Sent Events frame.
+
+        Args:
+            event_type: Type of the event
+            payload: JSON-serializable event data
+
+        Returns:
+            Encoded frame terminated by a blank line
+        """
+        data = json.dumps(payload, ensure_ascii=False)
+        return f"event: {event_type.value}\ndata: {data}\n\n"
@@ -0,0 +1,48 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.services.metrics_service import MetricsService
+
+_PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsRouter:
+    """
+    API router exposing service metrics in Prometheus text format.
+
+    Serves the latency histograms, in-flight gauges, error counters and
+    token counts collected by the metrics service for scraping.
+    """
+
+    def __init__(self, metrics_service: MetricsService) -> None:
+        """
+        Initialize the metrics API router.
+
+        Args:
+            metrics_service: Service holding the collected metrics
+        """
+        self._api_router = APIRouter(tags=["Metrics"])
+        self._metrics_service = metrics_service
+
+    def get_configured_router(self) -> APIRouter:
+        """
+        Get the configured API router with registered endpoints.
+
+        Returns:
+            Configured FastAPI router
+        """
+        self._api_router.get("/metrics", response_class=PlainTextResponse)(
+            self.get_metrics
+        )
+        return self._api_router
+
+    async def get_metrics(self) -> PlainTextResponse:
+        """
+        Render all collected metrics.
+
+        Returns:
+            Prometheus text exposition of the metrics
+        """
+        return PlainTextResponse(
+            self._metrics_service.render(), media_type=_PROMETHEUS_CONTENT_TYPE
+        )
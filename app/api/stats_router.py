@@ -0,0 +1,48 @@
+from typing import Any, Callable
+
+from fastapi import APIRouter
+
+
+class StatsRouter:
+    """
+    API router exposing runtime statistics of the service components.
+
+    Collects counters from registered providers so operators can observe
+    how caches, classifiers and other fast paths behave under real traffic.
+    """
+
+    def __init__(
+        self, stats_providers: dict[str, Callable[[], dict[str, Any]]]
+    ) -> None:
+        """
+        Initialize the statistics API router.
+
+        Args:
+            stats_providers: Mapping of component names to callables returning stats
+        """
+        self._api_router = APIRouter(prefix="/api/v1", tags=["Stats"])
+        self._stats_providers = stats_providers
+
+    def get_configured_router(self) -> APIRouter:
+        """
+        Get the configured API router with registered endpoints.
+
+        Returns:
+            Configured FastAPI router
+        """
+        self._api_router.get("/stats")(self.get_stats)
+        return self._api_router
+
+    async def get_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Collect statistics from all registered providers.
+
+        Returns:
+            Structured response containing stats keyed by component name
+        """
+        return {
+            "data": {
+                component_name: stats_provider()
+                for component_name, stats_provider in self._stats_providers.items()
+            }
+        }
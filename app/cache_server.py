@@ -0,0 +1,48 @@
+from typing import Any
+
+from fastapi import FastAPI, HTTPException, Response
+from pydantic import BaseModel, Field
+
+from app.utils.cache_backend import MemoryCacheBackend
+
+
+class CacheEntryPayload(BaseModel):
+    """Value stored in the cache server together with its TTL."""
+
+    value: Any
+    ttl: float = Field(gt=0)
+
+
+def create_cache_server(max_entries: int = 100_000) -> FastAPI:
+    """
+    Build a minimal cache server for RemoteCacheBackend.
+
+    Stands in for a dedicated cache server in development and load tests:
+    ``uvicorn app.cache_server:create_cache_server --factory --port 8090``.
+
+    Args:
+        max_entries: Maximum number of entries kept in memory
+
+    Returns:
+        FastAPI application serving the cache protocol
+    """
+    cache_backend = MemoryCacheBackend(max_entries)
+    cache_server = FastAPI(title="Cache server")
+
+    @cache_server.get("/cache/{key:path}")
+    async def get_entry(key: str) -> dict[str, Any]:
+        value = await cache_backend.get(key)
+        if value is None:
+            raise HTTPException(status_code=404)
+        return {"value": value}
+
+    @cache_server.put("/cache/{key:path}", status_code=204)
+    async def set_entry(key: str, payload: CacheEntryPayload) -> Response:
+        await cache_backend.set(key, payload.value, payload.ttl)
+        return Response(status_code=204)
+
+    @cache_server.get("/stats")
+    async def get_stats() -> dict[str, dict[str, Any]]:
+        return {"data": cache_backend.get_stats()}
+
+    return cache_server
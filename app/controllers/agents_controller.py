@@ -1,10 +1,28 @@
+import asyncio
+import random
+import time
+import uuid
+from typing import Any, Awaitable, Callable
+
 from langgraph.types import Command
 
-from app.domain.models.conversation_state import ConversationState
+from app.domain.enums import WorkflowRouteDecision
+from app.domain.models.conversation_state import (
+    DEADLINE_NOTICE_NAME,
+    ConversationState,
+)
 from app.agents.football_data_agent import FootballDataAgent
 from app.agents.web_search_agent import WebSearchAgent
 from app.agents.conversation_response_agent import ConversationResponseAgent
 from app.agents.supervisor_agent import SupervisorAgent
+from app.services.route_classifier_service import RouteClassifierService
+from app.services.session_memory_service import SessionMemoryService
+from app.utils.speculative_executor import SpeculativeExecutor
+
+_BRANCH_LABELS = {
+    WorkflowRouteDecision.FOOTBALL_DATA: "football API",
+    WorkflowRouteDecision.WEB_SEARCH: "web search",
+}
 
 
 class AgentsController:
@@ -21,6 +39,11 @@ class AgentsController:
         football_agent: FootballDataAgent,
         web_search_agent: WebSearchAgent,
         conversation_agent: ConversationResponseAgent,
+        route_classifier: RouteClassifierService | None = None,
+        speculative_execution_ratio: float = 0.0,
+        speculative_prior_threshold: float = 0.3,
+        session_memory: SessionMemoryService | None = None,
+        answer_reserve_seconds: float = 0.0,
     ) -> None:
         """
         Initialize the agent execution controller.
@@ -30,11 +53,29 @@ class AgentsController:
             football_agent: Agent for football data operations
             web_search_agent: Agent for web search operations
             conversation_agent: Agent for generating responses
+            route_classifier: Local classifier providing the prior for speculation
+            speculative_execution_ratio: Fraction of requests whose data agents
+                start concurrently with the routing call
+            speculative_prior_threshold: Minimum prior probability for a data
+                agent to be started speculatively
+            session_memory: Optional memory of multi-turn sessions
+            answer_reserve_seconds: Part of the request deadline kept free for
+                answer generation; data agents must finish before it starts
         """
         self._supervisor_agent = supervisor_agent
         self._football_data_agent = football_agent
         self._web_search_agent = web_search_agent
         self._conversation_response_agent = conversation_agent
+        self._route_classifier = route_classifier
+        self._speculative_execution_ratio = speculative_execution_ratio
+        self._speculative_prior_threshold = speculative_prior_threshold
+        self._speculative_executor = SpeculativeExecutor()
+        self._session_memory = session_memory
+        self._answer_reserve_seconds = answer_reserve_seconds
+        self._missed_branches = {
+            WorkflowRouteDecision.FOOTBALL_DATA.value: 0,
+            WorkflowRouteDecision.WEB_SEARCH.value: 0,
+        }
 
     async def get_routing_decision(
         self, conversation_state: ConversationState
@@ -42,15 +83,68 @@ class AgentsController:
         """
         Route request to the appropriate agent.
 
+        Follow-up questions of a session are answered from the context of
+        earlier turns without routing, unless they ask for fresh data; those
+        are routed with the session's team or league in place of the pronoun.
+        In speculative mode the data agents the
+        local prior considers likely are started before the routing decision
+        is known; unselected ones are cancelled once it arrives.
+
         Args:
             conversation_state: Current state of the conversation
 
         Returns:
             Command directing to the appropriate next agent
         """
-        return await self._supervisor_agent.determine_routing_decision(
-            conversation_state
-        )
+        routing_update: dict[str, Any] = {}
+        session_memory = self._session_memory
+        if session_memory is not None and conversation_state.session_id is not None:
+            if session_context := session_memory.get_reusable_context(
+                conversation_state
+            ):
+                route_decision = conversation_state.session_route_decision
+                return Command(
+                    goto="conversational_agent",
+                    update={
+                        "current_route_decision": route_decision,
+                        "retrieved_context": session_context,
+                        "speculative_execution": False,
+                    },
+                )
+            if resolved_question := session_memory.resolve_follow_up(
+                conversation_state
+            ):
+                conversation_state = conversation_state.model_copy(
+                    update={"user_question": resolved_question}
+                )
+                routing_update["user_question"] = resolved_question
+
+        speculative_execution = self._should_speculate()
+        if speculative_execution:
+            self._launch_speculative_branches(conversation_state)
+
+        try:
+            async with asyncio.timeout(self._get_remaining_budget(conversation_state)):
+                command = await self._supervisor_agent.determine_routing_decision(
+                    conversation_state
+                )
+        except BaseException:
+            self._speculative_executor.cancel_unselected(
+                conversation_state.request_id, set()
+            )
+            raise
+
+        if speculative_execution:
+            selected_branches = (
+                set(command.goto) if isinstance(command.goto, list) else {command.goto}
+            )
+            self._speculative_executor.cancel_unselected(
+                conversation_state.request_id, selected_branches
+            )
+
+        command.update["speculative_execution"] = speculative_execution
+        command.update.update(routing_update)
+        return command
 
     async def search_web(self, conversation_state: ConversationState) -> Command:
         """
@@ -60,9 +154,13 @@ class AgentsController:
             conversation_state: Current state of the conversation
 
         Returns:
-            Command with search results
+            Command with search results, or a notice if the deadline was missed
         """
-        return await self._web_search_agent.search_web_content(conversation_state)
+        return await self._run_data_branch(
+            conversation_state,
+            WorkflowRouteDecision.WEB_SEARCH,
+            self._web_search_agent.search_web_content,
+        )
 
     async def fetch_football_data(
         self, conversation_state: ConversationState
@@ -74,22 +172,174 @@ class AgentsController:
             conversation_state: Current state of the conversation
 
         Returns:
-            Command with football data results
+            Command with football data results, or a notice if the deadline was missed
         """
-        return await self._football_data_agent.process_football_query(
-            conversation_state
+        return await self._run_data_branch(
+            conversation_state,
+            WorkflowRouteDecision.FOOTBALL_DATA,
+            self._football_data_agent.process_football_query,
         )
 
     async def generate_response(self, conversation_state: ConversationState) -> Command:
         """
         Generate conversation response.
 
+        Turns of a session are folded into the session memory.
+
         Args:
             conversation_state: Current state of the conversation
 
         Returns:
             Command with the final response
         """
-        return await self._conversation_response_agent.generate_response(
-            conversation_state
+        async with asyncio.timeout(self._get_remaining_budget(conversation_state)):
+            command = await self._conversation_response_agent.generate_response(
+                conversation_state
+            )
+        if self._session_memory is not None and conversation_state.session_id:
+            command.update.update(
+                self._session_memory.record_turn(
+                    conversation_state, command.update.get("final_answer")
+                )
+            )
+        return command
+
+    def get_speculation_stats(self) -> dict[str, Any]:
+        """
+        Get statistics of speculatively executed data agents.
+
+        Returns:
+            Launched, claimed and cancelled branch counts and wasted time
+        """
+        return {
+            "ratio": self._speculative_execution_ratio,
+            **self._speculative_executor.get_stats(),
+        }
+
+    def get_deadline_stats(self) -> dict[str, Any]:
+        """
+        Get statistics of data agents cut off by the request deadline.
+
+        Returns:
+            Answer reserve and number of missed deadlines per data agent
+        """
+        return {
+            "answer_reserve_seconds": self._answer_reserve_seconds,
+            "missed_branches": dict(self._missed_branches),
+        }
+
+    async def _run_data_branch(
+        self,
+        conversation_state: ConversationState,
+        branch: WorkflowRouteDecision,
+        agent_operation: Callable[[ConversationState], Awaitable[Command]],
+    ) -> Command:
+        """
+        Run a data agent, or claim its speculative run, within the request deadline.
+
+        A data agent that does not finish before the answer reserve starts is
+        cancelled and replaced by a notice, so the response agent answers from
+        whatever context the other branch delivered instead of failing.
+
+        Args:
+            conversation_state: Current state of the conversation
+            branch: Route the data agent serves
+            agent_operation: Agent method producing the branch result
+
+        Returns:
+            Command with the branch results or the missed-deadline notice
+        """
+        remaining_budget = self._get_remaining_budget(conversation_state)
+        speculative_task = self._speculative_executor.claim(
+            conversation_state.request_id, branch.value
+        )
+        try:
+            async with asyncio.timeout(
+                remaining_budget - self._answer_reserve_seconds
+                if remaining_budget is not None
+                else None
+            ):
+                if speculative_task is not None:
+                    return await speculative_task
+                return await agent_operation(conversation_state)
+        except TimeoutError:
+            self._missed_branches[branch.value] += 1
+            return Command(
+                goto="conversational_agent",
+                update={
+                    "partial": True,
+                    "retrieved_context": [
+                        {
+                            "role": "tool",
+                            "name": DEADLINE_NOTICE_NAME,
+                            "content": (
+                                f"The {_BRANCH_LABELS[branch]} lookup did not finish "
+                                "in time; answer from the remaining context."
+                            ),
+                            "tool_call_id": str(uuid.uuid4()),
+                        }
+                    ],
+                },
+            )
+
+    @staticmethod
+    def _get_remaining_budget(conversation_state: ConversationState) -> float | None:
+        """
+        Get the time left until the request deadline.
+
+        Args:
+            conversation_state: Current state of the conversation
+
+        Returns:
+            Remaining seconds, or None if the request has no deadline
+        """
+        if conversation_state.deadline is None:
+            return None
+        return conversation_state.deadline - time.monotonic()
+
+    def _should_speculate(self) -> bool:
+        """
+        Decide whether the current request runs in speculative mode.
+
+        Returns:
+            True if data agents should start concurrently with routing
+        """
+        return (
+            self._route_classifier is not None
+            and random.random() < self._speculative_execution_ratio
         )
+
+    def _launch_speculative_branches(
+        self, conversation_state: ConversationState
+    ) -> None:
+        """
+        Start the data agents the local prior considers likely.
+
+        Nothing is launched when the classifier is confident enough to decide
+        locally, since routing then costs no LLM round-trip to hide.
+
+        Args:
+            conversation_state: Current state of the conversation
+        """
+        prediction = self._route_classifier.predict(conversation_state.user_question)
+        if prediction.confidence >= self._route_classifier.confidence_threshold:
+            return
+
+        combined_probability = prediction.probabilities[
+            WorkflowRouteDecision.COMBINED_APPROACH
+        ]
+        branch_operations = {
+            WorkflowRouteDecision.FOOTBALL_DATA: (
+                self._football_data_agent.process_football_query
+            ),
+            WorkflowRouteDecision.WEB_SEARCH: self._web_search_agent.search_web_content,
+        }
+
+        for branch, agent_operation in branch_operations.items():
+            prior = prediction.probabilities[branch] + combined_probability
+            if prior >= self._speculative_prior_threshold:
+                self._speculative_executor.launch(
+                    conversation_state.request_id,
+                    branch.value,
+                    lambda operation=agent_operation: operation(conversation_state),
+                )
@@ -1,4 +1,11 @@
 from app.core.graph_builder import GraphBuilder
 from app.core.azure_openai_client import AzureOpenAIClient
+from app.core.http_pool_manager import HttpPoolManager
+from app.core.sqlite_checkpoint_saver import SQLiteCheckpointSaver
 
-__all__ = ["GraphBuilder", "AzureOpenAIClient"]
+__all__ = [
+    "GraphBuilder",
+    "AzureOpenAIClient",
+    "HttpPoolManager",
+    "SQLiteCheckpointSaver",
+]
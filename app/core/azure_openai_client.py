@@ -1,38 +1,121 @@
-from langchain_openai import AzureChatOpenAI
+from dataclasses import dataclass
+
+from httpx import AsyncClient
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models import BaseChatModel
+from app.domain.enums import LLMProfile
 from app.services.config_service import AppConfig
 
 
+@dataclass(frozen=True)
+class LLMProfileSettings:
+    """Deployment, output limit, sampling and retry settings of an LLM profile."""
+
+    deployment: str
+    max_tokens: int
+    temperature: float
+    timeout_seconds: float
+    max_retries: int
+
+
 class AzureOpenAIClient:
     """
     Client for Azure OpenAI services integration.
 
-    Provides a configured Azure OpenAI client instance for
-    language model operations throughout the application.
+    Provides one configured Azure OpenAI client instance per LLM profile,
+    so that every agent calls the model with the deployment and settings
+    suited to its task.
     """
 
-    def __init__(self, app_config: AppConfig):
+    def __init__(
+        self,
+        app_config: AppConfig,
+        llm_instance: BaseChatModel | None = None,
+        callbacks: list[BaseCallbackHandler] | None = None,
+        http_async_client: AsyncClient | None = None,
+    ):
         """
         Initialize the Azure OpenAI client.
 
         Args:
             app_config: Application configuration containing Azure OpenAI settings
+            llm_instance: Optional chat model used for all profiles instead of Azure OpenAI
+            callbacks: Callback handlers attached to the Azure OpenAI models
+            http_async_client: Pooled HTTP client used for asynchronous Azure OpenAI calls
         """
-        self._llm_instance = AzureChatOpenAI(
-            azure_deployment=app_config.AZURE_OPENAI_LLM_DEPLOYMENT,
-            azure_endpoint=app_config.AZURE_OPENAI_ENDPOINT,
-            api_version=app_config.AZURE_OPENAI_API_VERSION,
-            api_key=app_config.AZURE_OPENAI_KEY,
-            temperature=app_config.TEMPERATURE,
-            top_p=app_config.TOP_P,
-            max_tokens=app_config.MAX_NEW_TOKENS,
-        )
-
-    @property
-    def get_llm_instance(self) -> AzureChatOpenAI:
+        self._profile_settings = self._get_profile_settings(app_config)
+
+        if llm_instance is not None:
+            self._llm_instances = {profile: llm_instance for profile in LLMProfile}
+            return
+
+        from langchain_openai import AzureChatOpenAI
+
+        self._llm_instances = {
+            profile: AzureChatOpenAI(
+                azure_deployment=settings.deployment,
+                azure_endpoint=app_config.AZURE_OPENAI_ENDPOINT,
+                api_version=app_config.AZURE_OPENAI_API_VERSION,
+                api_key=app_config.AZURE_OPENAI_KEY,
+                temperature=settings.temperature,
+                top_p=app_config.TOP_P,
+                max_tokens=settings.max_tokens,
+                timeout=settings.timeout_seconds,
+                max_retries=settings.max_retries,
+                callbacks=callbacks,
+                http_async_client=http_async_client,
+            )
+            for profile, settings in self._profile_settings.items()
+        }
+
+    def get_llm(self, profile: LLMProfile) -> BaseChatModel:
         """
-        Get the configured Azure OpenAI LLM instance.
+        Get the configured Azure OpenAI LLM instance of a profile.
+
+        Args:
+            profile: Profile of the calling agent
 
         Returns:
             Configured AzureChatOpenAI instance
         """
-        return self._llm_instance
+        return self._llm_instances[profile]
+
+    @staticmethod
+    def _get_profile_settings(
+        app_config: AppConfig,
+    ) -> dict[LLMProfile, LLMProfileSettings]:
+        """
+        Resolve the settings of every LLM profile from the configuration.
+
+        Profiles without their own deployment use the default deployment.
+
+        Args:
+            app_config: Application configuration containing the profile settings
+
+        Returns:
+            Settings keyed by profile
+        """
+        default_deployment = app_config.AZURE_OPENAI_LLM_DEPLOYMENT
+        return {
+            LLMProfile.ROUTING: LLMProfileSettings(
+                app_config.ROUTING_LLM_DEPLOYMENT or default_deployment,
+                app_config.ROUTING_LLM_MAX_TOKENS,
+                app_config.ROUTING_LLM_TEMPERATURE,
+                app_config.ROUTING_LLM_TIMEOUT_SECONDS,
+                app_config.ROUTING_LLM_MAX_RETRIES,
+            ),
+            LLMProfile.TOOL_PLANNING: LLMProfileSettings(
+                app_config.TOOL_PLANNING_LLM_DEPLOYMENT or default_deployment,
+                app_config.TOOL_PLANNING_LLM_MAX_TOKENS,
+                app_config.TOOL_PLANNING_LLM_TEMPERATURE,
+                app_config.TOOL_PLANNING_LLM_TIMEOUT_SECONDS,
+                app_config.TOOL_PLANNING_LLM_MAX_RETRIES,
+            ),
+            LLMProfile.ANSWER: LLMProfileSettings(
+                default_deployment,
+                app_config.MAX_NEW_TOKENS,
+                app_config.TEMPERATURE,
+                app_config.LLM_TIMEOUT_SECONDS,
+                app_config.LLM_MAX_RETRIES,
+            ),
+        }
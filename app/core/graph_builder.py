@@ -1,9 +1,27 @@
-from IPython.core.display import Image
-from IPython.core.display_functions import display
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import StateGraph, START, END
+from langgraph.graph.state import CompiledStateGraph
+from langgraph.types import Command
 
+from app.domain.enums import StreamEventType, WorkflowProgressStage
 from app.domain.models.conversation_state import ConversationState
 from app.controllers.agents_controller import AgentsController
+from app.services.metrics_service import MetricsService
+from app.utils.latency_tracker import LatencyTracker
+
+
+_NODE_PROGRESS_STAGES: dict[str, WorkflowProgressStage] = {
+    "supervisor": WorkflowProgressStage.ROUTE_DECIDED,
+    "fotmob_agent": WorkflowProgressStage.FOOTBALL_DATA_FETCHED,
+    "search_agent": WorkflowProgressStage.WEB_RESULTS_FETCHED,
+    "conversational_agent": WorkflowProgressStage.ANSWER_GENERATED,
+}
+
+_ANSWER_NODE = "conversational_agent"
 
 
 class GraphBuilder:
@@ -14,17 +32,32 @@ class GraphBuilder:
     different agents and processing steps in the chat system.
     """
 
-    def __init__(self, agents_controller: AgentsController) -> None:
+    def __init__(
+        self,
+        agents_controller: AgentsController,
+        metrics_service: MetricsService | None = None,
+        checkpointer: BaseCheckpointSaver | None = None,
+    ) -> None:
         """
         Initialize the workflow orchestrator.
 
         Args:
             agents_controller: Controller for managing workflow operations
+            metrics_service: Metrics service recording node executions
+            checkpointer: Optional checkpointer persisting the state of sessions
         """
         self._agents_controller = agents_controller
+        self._metrics_service = metrics_service or MetricsService()
+        self._latency_by_node: dict[str, LatencyTracker] = {}
         self._state_graph = StateGraph(ConversationState)
         self._build_workflow_graph()
-        self._compiled_workflow = self._state_graph.compile()
+        self._checkpointer = checkpointer
+        self._compiled_workflow: CompiledStateGraph | None = None
+        self._compiled_session_workflow: CompiledStateGraph | None = None
+        self._latency_by_execution_mode = {
+            "sequential": LatencyTracker(),
+            "speculative": LatencyTracker(),
+        }
 
     def visualize_workflow(self, *, enable_xray: bool = False):
         """
@@ -36,8 +69,54 @@ class GraphBuilder:
         Returns:
             PNG image of the workflow diagram
         """
+        from IPython.core.display import Image
+        from IPython.core.display_functions import display
+
         return display(Image(self._state_graph.get_graph(xray=True).draw_mermaid_png()))
 
+    def compile_workflow(self) -> CompiledStateGraph:
+        """
+        Compile the workflow graph unless it was compiled already.
+
+        Called once from the application lifespan so the first request does
+        not pay for compilation. With a checkpointer, a second copy is
+        compiled for requests that belong to a session.
+
+        Returns:
+            Compiled workflow without checkpointing
+        """
+        if self._compiled_workflow is None:
+            self._compiled_workflow = self._state_graph.compile()
+        if self._checkpointer is not None and self._compiled_session_workflow is None:
+            self._compiled_session_workflow = self._state_graph.compile(
+                checkpointer=self._checkpointer
+            )
+        return self._compiled_workflow
+
+    def _select_workflow(
+        self, initial_state: ConversationState
+    ) -> tuple[CompiledStateGraph, RunnableConfig | None]:
+        """
+        Select the compiled workflow and run config for a request.
+
+        Requests of a session run on the checkpointed workflow, in the thread of
+        the session, and only checkpoint the final state of each turn.
+        Requests without a session skip checkpointing entirely.
+
+        Args:
+            initial_state: Starting state for the workflow execution
+
+        Returns:
+            Compiled workflow and its run config
+        """
+        compiled_workflow = self.compile_workflow()
+        if initial_state.session_id is None or self._compiled_session_workflow is None:
+            return compiled_workflow, None
+
+        return self._compiled_session_workflow, {
+            "configurable": {"thread_id": initial_state.session_id}
+        }
+
     def _build_workflow_graph(self) -> StateGraph:
         """
         Build the internal workflow graph structure.
@@ -46,16 +125,16 @@ class GraphBuilder:
             Configured StateGraph instance
         """
 
-        self._state_graph.add_node(
-            "supervisor", self._agents_controller.get_routing_decision
-        )
-        self._state_graph.add_node("search_agent", self._agents_controller.search_web)
-        self._state_graph.add_node(
-            "fotmob_agent", self._agents_controller.fetch_football_data
-        )
-        self._state_graph.add_node(
-            "conversational_agent", self._agents_controller.generate_response
-        )
+        node_actions = {
+            "supervisor": self._agents_controller.get_routing_decision,
+            "search_agent": self._agents_controller.search_web,
+            "fotmob_agent": self._agents_controller.fetch_football_data,
+            "conversational_agent": self._agents_controller.generate_response,
+        }
+        for node_name, node_action in node_actions.items():
+            self._state_graph.add_node(
+                node_name, self._with_node_timing(node_name, node_action)
+            )
 
         self._state_graph.add_edge(START, "supervisor")
         self._state_graph.add_edge("conversational_agent", END)
@@ -72,4 +151,142 @@ class GraphBuilder:
         Returns:
             Final state after workflow completion
         """
-        return await self._compiled_workflow.ainvoke(initial_state)
+        started_at = time.perf_counter()
+        compiled_workflow, run_config = self._select_workflow(initial_state)
+        final_result = await compiled_workflow.ainvoke(
+            initial_state, run_config, checkpoint_during=False
+        )
+        self._record_latency(
+            final_result.get("speculative_execution"), time.perf_counter() - started_at
+        )
+        return final_result
+
+    async def stream_workflow(
+        self, initial_state: ConversationState
+    ) -> AsyncIterator[tuple[StreamEventType, dict[str, Any]]]:
+        """
+        Execute the workflow in streaming mode.
+
+        Emits a progress event whenever a node finishes and a token event for
+        every chunk the LLM produces inside the answer-generating node.
+        Answers produced without the LLM are sent as a single token event.
+        The stream ends with a done event carrying the full final answer, the
+        route that produced it and whether a data agent missed the deadline.
+
+        Args:
+            initial_state: Starting state for the workflow execution
+
+        Yields:
+            Tuples of event type and event payload
+        """
+        final_answer = None
+        answer_streamed = False
+        route_decision = None
+        speculative_execution = None
+        partial = False
+        started_at = time.perf_counter()
+
+        compiled_workflow, run_config = self._select_workflow(initial_state)
+        async for stream_mode, chunk in compiled_workflow.astream(
+            initial_state,
+            run_config,
+            stream_mode=["updates", "messages"],
+            checkpoint_during=False,
+        ):
+            if stream_mode == "messages":
+                message_chunk, metadata = chunk
+                if metadata.get("langgraph_node") == _ANSWER_NODE and (
+                    token := message_chunk.content
+                ):
+                    answer_streamed = True
+                    yield StreamEventType.TOKEN, {"token": token}
+                continue
+
+            for node_name, node_update in chunk.items():
+                if node_update and node_update.get("partial"):
+                    partial = True
+                stage = _NODE_PROGRESS_STAGES.get(node_name)
+                if stage is None:
+                    continue
+
+                payload: dict[str, Any] = {"stage": stage.value}
+                if stage == WorkflowProgressStage.ROUTE_DECIDED and node_update:
+                    route_decision = node_update.get("current_route_decision")
+                    speculative_execution = node_update.get("speculative_execution")
+                    payload["route"] = route_decision
+                if stage == WorkflowProgressStage.ANSWER_GENERATED and node_update:
+                    final_answer = node_update.get("final_answer")
+                    if final_answer and not answer_streamed:
+                        yield StreamEventType.TOKEN, {"token": final_answer}
+
+                yield StreamEventType.PROGRESS, payload
+
+        self._record_latency(speculative_execution, time.perf_counter() - started_at)
+        yield (
+            StreamEventType.DONE,
+            {"answer": final_answer, "route": route_decision, "partial": partial},
+        )
+
+    def get_latency_stats(self) -> dict[str, Any]:
+        """
+        Get end-to-end workflow latency per execution mode.
+
+        Returns:
+            Latency summaries for sequential and speculative executions
+        """
+        return {
+            execution_mode: latency_tracker.get_stats()
+            for execution_mode, latency_tracker in self._latency_by_execution_mode.items()
+        }
+
+    def get_node_latency_stats(self) -> dict[str, Any]:
+        """
+        Get the time spent in each workflow node.
+
+        Returns:
+            Latency summaries keyed by node name
+        """
+        return {
+            node_name: latency_tracker.get_stats()
+            for node_name, latency_tracker in self._latency_by_node.items()
+        }
+
+    def _with_node_timing(
+        self,
+        node_name: str,
+        node_action: Callable[[ConversationState], Awaitable[Command]],
+    ) -> Callable[[ConversationState], Awaitable[Command]]:
+        """
+        Wrap a node action so its execution time and errors are recorded.
+
+        Args:
+            node_name: Name of the workflow node
+            node_action: Controller method executed by the node
+
+        Returns:
+            Node action recording its latency under the node name
+        """
+        latency_tracker = self._latency_by_node.setdefault(node_name, LatencyTracker())
+
+        async def run_node(conversation_state: ConversationState) -> Command:
+            started_at = time.perf_counter()
+            try:
+                with self._metrics_service.track_node(node_name):
+                    return await node_action(conversation_state)
+            finally:
+                latency_tracker.record(time.perf_counter() - started_at)
+
+        return run_node
+
+    def _record_latency(
+        self, speculative_execution: bool | None, latency_seconds: float
+    ) -> None:
+        """
+        Record the latency of a finished workflow under its execution mode.
+
+        Args:
+            speculative_execution: Whether data agents ran speculatively
+            latency_seconds: End-to-end workflow latency
+        """
+        execution_mode = "speculative" if speculative_execution else "sequential"
+        self._latency_by_execution_mode[execution_mode].record(latency_seconds)
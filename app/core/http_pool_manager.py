@@ -0,0 +1,306 @@
+import asyncio
+import ssl
+from typing import Any, AsyncIterator, Callable
+
+import httpx
+
+from app.services.config_service import AppConfig
+
+_TCP_CONNECT_EVENT = "connection.connect_tcp.complete"
+_TLS_HANDSHAKE_EVENT = "connection.start_tls.complete"
+_SEND_REQUEST_HEADERS_EVENTS = frozenset(
+    {"http11.send_request_headers.started", "http2.send_request_headers.started"}
+)
+
+
+class _ClientUsage:
+    """Per-client counters collected by the tracking transport."""
+
+    __slots__ = (
+        "requests",
+        "open_requests",
+        "queued_requests",
+        "connections_opened",
+        "tls_handshakes",
+    )
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.open_requests = 0
+        self.queued_requests = 0
+        self.connections_opened = 0
+        self.tls_handshakes = 0
+
+
+class _ClosingByteStream(httpx.AsyncByteStream):
+    """Response body stream that runs a callback once when closed."""
+
+    def __init__(
+        self, byte_stream: httpx.AsyncByteStream, on_close: Callable[[], None]
+    ) -> None:
+        self._byte_stream = byte_stream
+        self._on_close = on_close
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._byte_stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._byte_stream.aclose()
+        finally:
+            if not self._closed:
+                self._closed = True
+                self._on_close()
+
+
+class _TrackingTransport(httpx.AsyncBaseTransport):
+    """
+    Transport counting the requests and connections of one upstream.
+
+    A request is open until its response body is closed and counts as
+    queued until it starts sending its headers, i.e. while it waits for a
+    pooled or new connection. New connections and TLS handshakes are counted
+    from the trace events of the connection pool.
+    """
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, client_usage: _ClientUsage
+    ) -> None:
+        self._transport = transport
+        self._client_usage = client_usage
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        client_usage = self._client_usage
+        queued = True
+
+        def leave_queue() -> None:
+            nonlocal queued
+            if queued:
+                queued = False
+                client_usage.queued_requests -= 1
+
+        async def trace(event_name: str, _: dict[str, Any]) -> None:
+            if event_name in _SEND_REQUEST_HEADERS_EVENTS:
+                leave_queue()
+            elif event_name == _TCP_CONNECT_EVENT:
+                client_usage.connections_opened += 1
+            elif event_name == _TLS_HANDSHAKE_EVENT:
+                client_usage.tls_handshakes += 1
+
+        def finish_request() -> None:
+            client_usage.open_requests -= 1
+
+        request.extensions["trace"] = trace
+        client_usage.requests += 1
+        client_usage.open_requests += 1
+        client_usage.queued_requests += 1
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            finish_request()
+            raise
+        finally:
+            leave_queue()
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ClosingByteStream(response.stream, finish_request),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _ConcurrencyLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Transport bounding the requests in flight to one upstream.
+
+    Requests above the limit wait for a slot; a slot is held until the
+    response body is closed, so streamed LLM responses count while they run.
+    Unlike the connection pool limit this also bounds HTTP/2 streams
+    multiplexed over a single connection.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limit: int) -> None:
+        self._transport = transport
+        self._limit = limit
+        self._semaphore = asyncio.Semaphore(limit)
+        self._in_flight = 0
+        self._waiting = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        self._in_flight += 1
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self._release()
+            raise
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ClosingByteStream(response.stream, self._release),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get concurrency statistics of the upstream.
+
+        Returns:
+            Concurrency limit, requests in flight and requests waiting for a slot
+        """
+        return {
+            "concurrency_limit": self._limit,
+            "requests_in_flight": self._in_flight,
+            "requests_waiting": self._waiting,
+        }
+
+    def _release(self) -> None:
+        """Release the concurrency slot of a finished request."""
+        self._in_flight -= 1
+        self._semaphore.release()
+
+
+class HttpPoolManager:
+    """
+    Owner of the shared, tuned HTTP connection pools of the service.
+
+    Hands out one long-lived httpx AsyncClient per upstream with explicit
+    pool limits and keep-alive expiry, a shared TLS context and, unless
+    disabled, HTTP/2 through the h2 package of the httpx[http2] extra.
+    Upstreams with a configured concurrency limit additionally get a
+    semaphore bounding their requests in flight. The application lifespan
+    closes all clients on shutdown.
+    """
+
+    def __init__(self, app_config: AppConfig) -> None:
+        """
+        Initialize the pool manager.
+
+        Args:
+            app_config: Application configuration containing pool settings
+        """
+        self._max_connections = app_config.HTTP_MAX_CONNECTIONS
+        self._max_keepalive_connections = app_config.HTTP_MAX_KEEPALIVE_CONNECTIONS
+        self._keepalive_expiry = app_config.HTTP_KEEPALIVE_EXPIRY_SECONDS
+        self._connect_timeout = app_config.HTTP_CONNECT_TIMEOUT_SECONDS
+        self._pool_timeout = app_config.HTTP_POOL_TIMEOUT_SECONDS
+        self._http2_enabled = app_config.HTTP2_ENABLED
+
+        self._concurrency_limits = {
+            name.strip(): int(limit)
+            for name, _, limit in (
+                entry.partition("=")
+                for entry in app_config.UPSTREAM_CONCURRENCY_LIMITS.split(",")
+                if entry.strip()
+            )
+        }
+
+        self._ssl_context: ssl.SSLContext | None = None
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._limited_transports: dict[str, _ConcurrencyLimitedTransport] = {}
+        self._client_usage: dict[str, _ClientUsage] = {}
+
+    def get_client(self, name: str, read_timeout: float) -> httpx.AsyncClient:
+        """
+        Get the pooled client of an upstream, creating it on first use.
+
+        Args:
+            name: Upstream name, e.g. "thesportsdb"
+            read_timeout: Read and write timeout for requests of this upstream
+
+        Returns:
+            Shared AsyncClient of the upstream
+        """
+        client = self._clients.get(name)
+        if client is not None:
+            return client
+
+        if self._ssl_context is None:
+            self._ssl_context = httpx.create_ssl_context()
+
+        client_usage = self._client_usage[name] = _ClientUsage()
+        transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+            verify=self._ssl_context,
+            http2=self._http2_enabled,
+            limits=httpx.Limits(
+                max_connections=self._max_connections,
+                max_keepalive_connections=self._max_keepalive_connections,
+                keepalive_expiry=self._keepalive_expiry,
+            ),
+        )
+        transport = _TrackingTransport(transport, client_usage)
+        if name in self._concurrency_limits:
+            transport = self._limited_transports[name] = _ConcurrencyLimitedTransport(
+                transport, self._concurrency_limits[name]
+            )
+
+        client = self._clients[name] = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(
+                read_timeout, connect=self._connect_timeout, pool=self._pool_timeout
+            ),
+        )
+        return client
+
+    async def aclose(self) -> None:
+        """Close all clients and their pooled connections."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        self._limited_transports.clear()
+        for client in clients:
+            await client.aclose()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get connection pool statistics per upstream.
+
+        Returns:
+            Pool occupancy, queued requests, saturation and connection reuse counters
+        """
+        return {
+            "http2": self._http2_enabled,
+            "max_connections": self._max_connections,
+            "pools": {name: self._get_pool_stats(name) for name in self._clients},
+        }
+
+    def _get_pool_stats(self, name: str) -> dict[str, Any]:
+        """
+        Summarize the connection pool usage of one upstream.
+
+        Args:
+            name: Upstream name
+
+        Returns:
+            Active and queued requests, reuse counters and concurrency limits
+        """
+        client_usage = self._client_usage[name]
+        active_requests = client_usage.open_requests - client_usage.queued_requests
+        limited_transport = self._limited_transports.get(name)
+        return {
+            "active_requests": active_requests,
+            "queued_requests": client_usage.queued_requests,
+            "saturation": active_requests / self._max_connections,
+            "requests": client_usage.requests,
+            "connections_opened": client_usage.connections_opened,
+            "tls_handshakes": client_usage.tls_handshakes,
+            "connection_reuse_ratio": 1
+            - client_usage.connections_opened / client_usage.requests
+            if client_usage.requests
+            else 0.0,
+            **(limited_transport.get_stats() if limited_transport is not None else {}),
+        }
@@ -0,0 +1,115 @@
+import importlib.util
+import math
+import os
+from pathlib import Path
+
+from uvicorn.workers import UvicornWorker
+
+from app.domain.enums import ServerRuntimeProfile
+from app.services.config_service import AppConfig
+
+_CGROUP_V2_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+_CGROUP_V1_CPU_QUOTA = Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us")
+_CGROUP_V1_CPU_PERIOD = Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+
+
+class PerformanceUvicornWorker(UvicornWorker):
+    """
+    Gunicorn worker serving the app with uvloop and httptools.
+
+    Each falls back to the stock implementation when it is not installed.
+    Per-request access logging is turned off; request metrics are recorded
+    by the metrics service instead.
+    """
+
+    CONFIG_KWARGS = {
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "h11",
+        "lifespan": "on",
+        "access_log": False,
+    }
+
+
+def get_available_cpus() -> int:
+    """
+    Get the number of CPUs the process may use.
+
+    Takes the CPU affinity of the process and the CPU quota of its cgroup
+    into account, so a container limited to two cores reports two even on a
+    larger host.
+
+    Returns:
+        Available CPUs, at least one
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpu_count = len(os.sched_getaffinity(0))
+    else:
+        cpu_count = os.cpu_count() or 1
+
+    cpu_quota = _read_cgroup_cpu_quota()
+    if cpu_quota is not None:
+        cpu_count = min(cpu_count, math.ceil(cpu_quota))
+    return max(1, cpu_count)
+
+
+def get_worker_count(app_config: AppConfig) -> int:
+    """
+    Get the number of server worker processes.
+
+    Args:
+        app_config: Application configuration containing the server settings
+
+    Returns:
+        Configured worker count, or one worker per available CPU in the
+        performance profile and a single worker otherwise
+    """
+    if app_config.SERVER_WORKERS > 0:
+        return app_config.SERVER_WORKERS
+    if (
+        ServerRuntimeProfile(app_config.SERVER_RUNTIME_PROFILE)
+        == ServerRuntimeProfile.PERFORMANCE
+    ):
+        return get_available_cpus()
+    return 1
+
+
+def get_worker_class(app_config: AppConfig) -> str:
+    """
+    Get the Gunicorn worker class of the runtime profile.
+
+    Args:
+        app_config: Application configuration containing the server settings
+
+    Returns:
+        Import path of the worker class
+    """
+    if (
+        ServerRuntimeProfile(app_config.SERVER_RUNTIME_PROFILE)
+        == ServerRuntimeProfile.PERFORMANCE
+    ):
+        return "app.core.server_runtime.PerformanceUvicornWorker"
+    return "uvicorn.workers.UvicornWorker"
+
+
+def _read_cgroup_cpu_quota() -> float | None:
+    """
+    Read the CPU quota of the process's cgroup.
+
+    Returns:
+        Quota in CPUs, or None if no quota is set or cgroups are unavailable
+    """
+    try:
+        if _CGROUP_V2_CPU_MAX.exists():
+            quota, period = _CGROUP_V2_CPU_MAX.read_text().split()[:2]
+            if quota == "max":
+                return None
+            return int(quota) / int(period)
+
+        if _CGROUP_V1_CPU_QUOTA.exists():
+            quota = int(_CGROUP_V1_CPU_QUOTA.read_text())
+            if quota <= 0:
+                return None
+            return quota / int(_CGROUP_V1_CPU_PERIOD.read_text())
+    except (OSError, ValueError):
+        return None
+    return None
@@ -0,0 +1,430 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+_EXPIRED_THREAD_SWEEP_INTERVAL = 100
+
+
+class SQLiteCheckpointSaver(BaseCheckpointSaver[int]):
+    """
+    LangGraph checkpointer persisting conversation sessions in SQLite.
+
+    Only the latest checkpoint of every thread is kept, so storage grows with
+    the number of live sessions rather than with the number of turns, and
+    threads idle for longer than the session TTL are deleted. The database
+    runs in WAL mode so all worker processes of a host can share it; database
+    calls of the async API run in a worker thread.
+    """
+
+    def __init__(self, database_path: str, session_ttl_seconds: float) -> None:
+        """
+        Initialize the checkpointer and create its tables if necessary.
+
+        Args:
+            database_path: Path of the SQLite database file
+            session_ttl_seconds: Seconds after the last turn a session is kept
+        """
+        super().__init__()
+        self._session_ttl_seconds = session_ttl_seconds
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA busy_timeout=5000")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            "thread_id TEXT NOT NULL, checkpoint_ns TEXT NOT NULL, "
+            "checkpoint_id TEXT NOT NULL, parent_checkpoint_id TEXT, "
+            "checkpoint_type TEXT NOT NULL, checkpoint BLOB NOT NULL, "
+            "metadata_type TEXT NOT NULL, metadata BLOB NOT NULL, "
+            "updated_at REAL NOT NULL, "
+            "PRIMARY KEY (thread_id, checkpoint_ns))"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS checkpoints_updated_at "
+            "ON checkpoints (updated_at)"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoint_writes ("
+            "thread_id TEXT NOT NULL, checkpoint_ns TEXT NOT NULL, "
+            "checkpoint_id TEXT NOT NULL, task_id TEXT NOT NULL, "
+            "write_idx INTEGER NOT NULL, channel TEXT NOT NULL, "
+            "value_type TEXT NOT NULL, value BLOB NOT NULL, task_path TEXT NOT NULL, "
+            "PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, write_idx))"
+        )
+        self._connection.commit()
+
+        self._checkpoint_reads = 0
+        self._checkpoint_writes = 0
+        self._expired_threads = 0
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """
+        Get the latest checkpoint of a thread.
+
+        Args:
+            config: Config naming the thread and, optionally, the checkpoint
+
+        Returns:
+            Checkpoint tuple, or None if the thread has no matching checkpoint
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        with self._lock:
+            self._checkpoint_reads += 1
+            row = self._connection.execute(
+                "SELECT checkpoint_id, parent_checkpoint_id, checkpoint_type, "
+                "checkpoint, metadata_type, metadata FROM checkpoints "
+                "WHERE thread_id = ? AND checkpoint_ns = ? AND updated_at > ?",
+                (thread_id, checkpoint_ns, time.time() - self._session_ttl_seconds),
+            ).fetchone()
+            if row is None:
+                return None
+
+            checkpoint_id = row[0]
+            write_rows = self._connection.execute(
+                "SELECT task_id, channel, value_type, value FROM checkpoint_writes "
+                "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? "
+                "ORDER BY task_id, write_idx",
+                (thread_id, checkpoint_ns, checkpoint_id),
+            ).fetchall()
+
+        requested_checkpoint_id = get_checkpoint_id(config)
+        if requested_checkpoint_id and requested_checkpoint_id != checkpoint_id:
+            return None
+
+        return CheckpointTuple(
+            config=self._get_checkpoint_config(thread_id, checkpoint_ns, checkpoint_id),
+            checkpoint=self.serde.loads_typed((row[2], row[3])),
+            metadata=self.serde.loads_typed((row[4], row[5])),
+            parent_config=self._get_checkpoint_config(thread_id, checkpoint_ns, row[1])
+            if row[1]
+            else None,
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed((value_type, value)))
+                for task_id, channel, value_type, value in write_rows
+            ],
+        )
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        """
+        List the checkpoint of a thread.
+
+        Only the latest checkpoint is stored, so at most one tuple is yielded;
+        listing across all threads is not supported.
+
+        Args:
+            config: Config naming the thread
+            filter: Metadata values the checkpoint must match
+            before: Only yield the checkpoint if it is older than this one
+            limit: Maximum number of checkpoints to yield
+
+        Yields:
+            Matching checkpoint tuples
+        """
+        if config is None or (limit is not None and limit <= 0):
+            return
+
+        checkpoint_tuple = self.get_tuple(config)
+        if checkpoint_tuple is None:
+            return
+        if (before_checkpoint_id := get_checkpoint_id(before) if before else None) and (
+            checkpoint_tuple.checkpoint["id"] >= before_checkpoint_id
+        ):
+            return
+        if filter and any(
+            checkpoint_tuple.metadata.get(key) != value for key, value in filter.items()
+        ):
+            return
+        yield checkpoint_tuple
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """
+        Store a checkpoint, replacing the previous checkpoint of the thread.
+
+        Args:
+            config: Config naming the thread and the parent checkpoint
+            checkpoint: Checkpoint to store
+            metadata: Metadata of the checkpoint
+            new_versions: Channel versions written since the parent checkpoint
+
+        Returns:
+            Config naming the stored checkpoint
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_type, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+        metadata_type, serialized_metadata = self.serde.dumps_typed(
+            get_checkpoint_metadata(config, metadata)
+        )
+        now = time.time()
+
+        with self._lock:
+            self._checkpoint_writes += 1
+            self._connection.execute(
+                "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, "
+                "checkpoint_id, parent_checkpoint_id, checkpoint_type, checkpoint, "
+                "metadata_type, metadata, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    config["configurable"].get("checkpoint_id"),
+                    checkpoint_type,
+                    serialized_checkpoint,
+                    metadata_type,
+                    serialized_metadata,
+                    now,
+                ),
+            )
+            self._connection.execute(
+                "DELETE FROM checkpoint_writes "
+                "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id != ?",
+                (thread_id, checkpoint_ns, checkpoint["id"]),
+            )
+            if self._checkpoint_writes % _EXPIRED_THREAD_SWEEP_INTERVAL == 0:
+                self._delete_expired_threads(now)
+            self._connection.commit()
+
+        return self._get_checkpoint_config(thread_id, checkpoint_ns, checkpoint["id"])
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """
+        Store the pending writes of a task.
+
+        Args:
+            config: Config naming the checkpoint the writes belong to
+            writes: Channel and value pairs written by the task
+            task_id: Identifier of the task
+            task_path: Path of the task
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        rows = [
+            (
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                task_id,
+                WRITES_IDX_MAP.get(channel, write_idx),
+                channel,
+                *self.serde.dumps_typed(value),
+                task_path,
+            )
+            for write_idx, (channel, value) in enumerate(writes)
+        ]
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO checkpoint_writes (thread_id, checkpoint_ns, "
+                "checkpoint_id, task_id, write_idx, channel, value_type, value, "
+                "task_path) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._connection.commit()
+
+    def delete_thread(self, thread_id: str) -> None:
+        """
+        Delete the checkpoint and pending writes of a thread.
+
+        Args:
+            thread_id: Thread to delete
+        """
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,)
+            )
+            self._connection.execute(
+                "DELETE FROM checkpoint_writes WHERE thread_id = ?", (thread_id,)
+            )
+            self._connection.commit()
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """
+        Get the latest checkpoint of a thread without blocking the event loop.
+
+        Args:
+            config: Config naming the thread and, optionally, the checkpoint
+
+        Returns:
+            Checkpoint tuple, or None if the thread has no matching checkpoint
+        """
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """
+        List the checkpoint of a thread without blocking the event loop.
+
+        Args:
+            config: Config naming the thread
+            filter: Metadata values the checkpoint must match
+            before: Only yield the checkpoint if it is older than this one
+            limit: Maximum number of checkpoints to yield
+
+        Yields:
+            Matching checkpoint tuples
+        """
+        checkpoint_tuples = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for checkpoint_tuple in checkpoint_tuples:
+            yield checkpoint_tuple
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """
+        Store a checkpoint without blocking the event loop.
+
+        Args:
+            config: Config naming the thread and the parent checkpoint
+            checkpoint: Checkpoint to store
+            metadata: Metadata of the checkpoint
+            new_versions: Channel versions written since the parent checkpoint
+
+        Returns:
+            Config naming the stored checkpoint
+        """
+        return await asyncio.to_thread(
+            self.put, config, checkpoint, metadata, new_versions
+        )
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """
+        Store the pending writes of a task without blocking the event loop.
+
+        Args:
+            config: Config naming the checkpoint the writes belong to
+            writes: Channel and value pairs written by the task
+            task_id: Identifier of the task
+            task_path: Path of the task
+        """
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """
+        Delete a thread without blocking the event loop.
+
+        Args:
+            thread_id: Thread to delete
+        """
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get checkpoint statistics.
+
+        Returns:
+            Stored sessions, checkpoint reads and writes and expired sessions
+        """
+        with self._lock:
+            (stored_sessions,) = self._connection.execute(
+                "SELECT count(*) FROM checkpoints WHERE updated_at > ?",
+                (time.time() - self._session_ttl_seconds,),
+            ).fetchone()
+
+        return {
+            "stored_sessions": stored_sessions,
+            "checkpoint_reads": self._checkpoint_reads,
+            "checkpoint_writes": self._checkpoint_writes,
+            "expired_sessions": self._expired_threads,
+        }
+
+    def _delete_expired_threads(self, now: float) -> None:
+        """
+        Delete threads idle for longer than the session TTL.
+
+        Must be called with the lock held.
+
+        Args:
+            now: Current wall-clock time
+        """
+        expires_before = now - self._session_ttl_seconds
+        self._connection.execute(
+            "DELETE FROM checkpoint_writes WHERE (thread_id, checkpoint_ns) IN ("
+            "SELECT thread_id, checkpoint_ns FROM checkpoints WHERE updated_at <= ?)",
+            (expires_before,),
+        )
+        self._expired_threads += self._connection.execute(
+            "DELETE FROM checkpoints WHERE updated_at <= ?", (expires_before,)
+        ).rowcount
+
+    @staticmethod
+    def _get_checkpoint_config(
+        thread_id: str, checkpoint_ns: str, checkpoint_id: str
+    ) -> RunnableConfig:
+        """
+        Build the config addressing one checkpoint.
+
+        Args:
+            thread_id: Thread of the checkpoint
+            checkpoint_ns: Namespace of the checkpoint
+            checkpoint_id: Identifier of the checkpoint
+
+        Returns:
+            Runnable config naming the checkpoint
+        """
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint_id,
+            }
+        }
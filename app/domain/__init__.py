@@ -1,3 +1,21 @@
-from app.domain.enums import WorkflowRouteDecision
+from app.domain.enums import (
+    WorkflowRouteDecision,
+    StreamEventType,
+    WorkflowProgressStage,
+    FootballAgentMode,
+    SharedCacheBackendType,
+    LLMProfile,
+    ChatJobStatus,
+    ServerRuntimeProfile,
+)
 
-__all__ = ["WorkflowRouteDecision"]
+__all__ = [
+    "WorkflowRouteDecision",
+    "StreamEventType",
+    "WorkflowProgressStage",
+    "FootballAgentMode",
+    "SharedCacheBackendType",
+    "LLMProfile",
+    "ChatJobStatus",
+    "ServerRuntimeProfile",
+]
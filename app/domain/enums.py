@@ -13,3 +13,96 @@ class WorkflowRouteDecision(str, Enum):
     FOOTBALL_DATA = "fotmob_agent"
     COMBINED_APPROACH = "both"
     DIRECT_CONVERSATION = "conversational_agent"
+
+
+class StreamEventType(str, Enum):
+    """
+    Enumeration of event types emitted by the streaming chat endpoint.
+
+    Progress events report finished workflow steps, token events carry
+    fragments of the final answer as they are generated.
+    """
+
+    PROGRESS = "progress"
+    TOKEN = "token"
+    DONE = "done"
+    ERROR = "error"
+
+
+class WorkflowProgressStage(str, Enum):
+    """
+    Enumeration of workflow stages reported to streaming clients.
+
+    Each stage corresponds to a graph node finishing its work.
+    """
+
+    ROUTE_DECIDED = "route_decided"
+    FOOTBALL_DATA_FETCHED = "football_data_fetched"
+    WEB_RESULTS_FETCHED = "web_results_fetched"
+    ANSWER_GENERATED = "answer_generated"
+
+
+class FootballAgentMode(str, Enum):
+    """
+    Enumeration of execution strategies for the football data agent.
+
+    Single-shot mode plans tool calls with one structured LLM call, while
+    tool-agent mode runs the LangChain functions agent loop.
+    """
+
+    SINGLE_SHOT = "single_shot"
+    TOOL_AGENT = "tool_agent"
+
+
+class SharedCacheBackendType(str, Enum):
+    """
+    Enumeration of cache backends shared between worker processes.
+
+    SQLite shares entries between the workers of one host, the remote
+    backend shares them between hosts through a cache server.
+    """
+
+    NONE = "none"
+    SQLITE = "sqlite"
+    REMOTE = "remote"
+
+
+class LLMProfile(str, Enum):
+    """
+    Enumeration of LLM profiles used by the agents.
+
+    Each profile has its own deployment, output limit, sampling and retry
+    settings, so cheap calls such as routing do not pay for the settings
+    of answer generation.
+    """
+
+    ROUTING = "routing"
+    TOOL_PLANNING = "tool_planning"
+    ANSWER = "answer"
+
+
+class ChatJobStatus(str, Enum):
+    """
+    Enumeration of the states of an asynchronous chat job.
+
+    Jobs wait in the queue until a worker runs them and end either with an
+    answer or with an error.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class ServerRuntimeProfile(str, Enum):
+    """
+    Enumeration of server runtime profiles.
+
+    The default profile runs a single worker with the stock event loop and
+    JSON responses. The performance profile runs one worker per available
+    core with uvloop, httptools and orjson-rendered chat responses.
+    """
+
+    DEFAULT = "default"
+    PERFORMANCE = "performance"
@@ -1,15 +1,32 @@
 from app.domain.models.team_models import (
     FootballTeam,
+    TeamRecord,
+    TEAM_FIELDS,
     SearchTeamsInput,
     GetTeamDetailsInput,
 )
+from app.domain.models.fixture_models import (
+    MatchEvent,
+    StandingRow,
+    TeamFixturesInput,
+    LeagueTableInput,
+)
 from app.domain.models.conversation_state import ConversationState
-from app.domain.models.user_question import UserQuestion
+from app.domain.models.football_tool_plan import FootballToolPlan
+from app.domain.models.user_question import UserQuestion, UserQuestionBatch
 
 __all__ = [
     "FootballTeam",
+    "TeamRecord",
+    "TEAM_FIELDS",
     "ConversationState",
     "UserQuestion",
+    "UserQuestionBatch",
     "SearchTeamsInput",
     "GetTeamDetailsInput",
+    "MatchEvent",
+    "StandingRow",
+    "TeamFixturesInput",
+    "LeagueTableInput",
+    "FootballToolPlan",
 ]
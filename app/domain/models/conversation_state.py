@@ -1,24 +1,83 @@
+import uuid
 from typing import Any
 
 from langchain_core.messages import BaseMessage
 from pydantic import BaseModel, Field
 from typing import Annotated, List
-from operator import add
 from app.domain.enums import WorkflowRouteDecision
 
+DEADLINE_NOTICE_NAME = "deadline_notice"
+
+
+def merge_retrieved_context(
+    current_context: list[dict[str, Any] | BaseMessage],
+    context_update: list[dict[str, Any] | BaseMessage] | None,
+) -> list[dict[str, Any] | BaseMessage]:
+    """
+    Reduce updates of the retrieved context.
+
+    Messages of concurrent data agents are appended; an update of None clears
+    the context so the next turn of a session starts empty.
+
+    Args:
+        current_context: Context retrieved so far
+        context_update: Messages to append, or None to clear the context
+
+    Returns:
+        Merged context
+    """
+    if context_update is None:
+        return []
+    return current_context + context_update
+
+
+def merge_partial_flag(current_partial: bool, partial_update: bool) -> bool:
+    """
+    Reduce updates of the partial-answer flag.
+
+    Concurrent data agents may both flag a missed deadline in the same step,
+    which a plain field rejects; the latest value wins, so the input of a
+    new session turn resets the flag.
+
+    Args:
+        current_partial: Flag set so far
+        partial_update: Flag written by a node or the turn's input
+
+    Returns:
+        Updated flag
+    """
+    return partial_update
+
 
 class ConversationState(BaseModel):
     """
     State model representing the current conversation context.
 
     Maintains all necessary information throughout the chat workflow,
-    including user input, routing decisions, and retrieved data.
+    including user input, routing decisions, and retrieved data. Session
+    fields default to None so that a new turn does not overwrite the values
+    checkpointed by the previous one. The deadline is a time.monotonic()
+    timestamp by which the answer must be produced; partial is set when a
+    data agent missed it and the answer lacks that agent's context.
+    Context messages named DEADLINE_NOTICE_NAME are such missed-deadline
+    notices. session_entity is the normalized name of the team or league the
+    session named last, used to resolve pronouns of follow-up questions.
     """
 
+    request_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     user_question: str
+    deadline: float | None = None
     current_route_decision: WorkflowRouteDecision | None = None
-    retrieved_context: Annotated[List[dict[str, Any] | BaseMessage], add] = Field(
-        default_factory=list
-    )
+    retrieved_context: Annotated[
+        List[dict[str, Any] | BaseMessage], merge_retrieved_context
+    ] = Field(default_factory=list)
 
     final_answer: str | None = None
+    partial: Annotated[bool, merge_partial_flag] = False
+    speculative_execution: bool | None = None
+
+    session_id: str | None = None
+    session_summary: list[str] | None = None
+    session_context: list[dict[str, Any] | BaseMessage] | None = None
+    session_route_decision: WorkflowRouteDecision | None = None
+    session_entity: str | None = None
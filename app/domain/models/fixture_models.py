@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+
+from pydantic import BaseModel, Field
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class MatchEvent:
+    """
+    Compact representation of a scheduled or played league match.
+
+    Kickoff times are UTC timestamps in ISO 8601 format without a zone
+    suffix, so they order correctly as strings. Scores are None until the
+    match has been played.
+    """
+
+    event_id: str
+    league_name: str | None = None
+    round: str | None = None
+    home_team_id: str
+    home_team_name: str
+    away_team_id: str
+    away_team_name: str
+    kickoff: str | None = None
+    venue: str | None = None
+    home_score: int | None = None
+    away_score: int | None = None
+    status: str | None = None
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class StandingRow:
+    """Compact representation of one team's row in a league table."""
+
+    rank: int
+    team_id: str
+    team_name: str
+    played: int = 0
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+    goals_for: int = 0
+    goals_against: int = 0
+    goal_difference: int = 0
+    points: int = 0
+    form: str | None = None
+
+
+class TeamFixturesInput(BaseModel):
+    """Input schema for upcoming matches and recent results of a team."""
+
+    team_name: str = Field(description="Name of the team")
+
+
+class LeagueTableInput(BaseModel):
+    """Input schema for league tables."""
+
+    league_name: str = Field(description="Name of the league, e.g. Premier League")
@@ -0,0 +1,31 @@
+from pydantic import BaseModel, Field
+
+
+class FootballToolPlan(BaseModel):
+    """
+    Structured plan of football tool calls extracted from a user question.
+
+    Produced by a single LLM call and executed directly without
+    an agent loop.
+    """
+
+    team_names: list[str] = Field(
+        default_factory=list,
+        description="Names of the football teams mentioned in the question",
+    )
+    team_ids: list[str] = Field(
+        default_factory=list,
+        description="TheSportsDB team IDs explicitly mentioned in the question",
+    )
+    upcoming_match_teams: list[str] = Field(
+        default_factory=list,
+        description="Teams whose next or upcoming matches the question asks about",
+    )
+    recent_result_teams: list[str] = Field(
+        default_factory=list,
+        description="Teams whose latest results the question asks about",
+    )
+    league_tables: list[str] = Field(
+        default_factory=list,
+        description="Leagues whose table or standings the question asks about",
+    )
@@ -1,3 +1,6 @@
+from dataclasses import dataclass
+from typing import Any, Iterable
+
 from pydantic import BaseModel, Field
 
 
@@ -26,6 +29,63 @@ class FootballTeam(BaseModel):
     youtube_url: str | None = None
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
+class TeamRecord:
+    """
+    Compact, unvalidated representation of a football team.
+
+    Used for bulk results and the team index, where building a pydantic
+    model per team costs more CPU and memory than the callers need. Fields
+    mirror FootballTeam, and SportsDataService coerces API values to the
+    field types when it builds a record, so searches and lookups return the
+    same values; records are validated into FootballTeam only where a full
+    model is handed out.
+    """
+
+    team_id: str
+    team_name: str
+    alternate_name: str | None = None
+    formation_year: str | None = None
+    sport_type: str
+    league_name: str | None = None
+    stadium_name: str | None = None
+    stadium_location: str | None = None
+    team_description: str | None = None
+    badge_image_url: str | None = None
+    jersey_image_url: str | None = None
+    official_website: str | None = None
+    facebook_url: str | None = None
+    twitter_url: str | None = None
+    youtube_url: str | None = None
+
+    def project(self, fields: Iterable[str] | None = None) -> dict[str, Any]:
+        """
+        Convert the record into a dictionary of the requested fields.
+
+        Args:
+            fields: Names of the fields to keep; all fields if None
+
+        Returns:
+            Field values keyed by field name
+        """
+        return {field: getattr(self, field) for field in fields or TEAM_FIELDS}
+
+    def to_model(self) -> FootballTeam:
+        """
+        Validate the record into a full FootballTeam model.
+
+        Returns:
+            FootballTeam with the same field values
+
+        Raises:
+            ValidationError: If a field value does not match the model
+        """
+        return FootballTeam.model_validate(self.project())
+
+
+TEAM_FIELDS: tuple[str, ...] = tuple(FootballTeam.model_fields)
+
+
 class SearchTeamsInput(BaseModel):
     """Input schema for team search."""
 
@@ -6,7 +6,19 @@ class UserQuestion(BaseModel):
     Schema for validating user question input.
 
     Ensures that user questions meet minimum requirements
-    before processing in the chat system.
+    before processing in the chat system. Questions sharing a session_id
+    are answered as turns of one conversation.
     """
 
     question: str = Field(min_length=1)
+    session_id: str | None = Field(default=None, min_length=1, max_length=128)
+
+
+class UserQuestionBatch(BaseModel):
+    """
+    Schema for validating a batch of user questions.
+
+    Limits the batch size so a single request cannot monopolize the service.
+    """
+
+    questions: list[UserQuestion] = Field(min_length=1, max_length=100)
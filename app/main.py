@@ -1,8 +1,15 @@
+import importlib.util
 import os
+from contextlib import asynccontextmanager
 
-from dotenv import load_dotenv
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
+from httpx import AsyncClient
+from langchain_core.language_models import BaseChatModel
+from langchain_core.tools import BaseTool
 from app.api.chat_router import ChatRouter
+from app.api.metrics_router import MetricsRouter
+from app.api.stats_router import StatsRouter
 from app.agents.supervisor_agent import SupervisorAgent
 from app.agents.football_data_agent import FootballDataAgent
 from app.agents.web_search_agent import WebSearchAgent
@@ -10,35 +17,395 @@ from app.agents.conversation_response_agent import ConversationResponseAgent
 from app.controllers.agents_controller import AgentsController
 from app.core.graph_builder import GraphBuilder
 from app.core.azure_openai_client import AzureOpenAIClient
-from app.services.config_service import AppConfig
+from app.core.http_pool_manager import HttpPoolManager
+from app.core.server_runtime import get_worker_count
+from app.core.sqlite_checkpoint_saver import SQLiteCheckpointSaver
+from app.domain.enums import (
+    FootballAgentMode,
+    ServerRuntimeProfile,
+    SharedCacheBackendType,
+)
+from app.services.answer_cache_service import AnswerCacheService
+from app.services.config_service import AppConfig, AppConfigError
+from app.services.context_builder_service import ContextBuilderService
+from app.services.answer_synthesizer_service import AnswerSynthesizerService
+from app.services.chat_job_service import ChatJobService
+from app.services.metrics_service import MetricsService
+from app.services.route_classifier_service import RouteClassifierService
+from app.services.session_memory_service import SessionMemoryService
 from app.services.sports_data_service import SportsDataService
+from app.services.team_index_service import TeamIndexService
+from app.services.fixtures_store_service import FixturesStoreService
+from app.services.web_search_service import WebSearchService
 from app.tools.football_api_tools import FootballAPITools
+from app.tools.tavily_search_tools import create_tavily_search_tool
+from app.utils.admission_controller import AdmissionController
+from app.utils.hedged_executor import HedgedExecutor
+from app.utils.event_loop_monitor import EventLoopMonitor
+from app.utils.sampling_profiler import SamplingProfiler
+from app.utils.cache_backend import (
+    CacheBackend,
+    MemoryCacheBackend,
+    RemoteCacheBackend,
+    SQLiteCacheBackend,
+)
 
 
-load_dotenv()
+def _create_shared_cache(
+    config: AppConfig, http_pool_manager: HttpPoolManager
+) -> CacheBackend | None:
+    """
+    Create the cache backend shared between worker processes.
 
+    Args:
+        config: Application configuration containing shared cache settings
+        http_pool_manager: Pool manager providing the client of the remote backend
 
-def main():
-    config = AppConfig(os.environ)
-    sports_data_service = SportsDataService()
-    football_api_tools = FootballAPITools(sports_data_service)
-    azure_openai_client = AzureOpenAIClient(config)
-    football_data_agent = FootballDataAgent(azure_openai_client, football_api_tools)
-    web_search_agent = WebSearchAgent()
-    conversation_response_agent = ConversationResponseAgent(azure_openai_client)
-    supervisor_agent = SupervisorAgent(azure_openai_client)
+    Returns:
+        Configured cache backend, or None when no shared cache is configured
+    """
+    backend_type = SharedCacheBackendType(config.SHARED_CACHE_BACKEND)
+    if backend_type == SharedCacheBackendType.SQLITE:
+        return SQLiteCacheBackend(
+            config.SHARED_CACHE_SQLITE_PATH, config.SHARED_CACHE_SQLITE_MAX_ENTRIES
+        )
+    if backend_type == SharedCacheBackendType.REMOTE:
+        return RemoteCacheBackend(
+            config.SHARED_CACHE_REMOTE_URL,
+            http_pool_manager.get_client("shared_cache", read_timeout=1.0),
+        )
+    return None
+
+
+def _check_chat_jobs_config(config: AppConfig) -> None:
+    """
+    Check that chat jobs can be polled from every server worker.
+
+    Jobs live in the process that accepted them; with several workers their
+    polls are only answered through a shared cache.
+
+    Args:
+        config: Application configuration containing the chat job settings
+
+    Raises:
+        AppConfigError: If chat jobs are enabled for several workers without
+            a shared cache
+    """
+    if (
+        config.CHAT_JOBS_ENABLED
+        and SharedCacheBackendType(config.SHARED_CACHE_BACKEND)
+        == SharedCacheBackendType.NONE
+        and get_worker_count(config) > 1
+    ):
+        raise AppConfigError(
+            "CHAT_JOBS_ENABLED requires a SHARED_CACHE_BACKEND when more than one "
+            "server worker runs; configure a shared cache, set SERVER_WORKERS=1 "
+            "or set CHAT_JOBS_ENABLED=false"
+        )
+
+
+def _get_response_class(config: AppConfig) -> type[JSONResponse]:
+    """
+    Get the response class rendering JSON chat responses.
+
+    Args:
+        config: Application configuration containing the server runtime profile
+
+    Returns:
+        ORJSONResponse in the performance profile when orjson is installed,
+        JSONResponse otherwise
+    """
+    if (
+        ServerRuntimeProfile(config.SERVER_RUNTIME_PROFILE)
+        == ServerRuntimeProfile.PERFORMANCE
+        and importlib.util.find_spec("orjson") is not None
+    ):
+        return ORJSONResponse
+    return JSONResponse
+
+
+def create_app(
+    config: AppConfig | None = None,
+    http_client: AsyncClient | None = None,
+    chat_model: BaseChatModel | None = None,
+    search_tool: BaseTool | None = None,
+) -> FastAPI:
+    """
+    Build the FastAPI application and wire all components.
+
+    Nothing is built at import time; serve the app with
+    ``uvicorn app.main:create_app --factory``. The workflow graph is compiled
+    once in the lifespan hook, before the first request is accepted.
+
+    Args:
+        config: Application configuration, read from the environment by default
+        http_client: Optional HTTP client for TheSportsDB API
+        chat_model: Optional chat model used instead of Azure OpenAI
+        search_tool: Optional search tool used instead of Tavily
+
+    Returns:
+        Configured FastAPI application
+    """
+    config = config or AppConfig(os.environ)
+    _check_chat_jobs_config(config)
+    metrics_service = MetricsService()
+    http_pool_manager = HttpPoolManager(config)
+    shared_cache = _create_shared_cache(config, http_pool_manager)
+    hedged_executor = (
+        HedgedExecutor(
+            config.HEDGE_QUANTILE,
+            config.HEDGE_MIN_DELAY_SECONDS,
+            config.HEDGE_MAX_DELAY_SECONDS,
+            config.HEDGE_MIN_SAMPLES,
+        )
+        if config.HEDGING_ENABLED
+        else None
+    )
+    sports_data_service = SportsDataService(
+        config,
+        http_client or http_pool_manager.get_client("thesportsdb", read_timeout=10.0),
+        metrics_service,
+        shared_cache,
+        hedged_executor,
+    )
+    route_classifier = (
+        RouteClassifierService(
+            config.ROUTE_CLASSIFIER_CONFIDENCE_THRESHOLD,
+            config.ROUTE_CLASSIFIER_MIN_PRECISION,
+        )
+        if config.ROUTE_CLASSIFIER_ENABLED
+        else None
+    )
+    team_index = (
+        TeamIndexService(
+            sports_data_service,
+            config.TEAM_INDEX_REFRESH_INTERVAL_SECONDS,
+            config.TEAM_INDEX_LOAD_CONCURRENCY,
+            [
+                name.strip()
+                for name in config.TEAM_INDEX_LEAGUES.split(",")
+                if name.strip()
+            ],
+            config.TEAM_INDEX_MAX_REQUESTS_PER_MINUTE,
+        )
+        if config.TEAM_INDEX_ENABLED
+        else None
+    )
+    if team_index is not None and route_classifier is not None:
+        team_index.add_refresh_listener(
+            lambda index: route_classifier.register_team_names(index.iter_team_names())
+        )
+    fixtures_store = (
+        FixturesStoreService(
+            sports_data_service,
+            config.FIXTURES_REFRESH_INTERVAL_SECONDS,
+            config.FIXTURES_LOAD_CONCURRENCY,
+            [
+                name.strip()
+                for name in config.FIXTURES_LEAGUES.split(",")
+                if name.strip()
+            ],
+            config.FIXTURES_SEASON,
+            team_index,
+        )
+        if config.FIXTURES_STORE_ENABLED
+        else None
+    )
+    football_api_tools = FootballAPITools(
+        sports_data_service,
+        team_index,
+        [
+            field_name.strip()
+            for field_name in config.FOOTBALL_TOOL_TEAM_FIELDS.split(",")
+            if field_name.strip()
+        ],
+        fixtures_store,
+    )
+    azure_openai_client = AzureOpenAIClient(
+        config,
+        chat_model,
+        [metrics_service.llm_callback_handler],
+        http_pool_manager.get_client("azure_openai", read_timeout=60.0)
+        if chat_model is None
+        else None,
+    )
+    football_data_agent = FootballDataAgent(
+        azure_openai_client,
+        football_api_tools,
+        FootballAgentMode(config.FOOTBALL_AGENT_MODE),
+    )
+    web_search_service = WebSearchService(
+        config,
+        search_tool
+        or create_tavily_search_tool(
+            http_pool_manager.get_client("tavily", read_timeout=20.0),
+            config.TAVILY_API_KEY,
+        ),
+        metrics_service,
+        shared_cache or MemoryCacheBackend(config.WEB_SEARCH_CACHE_MAX_ENTRIES),
+    )
+    web_search_agent = WebSearchAgent(web_search_service)
+    context_builder = (
+        ContextBuilderService(config) if config.CONTEXT_BUILDER_ENABLED else None
+    )
+    answer_synthesizer = (
+        AnswerSynthesizerService() if config.ANSWER_SYNTHESIZER_ENABLED else None
+    )
+    conversation_response_agent = ConversationResponseAgent(
+        azure_openai_client, context_builder, answer_synthesizer
+    )
+    supervisor_agent = SupervisorAgent(
+        azure_openai_client, route_classifier, fixtures_store
+    )
+    session_memory = (
+        SessionMemoryService(config, team_index, fixtures_store)
+        if config.SESSIONS_ENABLED
+        else None
+    )
+    checkpointer = (
+        SQLiteCheckpointSaver(
+            config.SESSION_CHECKPOINT_PATH, config.SESSION_TTL_SECONDS
+        )
+        if config.SESSIONS_ENABLED
+        else None
+    )
     agents_controller = AgentsController(
         supervisor_agent,
         football_data_agent,
         web_search_agent,
         conversation_response_agent,
+        route_classifier,
+        config.SPECULATIVE_EXECUTION_RATIO,
+        config.SPECULATIVE_PRIOR_THRESHOLD,
+        session_memory,
+        config.REQUEST_DEADLINE_ANSWER_RESERVE_SECONDS,
     )
-    graph_builder = GraphBuilder(agents_controller)
-    chat_router = ChatRouter(graph_builder)
+    graph_builder = GraphBuilder(agents_controller, metrics_service, checkpointer)
+    answer_cache = (
+        AnswerCacheService(config, team_index, shared_cache)
+        if config.ANSWER_CACHE_ENABLED
+        else None
+    )
+    admission_controller = (
+        AdmissionController(
+            config.ADMISSION_MAX_IN_FLIGHT,
+            config.ADMISSION_MAX_QUEUE,
+            config.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+            config.ADMISSION_TARGET_LATENCY_SECONDS,
+            config.ADMISSION_MIN_IN_FLIGHT,
+        )
+        if config.ADMISSION_CONTROL_ENABLED
+        else None
+    )
+    profiler = (
+        SamplingProfiler(
+            config.PROFILING_SAMPLE_INTERVAL_SECONDS,
+            config.PROFILING_MIN_INTERVAL_SECONDS,
+            config.PROFILING_MAX_DURATION_SECONDS,
+        )
+        if config.PROFILING_ENABLED
+        else None
+    )
+    event_loop_monitor = (
+        EventLoopMonitor(
+            config.EVENT_LOOP_MONITOR_INTERVAL_SECONDS,
+            config.EVENT_LOOP_STALL_THRESHOLD_SECONDS,
+        )
+        if config.EVENT_LOOP_MONITOR_ENABLED
+        else None
+    )
+    chat_jobs = (
+        ChatJobService(
+            config.CHAT_JOB_WORKERS,
+            config.CHAT_JOB_MAX_QUEUED,
+            config.CHAT_JOB_RESULT_TTL_SECONDS,
+            shared_cache,
+        )
+        if config.CHAT_JOBS_ENABLED
+        else None
+    )
+    chat_router = ChatRouter(
+        graph_builder,
+        answer_cache,
+        config.BATCH_MAX_CONCURRENCY,
+        admission_controller,
+        config.REQUEST_DEADLINE_SECONDS,
+        chat_jobs,
+        config.CHAT_JOB_MAX_WAIT_SECONDS,
+        profiler,
+        _get_response_class(config),
+    )
+    stats_providers = {
+        "sports_data_cache": sports_data_service.get_cache_stats,
+        "workflow_latency": graph_builder.get_latency_stats,
+        "node_latency": graph_builder.get_node_latency_stats,
+        "speculative_execution": agents_controller.get_speculation_stats,
+        "web_search": web_search_service.get_stats,
+        "http_pools": http_pool_manager.get_stats,
+        "deadlines": agents_controller.get_deadline_stats,
+        "football_data_agent": football_data_agent.get_stats,
+    }
+    if shared_cache is not None:
+        stats_providers["shared_cache"] = shared_cache.get_stats
+    if route_classifier is not None:
+        stats_providers["route_classifier"] = route_classifier.get_stats
+    if team_index is not None:
+        stats_providers["team_index"] = team_index.get_stats
+    if fixtures_store is not None:
+        stats_providers["fixtures_store"] = fixtures_store.get_stats
+    if answer_cache is not None:
+        stats_providers["answer_cache"] = answer_cache.get_stats
+    if context_builder is not None:
+        stats_providers["context_builder"] = context_builder.get_stats
+    if answer_synthesizer is not None:
+        stats_providers["answer_synthesizer"] = answer_synthesizer.get_stats
+    if hedged_executor is not None:
+        stats_providers["hedging"] = hedged_executor.get_stats
+    if admission_controller is not None:
+        stats_providers["admission"] = admission_controller.get_stats
+    if chat_jobs is not None:
+        stats_providers["chat_jobs"] = chat_jobs.get_stats
+    if profiler is not None:
+        stats_providers["profiling"] = profiler.get_stats
+    if event_loop_monitor is not None:
+        stats_providers["event_loop"] = event_loop_monitor.get_stats
+    if session_memory is not None:
+        stats_providers["session_memory"] = session_memory.get_stats
+    if checkpointer is not None:
+        stats_providers["session_checkpoints"] = checkpointer.get_stats
+    stats_router = StatsRouter(stats_providers)
+    metrics_router = MetricsRouter(metrics_service)
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI):
+        graph_builder.compile_workflow()
+        if context_builder is not None:
+            await context_builder.load_tokenizer()
+        if team_index is not None:
+            team_index.start_background_refresh()
+        if fixtures_store is not None:
+            fixtures_store.start_background_refresh()
+        if chat_jobs is not None:
+            chat_jobs.start()
+        if event_loop_monitor is not None:
+            event_loop_monitor.start()
+        yield
+        if event_loop_monitor is not None:
+            await event_loop_monitor.stop()
+        if chat_jobs is not None:
+            await chat_jobs.stop()
+        if team_index is not None:
+            await team_index.stop()
+        if fixtures_store is not None:
+            await fixtures_store.stop()
+        if shared_cache is not None:
+            await shared_cache.aclose()
+        if checkpointer is not None:
+            checkpointer.close()
+        await http_pool_manager.aclose()
 
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
     app.include_router(chat_router.get_configured_router())
+    app.include_router(stats_router.get_configured_router())
+    app.include_router(metrics_router.get_configured_router())
     return app
-
-
-app = main()
@@ -1,4 +1,28 @@
 from app.services.config_service import AppConfig
 from app.services.sports_data_service import SportsDataService
+from app.services.route_classifier_service import RouteClassifierService
+from app.services.team_index_service import TeamIndexService
+from app.services.fixtures_store_service import FixturesStoreService
+from app.services.answer_cache_service import AnswerCacheService
+from app.services.context_builder_service import ContextBuilderService
+from app.services.answer_synthesizer_service import AnswerSynthesizerService
+from app.services.metrics_service import MetricsService
+from app.services.session_memory_service import SessionMemoryService
+from app.services.chat_job_service import ChatJob, ChatJobService
+from app.services.web_search_service import WebSearchService
 
-__all__ = ["AppConfig", "SportsDataService"]
+__all__ = [
+    "AppConfig",
+    "SportsDataService",
+    "RouteClassifierService",
+    "TeamIndexService",
+    "FixturesStoreService",
+    "AnswerCacheService",
+    "ContextBuilderService",
+    "AnswerSynthesizerService",
+    "MetricsService",
+    "SessionMemoryService",
+    "ChatJob",
+    "ChatJobService",
+    "WebSearchService",
+]
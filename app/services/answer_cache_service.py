@@ -0,0 +1,253 @@
+import re
+import time
+import unicodedata
+from typing import Any
+
+from app.domain.enums import WorkflowRouteDecision
+from app.services.config_service import AppConfig
+from app.services.fixtures_store_service import is_fixture_question
+from app.services.team_index_service import TeamIndexService
+from app.utils.cache_backend import CacheBackend
+from app.utils.ttl_cache import TTLCache
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_POSSESSIVE_PATTERN = re.compile(r"['’]s\b")
+_MAX_ENTITY_TOKENS = 4
+_STOPWORDS = frozenset(
+    {
+        "a",
+        "an",
+        "the",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "do",
+        "does",
+        "did",
+        "of",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "about",
+        "me",
+        "tell",
+        "please",
+        "who",
+        "what",
+        "which",
+        "whats",
+        "can",
+        "could",
+        "you",
+        "i",
+        "their",
+        "its",
+        "it",
+        "fc",
+        "afc",
+    }
+)
+
+
+class AnswerCacheService:
+    """
+    Cache of final answers keyed by normalized user questions.
+
+    Questions are case-folded, stripped of punctuation and stopwords, and
+    team aliases are replaced by canonical names, so near-identical questions
+    share an entry. Answers expire according to the route that produced them
+    and live in a bounded LRU with an optional tier shared between workers.
+    """
+
+    def __init__(
+        self,
+        app_config: AppConfig,
+        team_index: TeamIndexService | None = None,
+        shared_cache: CacheBackend | None = None,
+    ) -> None:
+        """
+        Initialize the answer cache.
+
+        Args:
+            app_config: Application configuration containing cache settings
+            team_index: Optional team index used to canonicalize team aliases
+            shared_cache: Optional cache backend shared with other workers
+        """
+        self._team_index = team_index
+        self._memory_cache = TTLCache(app_config.ANSWER_CACHE_MAX_ENTRIES)
+        self._shared_cache = shared_cache
+        self._route_ttls = {
+            WorkflowRouteDecision.FOOTBALL_DATA.value: app_config.ANSWER_CACHE_FOOTBALL_DATA_TTL_SECONDS,
+            WorkflowRouteDecision.WEB_SEARCH.value: app_config.ANSWER_CACHE_WEB_SEARCH_TTL_SECONDS,
+            WorkflowRouteDecision.COMBINED_APPROACH.value: app_config.ANSWER_CACHE_WEB_SEARCH_TTL_SECONDS,
+            WorkflowRouteDecision.DIRECT_CONVERSATION.value: app_config.ANSWER_CACHE_DIRECT_CONVERSATION_TTL_SECONDS,
+        }
+
+        self._memory_hits = 0
+        self._shared_hits = 0
+        self._misses = 0
+        self._saved_latency_seconds = 0.0
+
+    def normalize_question(self, question: str) -> str:
+        """
+        Build the cache key for a question.
+
+        Accents are stripped, but letters of any script are kept, so
+        questions in non-Latin scripts do not collapse onto the same key.
+
+        Args:
+            question: Raw user question
+
+        Returns:
+            Normalized question text, or the case-folded question if only stopwords remain
+        """
+        folded_question = "".join(
+            character
+            for character in unicodedata.normalize("NFKD", question.casefold())
+            if not unicodedata.combining(character)
+        )
+        tokens = [
+            token
+            for token in _TOKEN_PATTERN.findall(
+                _POSSESSIVE_PATTERN.sub("", folded_question)
+            )
+            if token not in _STOPWORDS
+        ]
+        return (
+            " ".join(self._canonicalize_entities(tokens)) or question.strip().casefold()
+        )
+
+    async def get(self, question: str) -> str | None:
+        """
+        Get the cached answer for a question.
+
+        Args:
+            question: Raw user question
+
+        Returns:
+            Cached answer, or None on a miss
+        """
+        cache_key = self.normalize_question(question)
+
+        cache_entry = self._memory_cache.get(cache_key)
+        if cache_entry is not None and cache_entry.is_fresh(time.monotonic()):
+            self._memory_hits += 1
+            self._saved_latency_seconds += cache_entry.value["latency_seconds"]
+            return cache_entry.value["answer"]
+
+        if self._shared_cache is not None:
+            cached_value = await self._shared_cache.get(f"answer:{cache_key}")
+            if cached_value is not None:
+                self._shared_hits += 1
+                self._saved_latency_seconds += cached_value["latency_seconds"]
+                self._memory_cache.set(
+                    cache_key,
+                    cached_value,
+                    self._get_ttl(cached_value["route"], question),
+                )
+                return cached_value["answer"]
+
+        self._misses += 1
+        return None
+
+    async def set(
+        self, question: str, answer: str, route: str | None, latency_seconds: float
+    ) -> None:
+        """
+        Store the answer produced for a question.
+
+        Args:
+            question: Raw user question
+            answer: Final answer returned to the user
+            route: Routing decision that produced the answer
+            latency_seconds: Time the workflow took to produce the answer
+        """
+        ttl = self._get_ttl(route, question)
+        if ttl <= 0:
+            return
+
+        cache_key = self.normalize_question(question)
+        cached_value = {
+            "answer": answer,
+            "route": route,
+            "latency_seconds": latency_seconds,
+        }
+
+        self._memory_cache.set(cache_key, cached_value, ttl)
+        if self._shared_cache is not None:
+            await self._shared_cache.set(f"answer:{cache_key}", cached_value, ttl)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get answer cache statistics.
+
+        Returns:
+            Hit and miss counters, hit ratio and workflow latency saved by hits
+        """
+        hits = self._memory_hits + self._shared_hits
+        lookups = hits + self._misses
+        return {
+            "memory_hits": self._memory_hits,
+            "shared_hits": self._shared_hits,
+            "misses": self._misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "saved_latency_seconds": self._saved_latency_seconds,
+            "avg_saved_latency_seconds": self._saved_latency_seconds / hits
+            if hits
+            else 0.0,
+            "shared_tier_enabled": self._shared_cache is not None,
+            **self._memory_cache.get_stats(),
+        }
+
+    def _get_ttl(self, route: str | None, question: str) -> float:
+        """
+        Get the TTL for answers produced by a route.
+
+        Answers about fixtures, results or tables change with every match, so
+        they expire like web search answers whatever route produced them.
+
+        Args:
+            route: Routing decision that produced the answer
+            question: Raw user question
+
+        Returns:
+            TTL in seconds, zero if the answer should not be cached
+        """
+        ttl = self._route_ttls.get(route, 0.0)
+        if is_fixture_question(question):
+            return min(ttl, self._route_ttls[WorkflowRouteDecision.WEB_SEARCH.value])
+        return ttl
+
+    def _canonicalize_entities(self, tokens: list[str]) -> list[str]:
+        """
+        Replace team aliases with canonical team names.
+
+        Args:
+            tokens: Normalized question tokens
+
+        Returns:
+            Tokens with the longest matching aliases replaced
+        """
+        if self._team_index is None or not self._team_index.is_ready:
+            return tokens
+
+        canonical_tokens: list[str] = []
+        position = 0
+        while position < len(tokens):
+            for size in range(min(_MAX_ENTITY_TOKENS, len(tokens) - position), 0, -1):
+                canonical_name = self._team_index.canonicalize_alias(
+                    " ".join(tokens[position : position + size])
+                )
+                if canonical_name is not None:
+                    canonical_tokens.append(canonical_name)
+                    position += size
+                    break
+            else:
+                canonical_tokens.append(tokens[position])
+                position += 1
+
+        return canonical_tokens
@@ -0,0 +1,279 @@
+import re
+import string
+import unicodedata
+from typing import Any
+
+from langchain_core.messages import BaseMessage
+
+from app.domain.enums import WorkflowRouteDecision
+from app.domain.models.conversation_state import ConversationState
+from app.utils.json_codec import decode_json
+
+NOT_RELEVANT_ANSWER = "This question is not relevant to the system."
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_POSSESSIVE_PATTERN = re.compile(r"['’]s\b")
+_OPEN_ENDED_PATTERN = re.compile(
+    r"\b(and|or|vs|versus|compare|history|tell|describe|explain|why|more|details?)\b"
+)
+_ATTRIBUTE_PATTERNS: dict[str, re.Pattern[str]] = {
+    "stadium_name": re.compile(
+        r"\b(stadium|ground|arena|venue|home (games?|matches))\b"
+    ),
+    "stadium_location": re.compile(r"\b(where|located|based|city|location)\b"),
+    "formation_year": re.compile(
+        r"\b(founded|formed|established|created|founding|formation|how old)\b"
+    ),
+    "league_name": re.compile(r"\b(league|division|competes?|competition)\b"),
+    "official_website": re.compile(r"\b(website|web site|homepage|site|url)\b"),
+    "alternate_name": re.compile(
+        r"\b(nicknames?|nicknamed|also known|other names?|alternate names?)\b"
+    ),
+}
+_ANSWER_TEMPLATES: dict[str, str] = {
+    "stadium_name": "{team_name} plays its home matches at {stadium_name}.",
+    "stadium_location": (
+        "{team_name} plays its home matches at {stadium_name} in {stadium_location}."
+    ),
+    "formation_year": "{team_name} was founded in {formation_year}.",
+    "league_name": "{team_name} plays in the {league_name}.",
+    "official_website": "The official website of {team_name} is {official_website}.",
+    "alternate_name": "{team_name} is also known as {alternate_name}.",
+}
+
+
+class AnswerSynthesizerService:
+    """
+    Deterministic answers for questions that need no language model.
+
+    Questions about a single attribute of a single team, such as its stadium
+    or founding year, are answered from a template filled with the retrieved
+    team record. Questions without any retrieved context or session summary
+    receive the fixed not-relevant answer. Everything else is left to the
+    response LLM.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the answer synthesizer."""
+        self._template_fields = {
+            attribute: [
+                field_name
+                for _, field_name, _, _ in string.Formatter().parse(template)
+                if field_name
+            ]
+            for attribute, template in _ANSWER_TEMPLATES.items()
+        }
+
+        self._responses = 0
+        self._empty_context_answers = 0
+        self._templated_answers = {attribute: 0 for attribute in _ANSWER_TEMPLATES}
+
+    def try_synthesize(
+        self,
+        conversation_state: ConversationState,
+        context_data: str | list[dict[str, Any] | BaseMessage],
+    ) -> str | None:
+        """
+        Try to answer the current question without the response LLM.
+
+        Args:
+            conversation_state: Current conversation state with retrieved context
+            context_data: Prompt context, built or raw, of the response agent
+
+        Returns:
+            Synthesized answer, or None if the question needs the LLM
+        """
+        self._responses += 1
+
+        if not context_data or (
+            isinstance(context_data, str) and not context_data.strip()
+        ):
+            if conversation_state.session_summary:
+                return None
+            self._empty_context_answers += 1
+            return NOT_RELEVANT_ANSWER
+
+        if (
+            conversation_state.current_route_decision
+            != WorkflowRouteDecision.FOOTBALL_DATA.value
+        ):
+            return None
+
+        question = self._normalize(conversation_state.user_question)
+        attribute = self._detect_attribute(question)
+        if attribute is None:
+            return None
+
+        team_records = self._collect_team_records(conversation_state.retrieved_context)
+        if team_records is None:
+            return None
+        team_data = self._select_mentioned_team(set(question.split()), team_records)
+        if team_data is None or not all(
+            team_data.get(field_name) for field_name in self._template_fields[attribute]
+        ):
+            return None
+
+        self._templated_answers[attribute] += 1
+        return _ANSWER_TEMPLATES[attribute].format_map(team_data)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get answer synthesis statistics.
+
+        Returns:
+            Responses seen, answers served without the LLM by kind and the
+            fraction of responses they make up
+        """
+        templated_answers = sum(self._templated_answers.values())
+        served_answers = templated_answers + self._empty_context_answers
+        return {
+            "responses": self._responses,
+            "empty_context_answers": self._empty_context_answers,
+            "templated_answers": templated_answers,
+            "templated_answers_by_attribute": dict(self._templated_answers),
+            "llm_answers": self._responses - served_answers,
+            "served_ratio": served_answers / self._responses
+            if self._responses
+            else 0.0,
+        }
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """
+        Normalize a text into space-separated lowercase ASCII tokens.
+
+        Args:
+            text: Question or team name
+
+        Returns:
+            Normalized text without accents, punctuation and possessives
+        """
+        ascii_text = (
+            unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+        )
+        return " ".join(
+            _TOKEN_PATTERN.findall(_POSSESSIVE_PATTERN.sub("", ascii_text.casefold()))
+        )
+
+    @staticmethod
+    def _detect_attribute(question: str) -> str | None:
+        """
+        Detect the single team attribute a question asks for.
+
+        Questions asking where a team plays match both stadium attributes and
+        are answered with the stadium and its location.
+
+        Args:
+            question: Normalized question
+
+        Returns:
+            Attribute name, or None for open-ended or multi-attribute questions
+        """
+        if _OPEN_ENDED_PATTERN.search(question):
+            return None
+
+        attributes = {
+            attribute
+            for attribute, pattern in _ATTRIBUTE_PATTERNS.items()
+            if pattern.search(question)
+        }
+        if {"stadium_name", "stadium_location"} <= attributes:
+            attributes.discard("stadium_name")
+        if len(attributes) != 1:
+            return None
+        return attributes.pop()
+
+    def _collect_team_records(
+        self, retrieved_context: list[dict[str, Any] | BaseMessage]
+    ) -> list[dict[str, Any]] | None:
+        """
+        Collect the team records returned by the football tools.
+
+        Args:
+            retrieved_context: Tool messages produced by the data agents
+
+        Returns:
+            Team records, or None if the context holds anything else, e.g.
+            fixtures or a missed-deadline notice
+        """
+        team_records: list[dict[str, Any]] = []
+        for context_message in retrieved_context:
+            raw_content = (
+                context_message.content
+                if isinstance(context_message, BaseMessage)
+                else context_message.get("content", "")
+            )
+            try:
+                payload = decode_json(raw_content)
+            except (TypeError, ValueError):
+                return None
+            if not self._collect_from_payload(payload, team_records):
+                return None
+        return team_records
+
+    def _collect_from_payload(
+        self, payload: Any, team_records: list[dict[str, Any]]
+    ) -> bool:
+        """
+        Walk a decoded tool payload and collect its team records.
+
+        Args:
+            payload: Decoded JSON payload or a nested part of it
+            team_records: Output list the team records are appended to
+
+        Returns:
+            False if the payload contains data other than team records
+        """
+        if isinstance(payload, list):
+            return all(
+                self._collect_from_payload(item, team_records) for item in payload
+            )
+        if not isinstance(payload, dict):
+            return payload is None
+        if "output" in payload:
+            return self._collect_from_payload(payload["output"], team_records)
+        if "team_name" not in payload or {"home_team_name", "rank"} & payload.keys():
+            return False
+        team_records.append(payload)
+        return True
+
+    def _select_mentioned_team(
+        self, question_tokens: set[str], team_records: list[dict[str, Any]]
+    ) -> dict[str, Any] | None:
+        """
+        Select the one team the question mentions by name.
+
+        A team whose name is contained in the longer name of another mentioned
+        team, e.g. Arsenal in Arsenal Tula, does not count as mentioned.
+
+        Args:
+            question_tokens: Tokens of the normalized question
+            team_records: Candidate team records
+
+        Returns:
+            Team record, or None if no team or several teams are mentioned
+        """
+        mentioned_teams: dict[str, tuple[set[str], dict[str, Any]]] = {}
+        for team_data in team_records:
+            team_key = str(team_data.get("team_id") or team_data["team_name"])
+            for name in [team_data["team_name"] or ""] + (
+                team_data.get("alternate_name") or ""
+            ).split(","):
+                name_tokens = set(self._normalize(name).split())
+                if name_tokens and name_tokens <= question_tokens:
+                    if len(name_tokens) > len(
+                        mentioned_teams.get(team_key, (set(), None))[0]
+                    ):
+                        mentioned_teams[team_key] = (name_tokens, team_data)
+
+        candidates = [
+            (name_tokens, team_data)
+            for name_tokens, team_data in mentioned_teams.values()
+            if not any(
+                name_tokens < other_tokens
+                for other_tokens, _ in mentioned_teams.values()
+            )
+        ]
+        if len(candidates) != 1:
+            return None
+        return candidates[0][1]
@@ -0,0 +1,288 @@
+import asyncio
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from app.domain.enums import ChatJobStatus
+from app.utils.admission_controller import AdmissionRejectedError
+from app.utils.cache_backend import CacheBackend
+from app.utils.latency_tracker import LatencyTracker
+
+
+@dataclass(slots=True, kw_only=True)
+class ChatJob:
+    """
+    Chat request executed asynchronously by the job workers.
+
+    Timestamps are time.monotonic() values of the process running the job;
+    started_at and finished_at stay None until the job reaches the
+    respective state, and all three are None for jobs read from the shared
+    cache.
+    """
+
+    job_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    operation: Callable[[], Awaitable[str | None]] | None = field(repr=False)
+    status: ChatJobStatus = ChatJobStatus.QUEUED
+    answer: str | None = None
+    error: str | None = None
+    created_at: float | None = field(default_factory=time.monotonic)
+    started_at: float | None = None
+    finished_at: float | None = None
+    finished: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+
+class ChatJobService:
+    """
+    Bounded in-process worker pool for asynchronous chat requests.
+
+    Submitted jobs wait in a FIFO queue until one of a fixed number of
+    workers runs them, so clients do not hold a connection open while the
+    workflow waits on slow upstreams. Results can be polled, optionally
+    waiting for the job to finish, until they expire after the result TTL.
+
+    With a shared cache, every status change is also stored there under the
+    job id, so a job submitted to one worker process can be polled through
+    any other.
+    """
+
+    def __init__(
+        self,
+        worker_count: int,
+        max_queued_jobs: int,
+        result_ttl_seconds: float,
+        shared_cache: CacheBackend | None = None,
+        shared_poll_interval_seconds: float = 0.25,
+    ) -> None:
+        """
+        Initialize the chat job service.
+
+        Args:
+            worker_count: Number of jobs run at once
+            max_queued_jobs: Maximum number of jobs waiting for a worker
+            result_ttl_seconds: Time a finished job stays available for polling
+            shared_cache: Optional cache shared between worker processes
+            shared_poll_interval_seconds: Interval at which the shared cache is
+                polled while waiting for a job of another process
+        """
+        self._worker_count = worker_count
+        self._max_queued_jobs = max_queued_jobs
+        self._result_ttl_seconds = result_ttl_seconds
+        self._shared_cache = shared_cache
+        self._shared_poll_interval_seconds = shared_poll_interval_seconds
+
+        self._queue: asyncio.Queue[ChatJob] = asyncio.Queue()
+        self._jobs: dict[str, ChatJob] = {}
+        self._expirations: deque[tuple[float, str]] = deque()
+        self._worker_tasks: list[asyncio.Task] = []
+        self._running_jobs = 0
+
+        self._submitted = 0
+        self._succeeded = 0
+        self._failed = 0
+        self._rejected = 0
+        self._evicted = 0
+        self._shared_lookups = 0
+        self._wait_latency = LatencyTracker()
+        self._run_latency = LatencyTracker()
+
+    def start(self) -> None:
+        """Start the worker tasks."""
+        if not self._worker_tasks:
+            self._worker_tasks = [
+                asyncio.create_task(self._run_worker())
+                for _ in range(self._worker_count)
+            ]
+
+    async def stop(self) -> None:
+        """Stop the worker tasks, cancelling the jobs they are running."""
+        for worker_task in self._worker_tasks:
+            worker_task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+    async def submit(self, operation: Callable[[], Awaitable[str | None]]) -> ChatJob:
+        """
+        Queue a chat request for asynchronous execution.
+
+        Args:
+            operation: Factory running the request and returning its answer
+
+        Returns:
+            Queued job
+
+        Raises:
+            AdmissionRejectedError: 429 if the job queue is full
+        """
+        self._evict_expired()
+        if self._queue.qsize() >= self._max_queued_jobs:
+            self._rejected += 1
+            raise AdmissionRejectedError(429, "Too many queued jobs", 1)
+
+        job = ChatJob(operation=operation)
+        self._jobs[job.job_id] = job
+        await self._store_shared(job)
+        self._queue.put_nowait(job)
+        self._submitted += 1
+        return job
+
+    async def get(self, job_id: str, wait_seconds: float = 0.0) -> ChatJob | None:
+        """
+        Get a job, optionally waiting for it to finish.
+
+        Jobs of this process are read from memory; others are looked up in
+        the shared cache, which is polled while waiting.
+
+        Args:
+            job_id: Identifier returned on submission
+            wait_seconds: Maximum time to wait for an unfinished job
+
+        Returns:
+            Job in its current state, or None if it is unknown or expired
+        """
+        self._evict_expired()
+        job = self._jobs.get(job_id)
+        if job is None:
+            return await self._get_shared(job_id, wait_seconds)
+        if wait_seconds <= 0:
+            return job
+
+        try:
+            async with asyncio.timeout(wait_seconds):
+                await job.finished.wait()
+        except TimeoutError:
+            pass
+        return job
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get job statistics.
+
+        Returns:
+            Queue depth, running and stored jobs, outcome counters and the
+            time jobs spent waiting for a worker and running
+        """
+        return {
+            "workers": self._worker_count,
+            "queue_depth": self._queue.qsize(),
+            "running": self._running_jobs,
+            "stored_jobs": len(self._jobs),
+            "submitted": self._submitted,
+            "succeeded": self._succeeded,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "evicted": self._evicted,
+            "shared_lookups": self._shared_lookups,
+            "wait_seconds": self._wait_latency.get_stats(),
+            "run_seconds": self._run_latency.get_stats(),
+        }
+
+    async def _run_worker(self) -> None:
+        """Run queued jobs one after another until cancelled."""
+        while True:
+            job = await self._queue.get()
+            job.status = ChatJobStatus.RUNNING
+            job.started_at = time.monotonic()
+            self._wait_latency.record(job.started_at - job.created_at)
+            self._running_jobs += 1
+            try:
+                await self._store_shared(job)
+                job.answer = await job.operation()
+                job.status = ChatJobStatus.SUCCEEDED
+                self._succeeded += 1
+            except Exception as exc:
+                job.error = str(exc) or type(exc).__name__
+                job.status = ChatJobStatus.FAILED
+                self._failed += 1
+            except asyncio.CancelledError:
+                job.error = "Job cancelled"
+                job.status = ChatJobStatus.FAILED
+                self._failed += 1
+                raise
+            finally:
+                self._running_jobs -= 1
+                self._finish(job)
+                self._queue.task_done()
+                # Also stored on cancellation, so that other workers do not
+                # report the job running until its shared entry expires.
+                await self._store_shared(job)
+
+    def _finish(self, job: ChatJob) -> None:
+        """
+        Mark a job finished and schedule the expiry of its result.
+
+        Args:
+            job: Job whose operation completed, failed or was cancelled
+        """
+        job.finished_at = time.monotonic()
+        job.operation = None
+        self._run_latency.record(job.finished_at - job.started_at)
+        self._expirations.append(
+            (job.finished_at + self._result_ttl_seconds, job.job_id)
+        )
+        job.finished.set()
+
+    def _evict_expired(self) -> None:
+        """Drop finished jobs whose result TTL has passed."""
+        now = time.monotonic()
+        while self._expirations and self._expirations[0][0] <= now:
+            _, job_id = self._expirations.popleft()
+            if self._jobs.pop(job_id, None) is not None:
+                self._evicted += 1
+
+    async def _store_shared(self, job: ChatJob) -> None:
+        """
+        Store the current state of a job in the shared cache, if configured.
+
+        Args:
+            job: Job whose status changed
+        """
+        if self._shared_cache is None:
+            return
+
+        await self._shared_cache.set(
+            f"chat_job:{job.job_id}",
+            {"status": job.status.value, "answer": job.answer, "error": job.error},
+            self._result_ttl_seconds,
+        )
+
+    async def _get_shared(self, job_id: str, wait_seconds: float) -> ChatJob | None:
+        """
+        Get a job of another process from the shared cache.
+
+        Args:
+            job_id: Identifier returned on submission
+            wait_seconds: Maximum time to poll for an unfinished job
+
+        Returns:
+            Snapshot of the job, or None if it is unknown, expired or no
+            shared cache is configured
+        """
+        if self._shared_cache is None:
+            return None
+
+        self._shared_lookups += 1
+        deadline = time.monotonic() + wait_seconds
+        while True:
+            job_data = await self._shared_cache.get(f"chat_job:{job_id}")
+            if job_data is None:
+                return None
+
+            status = ChatJobStatus(job_data["status"])
+            remaining_seconds = deadline - time.monotonic()
+            if (
+                status in (ChatJobStatus.SUCCEEDED, ChatJobStatus.FAILED)
+                or remaining_seconds <= 0
+            ):
+                return ChatJob(
+                    job_id=job_id,
+                    operation=None,
+                    status=status,
+                    answer=job_data["answer"],
+                    error=job_data["error"],
+                    created_at=None,
+                )
+            await asyncio.sleep(
+                min(self._shared_poll_interval_seconds, remaining_seconds)
+            )
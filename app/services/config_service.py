@@ -15,7 +15,109 @@ class AppConfig:
     AZURE_OPENAI_API_VERSION: str = "2024-12-01-preview"
     AZURE_OPENAI_KEY: str
     TOP_P: float = 0.9
+    LLM_TIMEOUT_SECONDS: float = 60.0
+    LLM_MAX_RETRIES: int = 2
+    ROUTING_LLM_DEPLOYMENT: str = ""
+    ROUTING_LLM_MAX_TOKENS: int = 8
+    ROUTING_LLM_TEMPERATURE: float = 0.0
+    ROUTING_LLM_TIMEOUT_SECONDS: float = 10.0
+    ROUTING_LLM_MAX_RETRIES: int = 1
+    TOOL_PLANNING_LLM_DEPLOYMENT: str = ""
+    TOOL_PLANNING_LLM_MAX_TOKENS: int = 150
+    TOOL_PLANNING_LLM_TEMPERATURE: float = 0.0
+    TOOL_PLANNING_LLM_TIMEOUT_SECONDS: float = 20.0
+    TOOL_PLANNING_LLM_MAX_RETRIES: int = 1
     TAVILY_API_KEY: str
+    ROUTE_CLASSIFIER_ENABLED: bool = False
+    ROUTE_CLASSIFIER_CONFIDENCE_THRESHOLD: float = 0.8
+    ROUTE_CLASSIFIER_MIN_PRECISION: float = 1.0
+    SPORTS_DATA_CACHE_MAX_ENTRIES: int = 2048
+    SPORTS_DATA_SEARCH_TTL_SECONDS: float = 3600.0
+    SPORTS_DATA_LOOKUP_TTL_SECONDS: float = 21600.0
+    SPORTS_DATA_NEGATIVE_TTL_SECONDS: float = 60.0
+    SPORTS_DATA_STALE_TTL_SECONDS: float = 86400.0
+    TEAM_INDEX_ENABLED: bool = True
+    TEAM_INDEX_REFRESH_INTERVAL_SECONDS: float = 21600.0
+    TEAM_INDEX_LOAD_CONCURRENCY: int = 4
+    TEAM_INDEX_LEAGUES: str = ""
+    TEAM_INDEX_MAX_REQUESTS_PER_MINUTE: float = 30.0
+    FIXTURES_STORE_ENABLED: bool = True
+    FIXTURES_REFRESH_INTERVAL_SECONDS: float = 900.0
+    FIXTURES_LOAD_CONCURRENCY: int = 4
+    FIXTURES_LEAGUES: str = (
+        "English Premier League,Spanish La Liga,German Bundesliga,"
+        "Italian Serie A,French Ligue 1"
+    )
+    FIXTURES_SEASON: str = ""
+    FOOTBALL_AGENT_MODE: str = "single_shot"
+    FOOTBALL_TOOL_TEAM_FIELDS: str = ""
+    ANSWER_CACHE_ENABLED: bool = True
+    ANSWER_CACHE_MAX_ENTRIES: int = 4096
+    ANSWER_CACHE_FOOTBALL_DATA_TTL_SECONDS: float = 21600.0
+    ANSWER_CACHE_WEB_SEARCH_TTL_SECONDS: float = 300.0
+    ANSWER_CACHE_DIRECT_CONVERSATION_TTL_SECONDS: float = 86400.0
+    SPECULATIVE_EXECUTION_RATIO: float = 0.0
+    SPECULATIVE_PRIOR_THRESHOLD: float = 0.3
+    CONTEXT_BUILDER_ENABLED: bool = True
+    CONTEXT_TOKENIZER_ENCODING: str = "cl100k_base"
+    CONTEXT_TOKEN_BUDGET_DEFAULT: int = 1000
+    CONTEXT_TOKEN_BUDGET_FOOTBALL_DATA: int = 600
+    CONTEXT_TOKEN_BUDGET_WEB_SEARCH: int = 1000
+    CONTEXT_TOKEN_BUDGET_COMBINED: int = 1400
+    ANSWER_SYNTHESIZER_ENABLED: bool = True
+    BATCH_MAX_CONCURRENCY: int = 8
+    CHAT_JOBS_ENABLED: bool = True
+    CHAT_JOB_WORKERS: int = 8
+    CHAT_JOB_MAX_QUEUED: int = 1000
+    CHAT_JOB_RESULT_TTL_SECONDS: float = 600.0
+    CHAT_JOB_MAX_WAIT_SECONDS: float = 30.0
+    PROFILING_ENABLED: bool = False
+    PROFILING_SAMPLE_INTERVAL_SECONDS: float = 0.005
+    PROFILING_MIN_INTERVAL_SECONDS: float = 10.0
+    PROFILING_MAX_DURATION_SECONDS: float = 60.0
+    EVENT_LOOP_MONITOR_ENABLED: bool = True
+    EVENT_LOOP_MONITOR_INTERVAL_SECONDS: float = 0.05
+    EVENT_LOOP_STALL_THRESHOLD_SECONDS: float = 0.1
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 40
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 60.0
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    HTTP_POOL_TIMEOUT_SECONDS: float = 5.0
+    HTTP2_ENABLED: bool = True
+    SHARED_CACHE_BACKEND: str = "none"
+    SHARED_CACHE_SQLITE_PATH: str = "/tmp/langgraph-soccer-agent-cache.sqlite3"
+    SHARED_CACHE_SQLITE_MAX_ENTRIES: int = 100000
+    SHARED_CACHE_REMOTE_URL: str = "http://localhost:8090"
+    WEB_SEARCH_CACHE_MAX_ENTRIES: int = 1024
+    WEB_SEARCH_CACHE_TTL_SECONDS: float = 1800.0
+    WEB_SEARCH_CACHE_TIME_SENSITIVE_TTL_SECONDS: float = 120.0
+    WEB_SEARCH_MAX_RESULTS: int = 5
+    WEB_SEARCH_RESULT_MAX_CHARACTERS: int = 700
+    SESSIONS_ENABLED: bool = True
+    SESSION_CHECKPOINT_PATH: str = "/tmp/langgraph-soccer-agent-sessions.sqlite3"
+    SESSION_TTL_SECONDS: float = 86400.0
+    SESSION_SUMMARY_MAX_TURNS: int = 6
+    SESSION_SUMMARY_MAX_CHARACTERS: int = 200
+    SESSION_CONTEXT_MAX_MESSAGES: int = 8
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_MAX_IN_FLIGHT: int = 64
+    ADMISSION_MIN_IN_FLIGHT: int = 4
+    ADMISSION_MAX_QUEUE: int = 128
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 5.0
+    ADMISSION_TARGET_LATENCY_SECONDS: float = 0.0
+    UPSTREAM_CONCURRENCY_LIMITS: str = "azure_openai=32,tavily=16,thesportsdb=16"
+    REQUEST_DEADLINE_SECONDS: float = 30.0
+    REQUEST_DEADLINE_ANSWER_RESERVE_SECONDS: float = 10.0
+    HEDGING_ENABLED: bool = True
+    HEDGE_QUANTILE: float = 0.95
+    HEDGE_MIN_DELAY_SECONDS: float = 0.05
+    HEDGE_MAX_DELAY_SECONDS: float = 2.0
+    HEDGE_MIN_SAMPLES: int = 20
+    SERVER_RUNTIME_PROFILE: str = "default"
+    SERVER_BIND: str = "0.0.0.0:8080"
+    SERVER_WORKERS: int = 0
+    SERVER_BACKLOG: int = 4096
+    SERVER_KEEPALIVE_SECONDS: int = 75
 
     def __init__(self, env):
         load_dotenv()
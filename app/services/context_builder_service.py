@@ -0,0 +1,437 @@
+import asyncio
+import functools
+import json
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+import tiktoken
+from langchain_core.messages import BaseMessage
+
+from app.domain.enums import WorkflowRouteDecision
+from app.domain.models.conversation_state import ConversationState
+from app.services.config_service import AppConfig
+from app.utils.text_similarity import NearDuplicateFilter
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_SENTENCE_PATTERN = re.compile(r"(?<=[.!?])\s+")
+_TEAM_FACT_FIELDS: dict[str, str] = {
+    "team_name": "Team",
+    "alternate_name": "Also known as",
+    "formation_year": "Founded",
+    "league_name": "League",
+    "stadium_name": "Stadium",
+    "stadium_location": "Stadium location",
+    "official_website": "Website",
+}
+_DESCRIPTION_CHUNK_WORDS = 60
+_NEAR_DUPLICATE_THRESHOLD = 0.8
+_SHINGLE_SIZE = 3
+_CHARACTERS_PER_TOKEN = 4
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+
+@dataclass(slots=True)
+class ContextPassage:
+    """Piece of retrieved context considered for the response prompt."""
+
+    text: str
+    is_fact: bool = False
+    score: float = 0.0
+
+
+@functools.lru_cache(maxsize=4)
+def _load_encoding(encoding_name: str) -> tiktoken.Encoding | None:
+    """
+    Load and cache a tiktoken encoding.
+
+    Args:
+        encoding_name: Name of the tiktoken encoding
+
+    Returns:
+        Encoding instance, or None if it cannot be loaded (e.g. offline)
+    """
+    try:
+        return tiktoken.get_encoding(encoding_name)
+    except (OSError, ValueError):
+        return None
+
+
+class ContextBuilderService:
+    """
+    Builds a compact, token-budgeted context for the response prompt.
+
+    Extracts only answer-relevant team fields, splits long descriptions and
+    web results into passages, drops duplicate and near-duplicate snippets,
+    ranks passages by lexical relevance to the question and keeps the best
+    ones within the token budget of the current route.
+    """
+
+    def __init__(self, app_config: AppConfig) -> None:
+        """
+        Initialize the context builder.
+
+        Args:
+            app_config: Application configuration containing token budgets
+        """
+        self._encoding_name = app_config.CONTEXT_TOKENIZER_ENCODING
+        self._encoding: tiktoken.Encoding | None = None
+        self._default_token_budget = app_config.CONTEXT_TOKEN_BUDGET_DEFAULT
+        self._route_token_budgets = {
+            WorkflowRouteDecision.FOOTBALL_DATA.value: app_config.CONTEXT_TOKEN_BUDGET_FOOTBALL_DATA,
+            WorkflowRouteDecision.WEB_SEARCH.value: app_config.CONTEXT_TOKEN_BUDGET_WEB_SEARCH,
+            WorkflowRouteDecision.COMBINED_APPROACH.value: app_config.CONTEXT_TOKEN_BUDGET_COMBINED,
+        }
+
+        self._built_contexts = 0
+        self._raw_characters = 0
+        self._context_tokens = 0
+        self._dropped_passages = 0
+
+    async def load_tokenizer(self) -> None:
+        """
+        Load the tokenizer encoding without blocking the event loop.
+
+        The first load may download and parse the encoding file, so the app
+        lifespan runs it in a worker thread before requests are served.
+        """
+        self._encoding = await asyncio.to_thread(_load_encoding, self._encoding_name)
+
+    def build_context(self, conversation_state: ConversationState) -> str:
+        """
+        Build the prompt context for the current conversation state.
+
+        Args:
+            conversation_state: Current conversation state with retrieved context
+
+        Returns:
+            Context text within the route's token budget, empty if nothing was retrieved
+        """
+        passages = self._deduplicate_passages(
+            [
+                passage
+                for context_message in conversation_state.retrieved_context
+                for passage in self._extract_passages(context_message)
+            ]
+        )
+        if not passages:
+            return ""
+
+        self._score_passages(conversation_state.user_question, passages)
+        passages.sort(
+            key=lambda passage: (passage.is_fact, passage.score), reverse=True
+        )
+
+        token_budget = self._route_token_budgets.get(
+            conversation_state.current_route_decision, self._default_token_budget
+        )
+        selected_texts: list[str] = []
+        used_tokens = 0
+        for passage in passages:
+            remaining_tokens = token_budget - used_tokens
+            if remaining_tokens <= 0:
+                self._dropped_passages += 1
+                continue
+
+            passage_tokens = self._count_tokens(passage.text)
+            if passage_tokens <= remaining_tokens:
+                selected_texts.append(passage.text)
+                used_tokens += passage_tokens
+            else:
+                selected_texts.append(self._truncate(passage.text, remaining_tokens))
+                used_tokens = token_budget
+
+        self._built_contexts += 1
+        self._context_tokens += used_tokens
+        return "\n\n".join(selected_texts)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get context building statistics.
+
+        Returns:
+            Number of built contexts, average context tokens and dropped passages
+        """
+        return {
+            "built_contexts": self._built_contexts,
+            "avg_context_tokens": self._context_tokens / self._built_contexts
+            if self._built_contexts
+            else 0.0,
+            "raw_context_characters": self._raw_characters,
+            "dropped_passages": self._dropped_passages,
+            "tokenizer_loaded": self._encoding is not None,
+        }
+
+    def _extract_passages(
+        self, context_message: dict[str, Any] | BaseMessage
+    ) -> list[ContextPassage]:
+        """
+        Convert one retrieved context message into passages.
+
+        Args:
+            context_message: Tool message produced by a data agent
+
+        Returns:
+            Passages found in the message
+        """
+        raw_content = (
+            context_message.content
+            if isinstance(context_message, BaseMessage)
+            else context_message.get("content", "")
+        )
+        if not isinstance(raw_content, str):
+            raw_content = json.dumps(raw_content, ensure_ascii=False, default=str)
+        self._raw_characters += len(raw_content)
+
+        try:
+            payload = json.loads(raw_content)
+        except ValueError:
+            return [ContextPassage(text=raw_content)] if raw_content.strip() else []
+
+        passages: list[ContextPassage] = []
+        self._collect_passages(payload, passages)
+        return passages
+
+    def _collect_passages(self, payload: Any, passages: list[ContextPassage]) -> None:
+        """
+        Walk a decoded tool payload and collect passages from known shapes.
+
+        Args:
+            payload: Decoded JSON payload or a nested part of it
+            passages: Output list the passages are appended to
+        """
+        if isinstance(payload, list):
+            for item in payload:
+                self._collect_passages(item, passages)
+        elif isinstance(payload, dict):
+            if "home_team_name" in payload:
+                passages.append(self._extract_match_passage(payload))
+            elif "rank" in payload and "points" in payload:
+                passages.append(self._extract_standing_passage(payload))
+            elif "team_name" in payload:
+                passages.extend(self._extract_team_passages(payload))
+            elif "url" in payload and ("content" in payload or "title" in payload):
+                passages.append(self._extract_web_passage(payload))
+            elif "results" in payload:
+                self._collect_passages(payload["results"], passages)
+            elif "output" in payload:
+                self._collect_passages(payload["output"], passages)
+        elif isinstance(payload, str) and payload.strip():
+            try:
+                self._collect_passages(json.loads(payload), passages)
+            except ValueError:
+                passages.append(ContextPassage(text=payload.strip()))
+
+    @staticmethod
+    def _extract_team_passages(team_data: dict[str, Any]) -> list[ContextPassage]:
+        """
+        Extract answer-relevant facts and description chunks of a team.
+
+        Args:
+            team_data: Team dictionary as produced by the football tools
+
+        Returns:
+            One fact passage followed by description chunk passages
+        """
+        facts = "; ".join(
+            f"{label}: {team_data[field]}"
+            for field, label in _TEAM_FACT_FIELDS.items()
+            if team_data.get(field)
+        )
+        passages = [ContextPassage(text=facts, is_fact=True)] if facts else []
+
+        description_words: list[str] = []
+        for sentence in _SENTENCE_PATTERN.split(
+            team_data.get("team_description") or ""
+        ):
+            description_words.extend(sentence.split())
+            if len(description_words) >= _DESCRIPTION_CHUNK_WORDS:
+                passages.append(
+                    ContextPassage(
+                        text=f"{team_data['team_name']}: {' '.join(description_words)}"
+                    )
+                )
+                description_words = []
+        if description_words:
+            passages.append(
+                ContextPassage(
+                    text=f"{team_data['team_name']}: {' '.join(description_words)}"
+                )
+            )
+
+        return passages
+
+    @staticmethod
+    def _extract_match_passage(match_data: dict[str, Any]) -> ContextPassage:
+        """
+        Extract a fact passage from a scheduled or played match.
+
+        Args:
+            match_data: Match dictionary as produced by the fixture tools
+
+        Returns:
+            Fact passage with the teams, score if played, kickoff and venue
+        """
+        if match_data.get("home_score") is not None:
+            pairing = (
+                f"{match_data['home_team_name']} {match_data['home_score']}-"
+                f"{match_data['away_score']} {match_data['away_team_name']}"
+            )
+        else:
+            pairing = (
+                f"{match_data['home_team_name']} vs {match_data['away_team_name']}"
+            )
+        details = [
+            detail
+            for detail in (
+                match_data.get("league_name"),
+                f"kickoff {match_data['kickoff']} UTC"
+                if match_data.get("kickoff")
+                else None,
+                f"at {match_data['venue']}" if match_data.get("venue") else None,
+            )
+            if detail
+        ]
+        return ContextPassage(text=f"{pairing} ({', '.join(details)})", is_fact=True)
+
+    @staticmethod
+    def _extract_standing_passage(standing_data: dict[str, Any]) -> ContextPassage:
+        """
+        Extract a fact passage from a league table row.
+
+        Args:
+            standing_data: Table row dictionary as produced by the table tool
+
+        Returns:
+            Fact passage with the rank, points and record of the team
+        """
+        text = (
+            f"{standing_data['rank']}. {standing_data['team_name']}: "
+            f"{standing_data['points']} pts from {standing_data.get('played', 0)} played "
+            f"({standing_data.get('wins', 0)}W {standing_data.get('draws', 0)}D "
+            f"{standing_data.get('losses', 0)}L, "
+            f"goal difference {standing_data.get('goal_difference', 0)})"
+        )
+        return ContextPassage(text=text, is_fact=True)
+
+    @staticmethod
+    def _extract_web_passage(web_result: dict[str, Any]) -> ContextPassage:
+        """
+        Extract a passage from a web search result.
+
+        Args:
+            web_result: Single web search result
+
+        Returns:
+            Passage combining the title, snippet and source URL
+        """
+        title = web_result.get("title") or ""
+        content = web_result.get("content") or ""
+        return ContextPassage(text=f"{title}: {content} (source: {web_result['url']})")
+
+    @staticmethod
+    def _deduplicate_passages(passages: list[ContextPassage]) -> list[ContextPassage]:
+        """
+        Drop exact and near-duplicate passages.
+
+        Args:
+            passages: Candidate passages in retrieval order
+
+        Returns:
+            Passages whose word shingles do not overlap heavily with an earlier one
+        """
+        near_duplicate_filter = NearDuplicateFilter(
+            _NEAR_DUPLICATE_THRESHOLD, _SHINGLE_SIZE
+        )
+        return [
+            passage
+            for passage in passages
+            if not near_duplicate_filter.is_duplicate(passage.text)
+        ]
+
+    @staticmethod
+    def _score_passages(question: str, passages: list[ContextPassage]) -> None:
+        """
+        Score passages by BM25 relevance to the question.
+
+        Args:
+            question: Question asked by the user
+            passages: Passages to score in place
+        """
+        query_terms = set(_TOKEN_PATTERN.findall(question.lower()))
+        passage_terms = [
+            Counter(_TOKEN_PATTERN.findall(passage.text.lower()))
+            for passage in passages
+        ]
+        average_length = sum(sum(terms.values()) for terms in passage_terms) / len(
+            passage_terms
+        )
+        document_frequencies = Counter(
+            term for terms in passage_terms for term in query_terms & terms.keys()
+        )
+
+        for passage, terms in zip(passages, passage_terms):
+            passage_length = sum(terms.values())
+            score = 0.0
+            for term in query_terms & terms.keys():
+                inverse_frequency = math.log(
+                    1
+                    + (len(passages) - document_frequencies[term] + 0.5)
+                    / (document_frequencies[term] + 0.5)
+                )
+                term_frequency = terms[term]
+                score += inverse_frequency * (
+                    term_frequency
+                    * (_BM25_K1 + 1)
+                    / (
+                        term_frequency
+                        + _BM25_K1
+                        * (1 - _BM25_B + _BM25_B * passage_length / average_length)
+                    )
+                )
+            passage.score = score
+
+    def _count_tokens(self, text: str) -> int:
+        """
+        Count prompt tokens of a text.
+
+        Args:
+            text: Text to measure
+
+        Returns:
+            Token count, estimated from characters when no tokenizer is available
+        """
+        encoding = self._get_encoding()
+        if encoding is None:
+            return math.ceil(len(text) / _CHARACTERS_PER_TOKEN)
+        return len(encoding.encode(text))
+
+    def _get_encoding(self) -> tiktoken.Encoding | None:
+        """
+        Get the tokenizer encoding, loading it if the lifespan has not.
+
+        Returns:
+            Encoding instance, or None if it cannot be loaded
+        """
+        if self._encoding is None:
+            self._encoding = _load_encoding(self._encoding_name)
+        return self._encoding
+
+    def _truncate(self, text: str, max_tokens: int) -> str:
+        """
+        Truncate a text to a number of tokens.
+
+        Args:
+            text: Text to truncate
+            max_tokens: Maximum number of tokens to keep
+
+        Returns:
+            Truncated text
+        """
+        encoding = self._get_encoding()
+        if encoding is None:
+            return text[: max_tokens * _CHARACTERS_PER_TOKEN]
+        return encoding.decode(encoding.encode(text)[:max_tokens])
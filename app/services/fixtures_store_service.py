@@ -0,0 +1,525 @@
+import asyncio
+import logging
+import re
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+from httpx import HTTPError
+
+from app.domain.models.fixture_models import MatchEvent, StandingRow
+from app.services.sports_data_service import SportsDataService
+from app.services.team_index_service import TeamIndexService, normalize_team_name
+
+logger = logging.getLogger(__name__)
+
+_FIXTURE_QUESTION_PATTERN = re.compile(
+    r"\b(plays? next|playing next|next (?:match|game|fixture|opponent)s?|"
+    r"upcoming (?:match|game|fixture)e?s?|fixtures?|schedule|kick[- ]?off|"
+    r"last (?:match|game|result)s?|(?:latest|recent) (?:results?|match(?:es)?|games?)|"
+    r"(?:league )?table|standings?|top of the league)\b",
+    re.IGNORECASE,
+)
+_MAX_ENTITY_NGRAM = 4
+_DATASET_UPCOMING = "upcoming"
+_DATASET_RESULTS = "results"
+_DATASET_TABLE = "table"
+
+
+def is_fixture_question(question: str) -> bool:
+    """
+    Check whether a question asks for fixtures, results or a league table.
+
+    Args:
+        question: Raw user question
+
+    Returns:
+        True if the question has fixture intent
+    """
+    return _FIXTURE_QUESTION_PATTERN.search(question) is not None
+
+
+class FixturesStoreService:
+    """
+    Local in-memory store of league fixtures, results and tables.
+
+    A background task polls TheSportsDB once per interval for the upcoming
+    matches, latest results and table of every configured league, and
+    re-indexes only the datasets whose content changed. Questions about when
+    a team plays next, its latest results or a league table are then served
+    from memory instead of reaching a web search for every user.
+    """
+
+    def __init__(
+        self,
+        sports_data_service: SportsDataService,
+        refresh_interval_seconds: float,
+        load_concurrency: int = 4,
+        league_names: Iterable[str] | None = None,
+        season: str = "",
+        team_index: TeamIndexService | None = None,
+    ) -> None:
+        """
+        Initialize the fixtures store.
+
+        Args:
+            sports_data_service: Service used to fetch leagues, matches and tables
+            refresh_interval_seconds: Delay between background refreshes
+            load_concurrency: Maximum number of datasets fetched concurrently
+            league_names: Optional fixed set of leagues instead of all soccer leagues
+            season: Season of the league tables; the current season if empty
+            team_index: Optional team index used to resolve team aliases
+        """
+        self._sports_data_service = sports_data_service
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._load_semaphore = asyncio.Semaphore(load_concurrency)
+        self._configured_league_names = tuple(league_names or ())
+        self._season = season
+        self._team_index = team_index
+
+        self._league_names_by_alias: dict[str, str] = {}
+        self._datasets: dict[tuple[str, str], list[Any]] = {}
+        self._dataset_versions: dict[tuple[str, str], str | None] = {}
+        self._upcoming_by_team_id: dict[str, list[MatchEvent]] = {}
+        self._results_by_team_id: dict[str, list[MatchEvent]] = {}
+        self._team_ids_by_name: dict[str, set[str]] = {}
+
+        self._refresh_task: asyncio.Task | None = None
+        self._is_ready = False
+        self._refresh_count = 0
+        self._reindexed_datasets = 0
+        self._unchanged_datasets = 0
+        self._failed_datasets = 0
+        self._failed_refreshes = 0
+        self._routed_questions = 0
+        self._answered_lookups = 0
+        self._unresolved_lookups = 0
+
+    @property
+    def is_ready(self) -> bool:
+        """
+        Whether the initial load has completed.
+
+        Returns:
+            True once the store can serve lookups
+        """
+        return self._is_ready
+
+    def start_background_refresh(self) -> None:
+        """Start the background task that loads and periodically refreshes the store."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._run_refresh_loop())
+
+    async def stop(self) -> None:
+        """Stop the background refresh task."""
+        if self._refresh_task is None:
+            return
+
+        self._refresh_task.cancel()
+        try:
+            await self._refresh_task
+        except asyncio.CancelledError:
+            pass
+        self._refresh_task = None
+
+    async def refresh(self) -> None:
+        """
+        Refresh the store from the API.
+
+        Fetches the league list, re-indexes datasets whose content changed and
+        drops leagues that are no longer configured.
+        """
+        leagues = await self._sports_data_service.list_soccer_league_details()
+        if self._configured_league_names:
+            leagues = [
+                league
+                for league in leagues
+                if league["strLeague"] in self._configured_league_names
+            ]
+        if not leagues:
+            return
+
+        league_ids = {league["strLeague"]: league["idLeague"] for league in leagues}
+        for dataset_key in list(self._datasets):
+            if dataset_key[0] not in league_ids:
+                del self._datasets[dataset_key]
+                self._dataset_versions.pop(dataset_key, None)
+        self._league_names_by_alias = self._build_league_aliases(leagues)
+
+        changes = await asyncio.gather(
+            *(
+                self._refresh_dataset(league_name, league_id, dataset)
+                for league_name, league_id in league_ids.items()
+                for dataset in (_DATASET_UPCOMING, _DATASET_RESULTS, _DATASET_TABLE)
+            )
+        )
+        if any(changes) or not self._is_ready:
+            self._rebuild_team_lookups()
+
+        self._is_ready = True
+        self._refresh_count += 1
+
+    def get_upcoming_matches(self, team_name: str, limit: int = 3) -> list[MatchEvent]:
+        """
+        Get the next matches of a team that have not kicked off yet.
+
+        Args:
+            team_name: Full, partial or alternate team name
+            limit: Maximum number of matches to return
+
+        Returns:
+            Matches ordered by kickoff, earliest first
+        """
+        now = _get_utc_timestamp()
+        matches = self._collect_team_matches(team_name, self._upcoming_by_team_id)
+        return sorted(
+            (
+                match
+                for match in matches
+                if match.kickoff is None or match.kickoff >= now
+            ),
+            key=lambda match: match.kickoff or "",
+        )[:limit]
+
+    def get_recent_results(self, team_name: str, limit: int = 3) -> list[MatchEvent]:
+        """
+        Get the latest played matches of a team.
+
+        Args:
+            team_name: Full, partial or alternate team name
+            limit: Maximum number of matches to return
+
+        Returns:
+            Matches ordered by kickoff, latest first
+        """
+        matches = self._collect_team_matches(team_name, self._results_by_team_id)
+        return sorted(matches, key=lambda match: match.kickoff or "", reverse=True)[
+            :limit
+        ]
+
+    def get_league_table(self, league_name: str) -> list[StandingRow]:
+        """
+        Get the table of a league.
+
+        Args:
+            league_name: League name or one of its alternate names
+
+        Returns:
+            Table rows ordered by rank, or an empty list if the league is unknown
+        """
+        resolved_league_name = self._resolve_league_name(league_name)
+        standing_rows = (
+            self._datasets.get((resolved_league_name, _DATASET_TABLE))
+            if resolved_league_name is not None
+            else None
+        )
+        self._record_lookup(bool(standing_rows))
+        return list(standing_rows or [])
+
+    def can_answer(self, question: str) -> bool:
+        """
+        Check whether a question asks for fixtures, results or a table held locally.
+
+        Args:
+            question: Raw user question
+
+        Returns:
+            True if the question has fixture intent and names a known team or league
+        """
+        if not self._is_ready or not is_fixture_question(question):
+            return False
+
+        tokens = normalize_team_name(question).split()
+        for size in range(min(_MAX_ENTITY_NGRAM, len(tokens)), 0, -1):
+            for start in range(len(tokens) - size + 1):
+                ngram = " ".join(tokens[start : start + size])
+                if self.is_known_entity(ngram):
+                    self._routed_questions += 1
+                    return True
+        return False
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get store statistics.
+
+        Returns:
+            Store size, refresh counters, lookup counters and readiness
+        """
+        lookups = self._answered_lookups + self._unresolved_lookups
+        return {
+            "ready": self._is_ready,
+            "leagues": len({league_name for league_name, _ in self._datasets}),
+            "teams": len(self._upcoming_by_team_id.keys() | self._results_by_team_id),
+            "upcoming_matches": sum(
+                len(events)
+                for (_, dataset), events in self._datasets.items()
+                if dataset == _DATASET_UPCOMING
+            ),
+            "refresh_count": self._refresh_count,
+            "reindexed_datasets": self._reindexed_datasets,
+            "unchanged_datasets": self._unchanged_datasets,
+            "failed_datasets": self._failed_datasets,
+            "failed_refreshes": self._failed_refreshes,
+            "routed_questions": self._routed_questions,
+            "answered_lookups": self._answered_lookups,
+            "unresolved_lookups": self._unresolved_lookups,
+            "answer_ratio": self._answered_lookups / lookups if lookups else 0.0,
+        }
+
+    async def _run_refresh_loop(self) -> None:
+        """
+        Load the store and keep refreshing it at the configured interval.
+
+        A failed refresh is logged and counted; the loop keeps running and
+        the store keeps serving the datasets of the last successful refresh.
+        """
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                self._failed_refreshes += 1
+                logger.exception("Fixtures store refresh failed")
+            await asyncio.sleep(self._refresh_interval_seconds)
+
+    async def _refresh_dataset(
+        self, league_name: str, league_id: str, dataset: str
+    ) -> bool:
+        """
+        Re-fetch one dataset of a league and store it if its content changed.
+
+        Args:
+            league_name: Exact name of the league
+            league_id: TheSportsDB ID of the league
+            dataset: Dataset kind, upcoming matches, results or table
+
+        Returns:
+            True if the stored dataset changed
+        """
+        dataset_key = (league_name, dataset)
+        async with self._load_semaphore:
+            try:
+                records, version = await self._fetch_dataset(
+                    league_id, dataset, self._dataset_versions.get(dataset_key)
+                )
+            except HTTPError:
+                self._failed_datasets += 1
+                return False
+
+        self._dataset_versions[dataset_key] = version
+        if records is None:
+            self._unchanged_datasets += 1
+            return False
+
+        self._datasets[dataset_key] = records
+        self._reindexed_datasets += 1
+        return True
+
+    async def _fetch_dataset(
+        self, league_id: str, dataset: str, previous_version: str | None
+    ) -> tuple[list[Any] | None, str | None]:
+        """
+        Fetch one dataset of a league from the API.
+
+        Args:
+            league_id: TheSportsDB ID of the league
+            dataset: Dataset kind, upcoming matches, results or table
+            previous_version: Version returned by the previous fetch
+
+        Returns:
+            Tuple of records (None when unchanged) and the current version
+        """
+        if dataset == _DATASET_TABLE:
+            return await self._sports_data_service.get_league_table(
+                league_id, self._season, previous_version
+            )
+        return await self._sports_data_service.get_league_events(
+            league_id, dataset == _DATASET_UPCOMING, previous_version
+        )
+
+    def _rebuild_team_lookups(self) -> None:
+        """Rebuild the per-team match lists and the team name lookup from all datasets."""
+        upcoming_by_team_id: dict[str, list[MatchEvent]] = {}
+        results_by_team_id: dict[str, list[MatchEvent]] = {}
+        team_ids_by_name: dict[str, set[str]] = {}
+
+        for (_, dataset), records in self._datasets.items():
+            if dataset == _DATASET_TABLE:
+                for standing_row in records:
+                    self._add_team_name(
+                        team_ids_by_name, standing_row.team_id, standing_row.team_name
+                    )
+                continue
+
+            matches_by_team_id = (
+                upcoming_by_team_id
+                if dataset == _DATASET_UPCOMING
+                else results_by_team_id
+            )
+            for match in records:
+                for team_id, team_name in (
+                    (match.home_team_id, match.home_team_name),
+                    (match.away_team_id, match.away_team_name),
+                ):
+                    matches_by_team_id.setdefault(team_id, []).append(match)
+                    self._add_team_name(team_ids_by_name, team_id, team_name)
+
+        self._upcoming_by_team_id = upcoming_by_team_id
+        self._results_by_team_id = results_by_team_id
+        self._team_ids_by_name = team_ids_by_name
+
+    @staticmethod
+    def _add_team_name(
+        team_ids_by_name: dict[str, set[str]], team_id: str, team_name: str
+    ) -> None:
+        """
+        Register the normalized name of a team.
+
+        Args:
+            team_ids_by_name: Lookup being built
+            team_id: Unique identifier of the team
+            team_name: Team name as returned by the API
+        """
+        if normalized_name := normalize_team_name(team_name):
+            team_ids_by_name.setdefault(normalized_name, set()).add(team_id)
+
+    @staticmethod
+    def _build_league_aliases(leagues: list[dict[str, Any]]) -> dict[str, str]:
+        """
+        Map the normalized names and alternate names of leagues to their names.
+
+        Args:
+            leagues: Raw league entries of the API
+
+        Returns:
+            League names keyed by normalized alias
+        """
+        league_names_by_alias: dict[str, str] = {}
+        for league in leagues:
+            for raw_alias in [
+                league["strLeague"],
+                *(league.get("strLeagueAlternate") or "").split(","),
+            ]:
+                if alias := normalize_team_name(raw_alias):
+                    league_names_by_alias.setdefault(alias, league["strLeague"])
+        return league_names_by_alias
+
+    def is_known_entity(self, normalized_name: str) -> bool:
+        """
+        Check whether a normalized name denotes a stored team or league.
+
+        Args:
+            normalized_name: Name produced by normalize_team_name
+
+        Returns:
+            True if the store holds data for the team or league
+        """
+        if (
+            normalized_name in self._team_ids_by_name
+            or normalized_name in self._league_names_by_alias
+        ):
+            return True
+
+        canonical_name = (
+            self._team_index.canonicalize_alias(normalized_name)
+            if self._team_index is not None
+            else None
+        )
+        return canonical_name is not None and canonical_name in self._team_ids_by_name
+
+    def _collect_team_matches(
+        self, team_name: str, matches_by_team_id: dict[str, list[MatchEvent]]
+    ) -> list[MatchEvent]:
+        """
+        Collect the matches of every team the name resolves to.
+
+        Args:
+            team_name: Full, partial or alternate team name
+            matches_by_team_id: Upcoming matches or results keyed by team ID
+
+        Returns:
+            Matches without duplicates, in no particular order
+        """
+        matches = {
+            match.event_id: match
+            for team_id in self._resolve_team_ids(team_name)
+            for match in matches_by_team_id.get(team_id, ())
+        }
+        self._record_lookup(bool(matches))
+        return list(matches.values())
+
+    def _resolve_team_ids(self, team_name: str) -> set[str]:
+        """
+        Resolve a team name to the IDs of the stored teams it denotes.
+
+        Tries the names seen in matches and tables, then the team index, then
+        a unique partial match of the stored names.
+
+        Args:
+            team_name: Full, partial or alternate team name
+
+        Returns:
+            Matching team IDs, empty if the name is unknown
+        """
+        normalized_name = normalize_team_name(team_name)
+        if not normalized_name:
+            return set()
+
+        if team_ids := self._team_ids_by_name.get(normalized_name):
+            return team_ids
+
+        if self._team_index is not None and self._team_index.is_ready:
+            indexed_teams = self._team_index.search(team_name, limit=1)
+            if indexed_teams:
+                return {indexed_teams[0].team_id}
+
+        partial_matches = [
+            team_ids
+            for stored_name, team_ids in self._team_ids_by_name.items()
+            if normalized_name in stored_name
+        ]
+        return partial_matches[0] if len(partial_matches) == 1 else set()
+
+    def _resolve_league_name(self, league_name: str) -> str | None:
+        """
+        Resolve a league name or alternate name to the stored league name.
+
+        Args:
+            league_name: League name, alternate name or a unique part of one
+
+        Returns:
+            League name as returned by the API, or None if unknown or ambiguous
+        """
+        normalized_name = normalize_team_name(league_name)
+        if not normalized_name:
+            return None
+
+        if resolved_name := self._league_names_by_alias.get(normalized_name):
+            return resolved_name
+
+        partial_matches = {
+            resolved_name
+            for alias, resolved_name in self._league_names_by_alias.items()
+            if normalized_name in alias
+        }
+        return partial_matches.pop() if len(partial_matches) == 1 else None
+
+    def _record_lookup(self, answered: bool) -> None:
+        """
+        Count a lookup served from the store.
+
+        Args:
+            answered: Whether the store held data for the lookup
+        """
+        if answered:
+            self._answered_lookups += 1
+        else:
+            self._unresolved_lookups += 1
+
+
+def _get_utc_timestamp() -> str:
+    """
+    Get the current UTC time in the format of match kickoff times.
+
+    Returns:
+        ISO 8601 timestamp without zone suffix
+    """
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
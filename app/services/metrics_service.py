@@ -0,0 +1,254 @@
+import time
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from app.utils.metrics import MetricsRegistry, OperationTimer
+
+
+class MetricsService:
+    """
+    Prometheus metrics of the chat workflow and its upstream dependencies.
+
+    Records latency histograms, in-flight gauges and error counters for
+    workflow nodes, upstream HTTP APIs and LLM calls, plus prompt and
+    completion token counts per node.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metrics registry and all metric families."""
+        self._registry = MetricsRegistry()
+
+        self._node_duration = self._registry.histogram(
+            "soccer_agent_node_duration_seconds",
+            "Time spent executing a workflow node",
+            ("node",),
+        )
+        self._node_in_flight = self._registry.gauge(
+            "soccer_agent_node_in_flight",
+            "Workflow node executions currently running",
+            ("node",),
+        )
+        self._node_errors = self._registry.counter(
+            "soccer_agent_node_errors_total",
+            "Workflow node executions that raised an error",
+            ("node",),
+        )
+
+        self._upstream_duration = self._registry.histogram(
+            "soccer_agent_upstream_request_duration_seconds",
+            "Duration of requests to upstream APIs",
+            ("upstream", "endpoint"),
+        )
+        self._upstream_in_flight = self._registry.gauge(
+            "soccer_agent_upstream_requests_in_flight",
+            "Requests to upstream APIs currently running",
+            ("upstream", "endpoint"),
+        )
+        self._upstream_errors = self._registry.counter(
+            "soccer_agent_upstream_request_errors_total",
+            "Requests to upstream APIs that failed",
+            ("upstream", "endpoint"),
+        )
+
+        self._llm_duration = self._registry.histogram(
+            "soccer_agent_llm_call_duration_seconds",
+            "Duration of LLM calls per workflow node",
+            ("node",),
+        )
+        self._llm_in_flight = self._registry.gauge(
+            "soccer_agent_llm_calls_in_flight",
+            "LLM calls currently running per workflow node",
+            ("node",),
+        )
+        self._llm_errors = self._registry.counter(
+            "soccer_agent_llm_call_errors_total",
+            "LLM calls that failed per workflow node",
+            ("node",),
+        )
+        self._llm_tokens = self._registry.counter(
+            "soccer_agent_llm_tokens_total",
+            "Tokens consumed by LLM calls per workflow node",
+            ("node", "token_type"),
+        )
+
+        self._llm_callback_handler = LLMMetricsCallbackHandler(self)
+
+    @property
+    def llm_callback_handler(self) -> BaseCallbackHandler:
+        """
+        Get the callback handler that records LLM call metrics.
+
+        Returns:
+            Callback handler to attach to chat models
+        """
+        return self._llm_callback_handler
+
+    def track_node(self, node_name: str) -> OperationTimer:
+        """
+        Track one execution of a workflow node.
+
+        Args:
+            node_name: Name of the workflow node
+
+        Returns:
+            Context manager recording the execution
+        """
+        return OperationTimer(
+            self._node_duration.labels(node_name),
+            self._node_in_flight.labels(node_name),
+            self._node_errors.labels(node_name),
+        )
+
+    def track_upstream(self, upstream: str, endpoint: str) -> OperationTimer:
+        """
+        Track one request to an upstream API.
+
+        Args:
+            upstream: Name of the upstream service, e.g. "thesportsdb"
+            endpoint: Endpoint called, without query parameters
+
+        Returns:
+            Context manager recording the request
+        """
+        return OperationTimer(
+            self._upstream_duration.labels(upstream, endpoint),
+            self._upstream_in_flight.labels(upstream, endpoint),
+            self._upstream_errors.labels(upstream, endpoint),
+        )
+
+    def record_llm_call_start(self, node_name: str) -> None:
+        """
+        Record that an LLM call started.
+
+        Args:
+            node_name: Workflow node issuing the call
+        """
+        self._llm_in_flight.labels(node_name).inc()
+
+    def record_llm_call_end(
+        self,
+        node_name: str,
+        duration_seconds: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        failed: bool = False,
+    ) -> None:
+        """
+        Record that an LLM call finished.
+
+        Args:
+            node_name: Workflow node that issued the call
+            duration_seconds: Duration of the call
+            prompt_tokens: Prompt tokens reported by the model
+            completion_tokens: Completion tokens reported by the model
+            failed: Whether the call raised an error
+        """
+        self._llm_in_flight.labels(node_name).dec()
+        self._llm_duration.labels(node_name).observe(duration_seconds)
+        if failed:
+            self._llm_errors.labels(node_name).inc()
+        if prompt_tokens:
+            self._llm_tokens.labels(node_name, "prompt").inc(prompt_tokens)
+        if completion_tokens:
+            self._llm_tokens.labels(node_name, "completion").inc(completion_tokens)
+
+    def render(self) -> str:
+        """
+        Render all metrics in Prometheus text format.
+
+        Returns:
+            Exposition text
+        """
+        return self._registry.render()
+
+
+class LLMMetricsCallbackHandler(BaseCallbackHandler):
+    """
+    LangChain callback handler forwarding LLM call timings and token usage.
+
+    Attributes calls to the workflow node they run in using the metadata
+    LangGraph attaches to every run, and runs inline to avoid executor hops.
+    """
+
+    run_inline = True
+
+    def __init__(self, metrics_service: MetricsService) -> None:
+        """
+        Initialize the callback handler.
+
+        Args:
+            metrics_service: Metrics service receiving the measurements
+        """
+        self._metrics_service = metrics_service
+        self._running_calls: dict[UUID, tuple[str, float]] = {}
+
+    def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: list[list[Any]],
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        node_name = (metadata or {}).get("langgraph_node", "none")
+        self._running_calls[run_id] = (node_name, time.perf_counter())
+        self._metrics_service.record_llm_call_start(node_name)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        running_call = self._running_calls.pop(run_id, None)
+        if running_call is None:
+            return
+
+        node_name, started_at = running_call
+        prompt_tokens, completion_tokens = self._count_tokens(response)
+        self._metrics_service.record_llm_call_end(
+            node_name,
+            time.perf_counter() - started_at,
+            prompt_tokens,
+            completion_tokens,
+        )
+
+    def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        running_call = self._running_calls.pop(run_id, None)
+        if running_call is None:
+            return
+
+        node_name, started_at = running_call
+        self._metrics_service.record_llm_call_end(
+            node_name, time.perf_counter() - started_at, failed=True
+        )
+
+    @staticmethod
+    def _count_tokens(response: LLMResult) -> tuple[int, int]:
+        """
+        Extract token usage from an LLM result.
+
+        Args:
+            response: Result reported by the chat model
+
+        Returns:
+            Prompt and completion token counts, zero when not reported
+        """
+        prompt_tokens = 0
+        completion_tokens = 0
+        for generations in response.generations:
+            for generation in generations:
+                usage_metadata = getattr(
+                    getattr(generation, "message", None), "usage_metadata", None
+                )
+                if usage_metadata:
+                    prompt_tokens += usage_metadata.get("input_tokens", 0)
+                    completion_tokens += usage_metadata.get("output_tokens", 0)
+
+        if not prompt_tokens and not completion_tokens:
+            token_usage = (response.llm_output or {}).get("token_usage") or {}
+            prompt_tokens = token_usage.get("prompt_tokens") or 0
+            completion_tokens = token_usage.get("completion_tokens") or 0
+
+        return prompt_tokens, completion_tokens
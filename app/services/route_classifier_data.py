@@ -0,0 +1,519 @@
+from app.domain.enums import WorkflowRouteDecision
+
+
+KNOWN_TEAM_NAMES: tuple[str, ...] = (
+    "arsenal",
+    "aston villa",
+    "chelsea",
+    "everton",
+    "liverpool",
+    "manchester city",
+    "man city",
+    "manchester united",
+    "man united",
+    "man utd",
+    "newcastle",
+    "newcastle united",
+    "tottenham",
+    "tottenham hotspur",
+    "spurs",
+    "west ham",
+    "brighton",
+    "leeds",
+    "real madrid",
+    "barcelona",
+    "barca",
+    "atletico madrid",
+    "sevilla",
+    "valencia",
+    "villarreal",
+    "real sociedad",
+    "athletic bilbao",
+    "bayern",
+    "bayern munich",
+    "borussia dortmund",
+    "dortmund",
+    "rb leipzig",
+    "bayer leverkusen",
+    "juventus",
+    "inter",
+    "inter milan",
+    "ac milan",
+    "milan",
+    "napoli",
+    "roma",
+    "lazio",
+    "atalanta",
+    "psg",
+    "paris saint germain",
+    "marseille",
+    "lyon",
+    "monaco",
+    "ajax",
+    "psv",
+    "feyenoord",
+    "benfica",
+    "porto",
+    "sporting",
+    "celtic",
+    "rangers",
+    "galatasaray",
+    "fenerbahce",
+    "boca juniors",
+    "river plate",
+    "flamengo",
+    "inter miami",
+    "la galaxy",
+    "al nassr",
+    "al hilal",
+)
+
+PLACE_TEAM_NAMES: frozenset[str] = frozenset(
+    {
+        "barcelona",
+        "brighton",
+        "dortmund",
+        "lazio",
+        "leeds",
+        "liverpool",
+        "lyon",
+        "marseille",
+        "milan",
+        "monaco",
+        "napoli",
+        "newcastle",
+        "porto",
+        "roma",
+        "sevilla",
+        "valencia",
+    }
+)
+
+KNOWN_PERSON_NAMES: tuple[str, ...] = (
+    "kylian mbappe",
+    "mbappe",
+    "erling haaland",
+    "haaland",
+    "cristiano ronaldo",
+    "ronaldo",
+    "lionel messi",
+    "messi",
+    "jude bellingham",
+    "bellingham",
+    "mohamed salah",
+    "salah",
+    "harry kane",
+    "robert lewandowski",
+    "lewandowski",
+    "kevin de bruyne",
+    "de bruyne",
+    "vinicius junior",
+    "vinicius",
+    "neymar",
+    "luka modric",
+    "modric",
+    "lamine yamal",
+    "yamal",
+    "bukayo saka",
+    "saka",
+    "virgil van dijk",
+    "van dijk",
+    "martin odegaard",
+    "odegaard",
+    "phil foden",
+    "foden",
+    "jamal musiala",
+    "musiala",
+    "florian wirtz",
+    "antoine griezmann",
+    "griezmann",
+    "karim benzema",
+    "benzema",
+    "romelu lukaku",
+    "lukaku",
+    "victor osimhen",
+    "osimhen",
+    "son heung min",
+    "cole palmer",
+    "declan rice",
+    "rodri",
+    "pedri",
+    "zlatan ibrahimovic",
+    "ibrahimovic",
+    "wayne rooney",
+    "david beckham",
+    "thierry henry",
+    "diego maradona",
+    "maradona",
+    "pele",
+    "johan cruyff",
+    "zinedine zidane",
+    "zidane",
+    "pep guardiola",
+    "guardiola",
+    "jose mourinho",
+    "mourinho",
+    "jurgen klopp",
+    "klopp",
+    "carlo ancelotti",
+    "ancelotti",
+    "mikel arteta",
+    "arteta",
+    "xabi alonso",
+    "diego simeone",
+    "simeone",
+    "erik ten hag",
+    "ten hag",
+    "arne slot",
+    "mauricio pochettino",
+    "pochettino",
+    "thomas tuchel",
+    "tuchel",
+    "hansi flick",
+    "enzo maresca",
+    "ange postecoglou",
+    "postecoglou",
+    "gareth southgate",
+    "southgate",
+    "didier deschamps",
+    "deschamps",
+)
+
+KNOWN_LEAGUE_NAMES: tuple[str, ...] = (
+    "premier league",
+    "epl",
+    "championship",
+    "la liga",
+    "laliga",
+    "bundesliga",
+    "serie a",
+    "ligue 1",
+    "eredivisie",
+    "primeira liga",
+    "scottish premiership",
+    "mls",
+    "champions league",
+    "europa league",
+    "conference league",
+    "fa cup",
+    "carabao cup",
+    "copa del rey",
+    "world cup",
+    "euros",
+    "copa america",
+    "saudi pro league",
+    "copa libertadores",
+    "libertadores",
+    "club world cup",
+    "nations league",
+    "community shield",
+    "coppa italia",
+    "dfb pokal",
+    "coupe de france",
+    "africa cup of nations",
+    "afcon",
+    "ballon d or",
+    "golden boot",
+)
+
+FOOTBALL_LEXICON: frozenset[str] = frozenset(
+    {
+        "football",
+        "soccer",
+        "club",
+        "clubs",
+        "team",
+        "teams",
+        "player",
+        "players",
+        "match",
+        "matches",
+        "game",
+        "goal",
+        "goals",
+        "scored",
+        "striker",
+        "midfielder",
+        "defender",
+        "goalkeeper",
+        "coach",
+        "manager",
+        "league",
+        "derby",
+        "penalty",
+        "kit",
+        "squad",
+        "fixture",
+        "fixtures",
+        "standings",
+        "table",
+        "transfer",
+        "transfers",
+        "stadium",
+        "striker",
+        "assists",
+        "footballer",
+        "winger",
+        "forward",
+        "captain",
+        "coaches",
+        "coached",
+        "manages",
+        "managed",
+        "contract",
+        "tournament",
+        "trophy",
+    }
+)
+
+TEAM_FACT_LEXICON: frozenset[str] = frozenset(
+    {
+        "stadium",
+        "ground",
+        "arena",
+        "founded",
+        "formed",
+        "established",
+        "website",
+        "badge",
+        "crest",
+        "jersey",
+        "nickname",
+        "located",
+        "based",
+        "home",
+        "history",
+        "description",
+        "facebook",
+        "twitter",
+        "youtube",
+    }
+)
+
+TIME_SENSITIVE_LEXICON: frozenset[str] = frozenset(
+    {
+        "latest",
+        "news",
+        "today",
+        "tonight",
+        "yesterday",
+        "weekend",
+        "recent",
+        "recently",
+        "current",
+        "currently",
+        "now",
+        "score",
+        "result",
+        "results",
+        "won",
+        "lost",
+        "beat",
+        "transfer",
+        "transfers",
+        "signed",
+        "signing",
+        "rumour",
+        "rumours",
+        "rumor",
+        "rumors",
+        "injury",
+        "injured",
+        "lineup",
+        "sacked",
+        "next",
+        "last",
+        "fixture",
+        "fixtures",
+        "standings",
+        "table",
+        "top",
+        "scorer",
+    }
+)
+
+LABELED_QUESTIONS: tuple[tuple[str, WorkflowRouteDecision], ...] = (
+    ("What stadium does Arsenal play in?", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("When was Ajax founded?", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("Tell me about Manchester United", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("Which league does Celtic play in?", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("Where is Juventus based?", WorkflowRouteDecision.FOOTBALL_DATA),
+    (
+        "What is the official website of Real Madrid?",
+        WorkflowRouteDecision.FOOTBALL_DATA,
+    ),
+    ("Give me details about Borussia Dortmund", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("What is the home ground of Liverpool?", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("In what year was Barcelona formed?", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("Describe Bayern Munich football club", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("What is the nickname of Newcastle United?", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("Show the badge of Chelsea", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("Where is the stadium of Benfica located?", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("What is the twitter account of Tottenham?", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("Info on the club Napoli", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("Which league is PSV in?", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("History of Boca Juniors", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("Who are Feyenoord?", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("Team info for Atletico Madrid", WorkflowRouteDecision.FOOTBALL_DATA),
+    (
+        "What is the stadium capacity of Inter Milan home ground?",
+        WorkflowRouteDecision.FOOTBALL_DATA,
+    ),
+    ("Latest transfer news for Chelsea", WorkflowRouteDecision.WEB_SEARCH),
+    (
+        "Who won the Champions League final last night?",
+        WorkflowRouteDecision.WEB_SEARCH,
+    ),
+    ("What was the score of the Madrid derby?", WorkflowRouteDecision.WEB_SEARCH),
+    (
+        "Who is the top scorer in the Premier League this season?",
+        WorkflowRouteDecision.WEB_SEARCH,
+    ),
+    ("Is Salah injured?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Who did Barcelona sign this summer?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Premier League standings today", WorkflowRouteDecision.WEB_SEARCH),
+    ("Who scored for Arsenal yesterday?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Latest football news", WorkflowRouteDecision.WEB_SEARCH),
+    ("Was the Manchester City manager sacked?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Transfer rumours about Mbappe", WorkflowRouteDecision.WEB_SEARCH),
+    ("Who won the Ballon d'Or?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Result of the World Cup final", WorkflowRouteDecision.WEB_SEARCH),
+    ("What is the lineup for tonight's match?", WorkflowRouteDecision.WEB_SEARCH),
+    (
+        "Which player scored the most goals in La Liga?",
+        WorkflowRouteDecision.WEB_SEARCH,
+    ),
+    ("Who won the Serie A title?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Recent results of the Europa League", WorkflowRouteDecision.WEB_SEARCH),
+    ("How many assists does Messi have this season?", WorkflowRouteDecision.WEB_SEARCH),
+    ("When is the next El Clasico?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Bundesliga table right now", WorkflowRouteDecision.WEB_SEARCH),
+    ("Who is Kevin De Bruyne?", WorkflowRouteDecision.WEB_SEARCH),
+    ("How old is Luka Modric?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Where does Harry Kane play?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Which club does Mohamed Salah play for?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Is Neymar still playing?", WorkflowRouteDecision.WEB_SEARCH),
+    ("How many goals has Lewandowski scored?", WorkflowRouteDecision.WEB_SEARCH),
+    ("What position does Bukayo Saka play?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Tell me about Lamine Yamal", WorkflowRouteDecision.WEB_SEARCH),
+    ("Who does Jurgen Klopp manage?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Which team does Carlo Ancelotti coach?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Who is Mikel Arteta?", WorkflowRouteDecision.WEB_SEARCH),
+    ("How many trophies has Jose Mourinho won?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Who won the Copa Libertadores?", WorkflowRouteDecision.WEB_SEARCH),
+    ("When is the Club World Cup?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Who won the Nations League?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Which teams are in the Africa Cup of Nations?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Who won the Golden Boot?", WorkflowRouteDecision.WEB_SEARCH),
+    (
+        "Tell me about Arsenal and their latest results",
+        WorkflowRouteDecision.COMBINED_APPROACH,
+    ),
+    (
+        "Where does Liverpool play and who did they beat last weekend?",
+        WorkflowRouteDecision.COMBINED_APPROACH,
+    ),
+    (
+        "Juventus stadium and recent transfer news",
+        WorkflowRouteDecision.COMBINED_APPROACH,
+    ),
+    (
+        "Give me Chelsea club info and current injury news",
+        WorkflowRouteDecision.COMBINED_APPROACH,
+    ),
+    (
+        "When was Real Madrid founded and who is their manager now?",
+        WorkflowRouteDecision.COMBINED_APPROACH,
+    ),
+    ("Ajax history and latest score", WorkflowRouteDecision.COMBINED_APPROACH),
+    (
+        "Describe Bayern Munich and their next fixture",
+        WorkflowRouteDecision.COMBINED_APPROACH,
+    ),
+    ("Celtic home ground and today's news", WorkflowRouteDecision.COMBINED_APPROACH),
+    (
+        "Everything about Napoli including recent results",
+        WorkflowRouteDecision.COMBINED_APPROACH,
+    ),
+    (
+        "Dortmund details and who they signed recently",
+        WorkflowRouteDecision.COMBINED_APPROACH,
+    ),
+    ("What is the capital of France?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("How do I bake a chocolate cake?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("What's the weather like tomorrow?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Who won the NBA finals?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Explain quantum computing", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Write me a poem about the sea", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("How tall is Mount Everest?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Translate hello into Spanish", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("What is the price of bitcoin today?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    (
+        "Who is the president of the United States?",
+        WorkflowRouteDecision.DIRECT_CONVERSATION,
+    ),
+    ("Recommend a good movie", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("How does a car engine work?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("What is the latest iPhone?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Tennis results from Wimbledon", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("What is the weather in Barcelona?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Best hotels in Liverpool", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("How far is Milan from Rome?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("What to see in Porto?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Cheap flights to Marseille", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Population of Napoli", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Who discovered penicillin?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("How old is Tom Hanks?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Who painted the Mona Lisa?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Where does Taylor Swift live?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Hello, how are you?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Tell me a joke", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("What is Python used for?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Best restaurants in London", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Who won the Super Bowl?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Who won the Davis Cup?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("News about the stock market", WorkflowRouteDecision.DIRECT_CONVERSATION),
+)
+
+HELD_OUT_QUESTIONS: tuple[tuple[str, WorkflowRouteDecision], ...] = (
+    ("What is Arsenal's stadium called?", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("When was Chelsea founded?", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("Which league is Galatasaray in?", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("Where is Sevilla's stadium?", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("Tell me about Aston Villa", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("What is the website of Ajax?", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("Home ground of Bayer Leverkusen", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("History of River Plate", WorkflowRouteDecision.FOOTBALL_DATA),
+    ("Latest news about Liverpool", WorkflowRouteDecision.WEB_SEARCH),
+    ("Who won the Bundesliga last season?", WorkflowRouteDecision.WEB_SEARCH),
+    ("La Liga standings", WorkflowRouteDecision.WEB_SEARCH),
+    ("Who scored for Real Madrid last night?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Where does Kylian Mbappe play?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Who is Erling Haaland?", WorkflowRouteDecision.WEB_SEARCH),
+    ("How old is Cristiano Ronaldo?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Where does Jude Bellingham play?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Who does Pep Guardiola coach?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Is Lionel Messi retired?", WorkflowRouteDecision.WEB_SEARCH),
+    ("When is the Champions League draw?", WorkflowRouteDecision.WEB_SEARCH),
+    ("Who won the FA Cup?", WorkflowRouteDecision.WEB_SEARCH),
+    (
+        "Arsenal stadium and their latest results",
+        WorkflowRouteDecision.COMBINED_APPROACH,
+    ),
+    (
+        "When was Juventus founded and who did they sign recently?",
+        WorkflowRouteDecision.COMBINED_APPROACH,
+    ),
+    ("What is the weather in Valencia?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("What is the weather in Dallas?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Who discovered America?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Things to do in Los Angeles", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Best restaurants in Sevilla", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("How big is Monaco?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Train from Leeds to London", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("History of Rome", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Who is the king of Spain?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("How old is Keanu Reeves?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("What is the weather like today?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+    ("Who won the Stanley Cup?", WorkflowRouteDecision.DIRECT_CONVERSATION),
+)
@@ -0,0 +1,341 @@
+import math
+import random
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from app.domain.enums import WorkflowRouteDecision
+from app.services.route_classifier_data import (
+    FOOTBALL_LEXICON,
+    HELD_OUT_QUESTIONS,
+    KNOWN_LEAGUE_NAMES,
+    KNOWN_PERSON_NAMES,
+    KNOWN_TEAM_NAMES,
+    LABELED_QUESTIONS,
+    PLACE_TEAM_NAMES,
+    TEAM_FACT_LEXICON,
+    TIME_SENSITIVE_LEXICON,
+)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_MAX_GAZETTEER_NGRAM = 4
+_MIN_REGISTERED_NAME_TOKENS = 2
+_FOOTBALL_ENTITY_FEATURES = frozenset(
+    {"__football_term__", "__team__", "__league__", "__person__"}
+)
+_ROUTES: tuple[WorkflowRouteDecision, ...] = tuple(WorkflowRouteDecision)
+
+
+def _tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase ASCII word tokens.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Tokens with accents stripped
+    """
+    ascii_text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return _TOKEN_PATTERN.findall(ascii_text.lower())
+
+
+@dataclass(frozen=True, slots=True)
+class RoutePrediction:
+    """Route predicted by the local classifier together with its probability."""
+
+    route: WorkflowRouteDecision
+    confidence: float
+    probabilities: dict[WorkflowRouteDecision, float]
+
+
+class RouteClassifierService:
+    """
+    Local fast-path classifier for supervisor routing decisions.
+
+    Combines a football lexicon and a team, league and person gazetteer with
+    a small multinomial logistic regression trained on labeled questions at
+    startup. Football routes predicted above the confidence threshold are
+    served locally; everything else, including every question the model
+    considers off-topic, falls back to the LLM-based supervisor, so the
+    classifier never refuses a question on its own.
+
+    The threshold is calibrated on held-out questions after training: it is
+    raised until the local decisions on them reach the minimum precision.
+    """
+
+    def __init__(
+        self,
+        confidence_threshold: float = 0.8,
+        min_precision: float = 1.0,
+        training_epochs: int = 30,
+        learning_rate: float = 0.5,
+        l2_penalty: float = 1e-4,
+    ) -> None:
+        """
+        Initialize, train and calibrate the route classifier.
+
+        Args:
+            confidence_threshold: Minimum probability to accept a local decision
+            min_precision: Share of held-out questions served locally that
+                must be routed correctly at the calibrated threshold
+            training_epochs: Number of passes over the labeled questions
+            learning_rate: Step size for stochastic gradient descent
+            l2_penalty: L2 regularization strength
+        """
+        self._gazetteer: dict[str, str] = (
+            {name: "__team__" for name in KNOWN_TEAM_NAMES}
+            | {name: "__place_team__" for name in PLACE_TEAM_NAMES}
+            | {name: "__league__" for name in KNOWN_LEAGUE_NAMES}
+            | {name: "__person__" for name in KNOWN_PERSON_NAMES}
+        )
+        self._weights: dict[str, list[float]] = {}
+        self._bias = [0.0] * len(_ROUTES)
+
+        self._local_hits = 0
+        self._llm_fallbacks = 0
+        self._hits_by_route = {route.value: 0 for route in _ROUTES}
+
+        self._train(LABELED_QUESTIONS, training_epochs, learning_rate, l2_penalty)
+        self._confidence_threshold, self._held_out_precision = self._calibrate(
+            HELD_OUT_QUESTIONS, confidence_threshold, min_precision
+        )
+
+    @property
+    def confidence_threshold(self) -> float:
+        """
+        Minimum probability at which local decisions are accepted.
+
+        Returns:
+            Calibrated confidence threshold, infinite if no threshold reached
+            the minimum precision
+        """
+        return self._confidence_threshold
+
+    def register_team_names(self, team_names: Iterable[str]) -> None:
+        """
+        Extend the gazetteer with additional team names.
+
+        Only names of at least two words, affixes such as "FC" included, are
+        registered: single words such as "Toronto" or "America" are mostly
+        places or common words and would make off-topic questions look like
+        football questions.
+
+        Args:
+            team_names: Full team names to recognize as football entities
+        """
+        for team_name in team_names:
+            tokens = _tokenize(team_name)
+            if len(tokens) >= _MIN_REGISTERED_NAME_TOKENS:
+                self._gazetteer.setdefault(" ".join(tokens), "__team__")
+
+    def predict(self, question: str) -> RoutePrediction:
+        """
+        Predict the routing decision for a question.
+
+        Args:
+            question: Raw user question
+
+        Returns:
+            Most probable route with its probability distribution
+        """
+        probabilities = self._predict_probabilities(self._extract_features(question))
+        best_index = max(range(len(_ROUTES)), key=probabilities.__getitem__)
+
+        return RoutePrediction(
+            route=_ROUTES[best_index],
+            confidence=probabilities[best_index],
+            probabilities=dict(zip(_ROUTES, probabilities)),
+        )
+
+    def try_classify(self, question: str) -> WorkflowRouteDecision | None:
+        """
+        Classify a question locally when the prediction is confident enough.
+
+        Direct conversation predictions always fall back to the LLM, since
+        the gazetteer cannot tell an unknown player or competition from an
+        off-topic question.
+
+        Args:
+            question: Raw user question
+
+        Returns:
+            Football routing decision, or None when the LLM should decide instead
+        """
+        prediction = self.predict(question)
+
+        if (
+            prediction.route == WorkflowRouteDecision.DIRECT_CONVERSATION
+            or prediction.confidence < self._confidence_threshold
+        ):
+            self._llm_fallbacks += 1
+            return None
+
+        self._local_hits += 1
+        self._hits_by_route[prediction.route.value] += 1
+        return prediction.route
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get counters describing how often the local classifier decided.
+
+        Returns:
+            Hit, fallback and per-route counters together with the hit ratio,
+            the calibrated threshold and the held-out precision it reaches
+        """
+        total = self._local_hits + self._llm_fallbacks
+        return {
+            "local_hits": self._local_hits,
+            "llm_fallbacks": self._llm_fallbacks,
+            "hit_ratio": self._local_hits / total if total else 0.0,
+            "hits_by_route": dict(self._hits_by_route),
+            "confidence_threshold": self._confidence_threshold,
+            "held_out_precision": self._held_out_precision,
+        }
+
+    def _extract_features(self, question: str) -> list[str]:
+        """
+        Convert a question into sparse binary features.
+
+        Args:
+            question: Raw user question
+
+        Returns:
+            Unique feature names present in the question
+        """
+        tokens = _tokenize(question)
+        features = set(tokens)
+        features.update(
+            f"{first}_{second}" for first, second in zip(tokens, tokens[1:])
+        )
+
+        for size in range(1, _MAX_GAZETTEER_NGRAM + 1):
+            for start in range(len(tokens) - size + 1):
+                entity_type = self._gazetteer.get(
+                    " ".join(tokens[start : start + size])
+                )
+                if entity_type is not None:
+                    features.add(entity_type)
+
+        if features & FOOTBALL_LEXICON:
+            features.add("__football_term__")
+        if features & TEAM_FACT_LEXICON:
+            features.add("__team_fact__")
+        if features & TIME_SENSITIVE_LEXICON:
+            features.add("__time_sensitive__")
+        if not features & _FOOTBALL_ENTITY_FEATURES:
+            features.add("__no_football__")
+
+        return list(features)
+
+    def _predict_probabilities(self, features: list[str]) -> list[float]:
+        """
+        Compute the softmax distribution over routes.
+
+        Args:
+            features: Feature names present in the question
+
+        Returns:
+            Probabilities aligned with the route order
+        """
+        scores = list(self._bias)
+        for feature in features:
+            feature_weights = self._weights.get(feature)
+            if feature_weights is None:
+                continue
+            for index, weight in enumerate(feature_weights):
+                scores[index] += weight
+
+        max_score = max(scores)
+        exponentials = [math.exp(score - max_score) for score in scores]
+        normalizer = sum(exponentials)
+        return [value / normalizer for value in exponentials]
+
+    def _train(
+        self,
+        labeled_questions: Iterable[tuple[str, WorkflowRouteDecision]],
+        epochs: int,
+        learning_rate: float,
+        l2_penalty: float,
+    ) -> None:
+        """
+        Fit the logistic regression weights with stochastic gradient descent.
+
+        Args:
+            labeled_questions: Questions paired with their expected route
+            epochs: Number of passes over the data
+            learning_rate: Step size for gradient updates
+            l2_penalty: L2 regularization strength
+        """
+        examples = [
+            (self._extract_features(question), _ROUTES.index(route))
+            for question, route in labeled_questions
+        ]
+        shuffler = random.Random(0)
+
+        for _ in range(epochs):
+            shuffler.shuffle(examples)
+            for features, label_index in examples:
+                probabilities = self._predict_probabilities(features)
+                gradients = [
+                    probability - (1.0 if index == label_index else 0.0)
+                    for index, probability in enumerate(probabilities)
+                ]
+
+                for index, gradient in enumerate(gradients):
+                    self._bias[index] -= learning_rate * gradient
+
+                for feature in features:
+                    feature_weights = self._weights.setdefault(
+                        feature, [0.0] * len(_ROUTES)
+                    )
+                    for index, gradient in enumerate(gradients):
+                        feature_weights[index] -= learning_rate * (
+                            gradient + l2_penalty * feature_weights[index]
+                        )
+
+    def _calibrate(
+        self,
+        held_out_questions: Iterable[tuple[str, WorkflowRouteDecision]],
+        min_threshold: float,
+        min_precision: float,
+    ) -> tuple[float, float | None]:
+        """
+        Find the lowest threshold at which local decisions are precise enough.
+
+        Only held-out questions the classifier would serve locally count,
+        i.e. those predicted as a football route.
+
+        Args:
+            held_out_questions: Questions not used for training paired with
+                their expected route
+            min_threshold: Threshold below which no decision is accepted
+            min_precision: Required share of correct local decisions
+
+        Returns:
+            Calibrated threshold, infinite if none is precise enough, and the
+            held-out precision at that threshold, None if nothing is served
+        """
+        local_predictions = sorted(
+            (
+                (prediction.confidence, prediction.route == route)
+                for question, route in held_out_questions
+                if (prediction := self.predict(question)).route
+                != WorkflowRouteDecision.DIRECT_CONVERSATION
+            ),
+            reverse=True,
+        )
+
+        threshold, precision = math.inf, None
+        correct_predictions = 0
+        for served_predictions, (confidence, is_correct) in enumerate(
+            local_predictions, start=1
+        ):
+            correct_predictions += is_correct
+            if confidence < min_threshold:
+                break
+            if correct_predictions / served_predictions >= min_precision:
+                threshold = confidence
+                precision = correct_predictions / served_predictions
+        return threshold, precision
@@ -0,0 +1,315 @@
+import re
+from typing import Any
+
+from langchain_core.messages import BaseMessage
+
+from app.domain.models.conversation_state import (
+    DEADLINE_NOTICE_NAME,
+    ConversationState,
+)
+from app.services.config_service import AppConfig
+from app.services.fixtures_store_service import (
+    FixturesStoreService,
+    is_fixture_question,
+)
+from app.services.team_index_service import TeamIndexService, normalize_team_name
+
+_FOLLOW_UP_PATTERN = re.compile(
+    r"\b(it|its|it's|they|them|their|theirs|he|him|his|she|her|"
+    r"(?:that|this|the same) (?:club|team|side|stadium|league))\b",
+    re.IGNORECASE,
+)
+_POSSESSIVE_PRONOUNS = frozenset({"its", "their", "theirs", "his", "her"})
+_FRESH_DATA_PATTERN = re.compile(
+    r"\b(next|latest|recent(?:ly)?|today|tonight|yesterday|now|current(?:ly)?|"
+    r"news|scored?|results?|won|lost|beat|injur(?:y|ed|ies)|transfers?|"
+    r"sign(?:ed|ings?)|line-?ups?)\b",
+    re.IGNORECASE,
+)
+_SENTENCE_END_PATTERN = re.compile(r"(?<=[.!?])\s")
+_MAX_ENTITY_NGRAM = 4
+
+
+class SessionMemoryService:
+    """
+    Memory of multi-turn chat sessions kept in the checkpointed workflow state.
+
+    Compacts every finished turn into a one-line digest of a bounded rolling
+    summary and keeps the context retrieved by the latest turns, bounded by
+    message count, so that state size and prompt size stay constant as a
+    session grows. Follow-up questions referring back to earlier turns are
+    answered from that context instead of fetching it again, unless they
+    name a team or league the session has not covered yet. Follow-ups asking
+    for fresh data, such as the next match or the latest news, are routed to
+    the data agents instead, with the pronoun replaced by the team or league
+    the session last named.
+    """
+
+    def __init__(
+        self,
+        app_config: AppConfig,
+        team_index: TeamIndexService | None = None,
+        fixtures_store: FixturesStoreService | None = None,
+    ) -> None:
+        """
+        Initialize the session memory.
+
+        Args:
+            app_config: Application configuration containing session limits
+            team_index: Optional team index used to recognize team names
+            fixtures_store: Optional fixtures store used to recognize team and league names
+        """
+        self._summary_max_turns = app_config.SESSION_SUMMARY_MAX_TURNS
+        self._summary_max_characters = app_config.SESSION_SUMMARY_MAX_CHARACTERS
+        self._context_max_messages = app_config.SESSION_CONTEXT_MAX_MESSAGES
+        self._team_index = team_index
+        self._fixtures_store = fixtures_store
+
+        self._recorded_turns = 0
+        self._reused_contexts = 0
+        self._new_entity_follow_ups = 0
+        self._resolved_follow_ups = 0
+
+    def get_reusable_context(
+        self, conversation_state: ConversationState
+    ) -> list[dict[str, Any]] | None:
+        """
+        Get the context of earlier turns if the question is a follow-up to them.
+
+        A question counts as a follow-up if it refers back with a pronoun,
+        names no team or league beyond those the session already covers and
+        does not ask for fresh data.
+
+        Args:
+            conversation_state: Current conversation state
+
+        Returns:
+            Context retrieved by earlier turns, or None if new data must be fetched
+        """
+        if (
+            not conversation_state.session_context
+            or not _FOLLOW_UP_PATTERN.search(conversation_state.user_question)
+            or self._needs_fresh_data(conversation_state.user_question)
+        ):
+            return None
+        if self._names_new_entity(conversation_state):
+            self._new_entity_follow_ups += 1
+            return None
+
+        self._reused_contexts += 1
+        return list(conversation_state.session_context)
+
+    def resolve_follow_up(self, conversation_state: ConversationState) -> str | None:
+        """
+        Rewrite a follow-up that needs fresh data to name the session's entity.
+
+        Args:
+            conversation_state: Current conversation state
+
+        Returns:
+            Question with its pronouns replaced by the team or league the
+            session last named, or None if it is no such follow-up
+        """
+        session_entity = conversation_state.session_entity
+        question = conversation_state.user_question
+        if (
+            not session_entity
+            or not self._needs_fresh_data(question)
+            or not _FOLLOW_UP_PATTERN.search(question)
+            or self._find_entities(question)
+        ):
+            return None
+
+        self._resolved_follow_ups += 1
+        return _FOLLOW_UP_PATTERN.sub(
+            lambda match: (
+                f"{session_entity}'s"
+                if match.group(0).casefold() in _POSSESSIVE_PRONOUNS
+                else session_entity
+            ),
+            question,
+        )
+
+    def record_turn(
+        self, conversation_state: ConversationState, final_answer: str | None
+    ) -> dict[str, Any]:
+        """
+        Fold a finished turn into the session memory.
+
+        Args:
+            conversation_state: Conversation state at the end of the turn
+            final_answer: Answer generated for the turn
+
+        Returns:
+            State update carrying the new summary, context and the last team
+            or league the turn named, and clearing the per-turn retrieved
+            context; missed-deadline notices are not carried into the session
+            context
+        """
+        self._recorded_turns += 1
+
+        session_context = conversation_state.session_context or []
+        new_context = [
+            context_message
+            for context_message in conversation_state.retrieved_context
+            if context_message not in session_context
+            and not (
+                isinstance(context_message, dict)
+                and context_message.get("name") == DEADLINE_NOTICE_NAME
+            )
+        ]
+        turn_digest = (
+            f"Q: {self._compact_text(conversation_state.user_question)} "
+            f"A: {self._compact_text(final_answer or '')}"
+        )
+
+        session_update: dict[str, Any] = {
+            "session_summary": [
+                *(conversation_state.session_summary or []),
+                turn_digest,
+            ][-self._summary_max_turns :],
+            "session_context": [*session_context, *new_context][
+                -self._context_max_messages :
+            ],
+            "session_route_decision": conversation_state.current_route_decision
+            if new_context
+            else conversation_state.session_route_decision,
+            "retrieved_context": None,
+        }
+        if named_entities := self._find_entities(conversation_state.user_question):
+            session_update["session_entity"] = named_entities[-1]
+        return session_update
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get session memory statistics.
+
+        Returns:
+            Recorded turns, follow-ups answered from earlier context,
+            follow-ups routed normally because they name a new team or league
+            and follow-ups rewritten to fetch fresh data
+        """
+        return {
+            "recorded_turns": self._recorded_turns,
+            "reused_contexts": self._reused_contexts,
+            "new_entity_follow_ups": self._new_entity_follow_ups,
+            "resolved_follow_ups": self._resolved_follow_ups,
+            "reuse_ratio": self._reused_contexts / self._recorded_turns
+            if self._recorded_turns
+            else 0.0,
+        }
+
+    def _names_new_entity(self, conversation_state: ConversationState) -> bool:
+        """
+        Check whether the question names a team or league the session has not covered.
+
+        A name is covered if it or its canonical team name appears in the
+        session summary or context.
+
+        Args:
+            conversation_state: Current conversation state with session memory
+
+        Returns:
+            True if at least one named team or league is new to the session
+        """
+        session_text = " ".join(
+            [
+                *(conversation_state.session_summary or []),
+                *(
+                    str(
+                        context_message.content
+                        if isinstance(context_message, BaseMessage)
+                        else context_message.get("content", "")
+                    )
+                    for context_message in conversation_state.session_context or []
+                ),
+            ]
+        )
+        covered_text = f" {normalize_team_name(session_text)} "
+
+        for name in self._find_entities(conversation_state.user_question):
+            canonical_name = (
+                self._team_index.canonicalize_alias(name)
+                if self._team_index is not None
+                else None
+            )
+            if f" {name} " not in covered_text and (
+                canonical_name is None or f" {canonical_name} " not in covered_text
+            ):
+                return True
+        return False
+
+    def _find_entities(self, text: str) -> list[str]:
+        """
+        Find the known team and league names in a text.
+
+        Known names are matched longest first over the text's token n-grams.
+
+        Args:
+            text: Question or other raw text
+
+        Returns:
+            Normalized names in the order they appear
+        """
+        tokens = normalize_team_name(text).split()
+        names: list[str] = []
+        position = 0
+        while position < len(tokens):
+            for size in range(min(_MAX_ENTITY_NGRAM, len(tokens) - position), 0, -1):
+                name = " ".join(tokens[position : position + size])
+                if self._is_known_entity(name):
+                    names.append(name)
+                    position += size
+                    break
+            else:
+                position += 1
+        return names
+
+    @staticmethod
+    def _needs_fresh_data(question: str) -> bool:
+        """
+        Check whether a question asks for data that earlier turns cannot hold.
+
+        Args:
+            question: Raw user question
+
+        Returns:
+            True for questions about fixtures, results, news and other
+            time-sensitive topics
+        """
+        return (
+            is_fixture_question(question)
+            or _FRESH_DATA_PATTERN.search(question) is not None
+        )
+
+    def _is_known_entity(self, normalized_name: str) -> bool:
+        """
+        Check whether a normalized name denotes a known team or league.
+
+        Args:
+            normalized_name: Name produced by normalize_team_name
+
+        Returns:
+            True if the team index or the fixtures store knows the name
+        """
+        return (
+            self._team_index is not None and self._team_index.has_alias(normalized_name)
+        ) or (
+            self._fixtures_store is not None
+            and self._fixtures_store.is_known_entity(normalized_name)
+        )
+
+    def _compact_text(self, text: str) -> str:
+        """
+        Compact a question or answer to its first sentence within the character limit.
+
+        Args:
+            text: Full question or answer of a turn
+
+        Returns:
+            Compacted text
+        """
+        first_sentence = _SENTENCE_END_PATTERN.split(" ".join(text.split()), 1)[0]
+        if len(first_sentence) <= self._summary_max_characters:
+            return first_sentence
+        return first_sentence[: self._summary_max_characters - 1] + "…"
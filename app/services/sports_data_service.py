@@ -1,7 +1,69 @@
-from typing import Any
+import asyncio
+import hashlib
+import time
+from typing import Any, Iterable
 from httpx import AsyncClient, Timeout, TimeoutException, HTTPStatusError
 
-from app.domain.models.team_models import FootballTeam
+from app.utils.cache_backend import CacheBackend
+from app.utils.hedged_executor import HedgedExecutor
+from app.utils.json_codec import decode_json
+from app.utils.single_flight import SingleFlight
+from app.utils.ttl_cache import TTLCache
+from app.domain.models.fixture_models import MatchEvent, StandingRow
+from app.domain.models.team_models import FootballTeam, TeamRecord
+from app.services.config_service import AppConfig
+from app.services.metrics_service import MetricsService
+
+_RAW_TEAM_FIELDS = (
+    "idTeam",
+    "strTeam",
+    "strAlternate",
+    "intFormedYear",
+    "strSport",
+    "strLeague",
+    "strStadium",
+    "strStadiumLocation",
+    "strDescriptionEN",
+    "strTeamBadge",
+    "strTeamJersey",
+    "strWebsite",
+    "strFacebook",
+    "strTwitter",
+    "strYoutube",
+)
+
+
+def _parse_int(value: Any) -> int | None:
+    """
+    Parse an integer field of the API, which may be a string, number or null.
+
+    Args:
+        value: Raw field value
+
+    Returns:
+        Integer value, or None if the field is empty or not numeric
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_str(value: Any) -> str | None:
+    """
+    Parse a text field of the API, which may be a string, number or null.
+
+    Args:
+        value: Raw field value
+
+    Returns:
+        Text value, or None if the field is null or not a scalar
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return None
 
 
 class SportsDataService:
@@ -12,79 +74,375 @@ class SportsDataService:
     from TheSportsDB API with proper error handling and data transformation.
     """
 
-    def __init__(self) -> None:
-        """Initialize the sports data service with API configuration."""
+    def __init__(
+        self,
+        app_config: AppConfig,
+        http_client: AsyncClient | None = None,
+        metrics_service: MetricsService | None = None,
+        shared_cache: CacheBackend | None = None,
+        hedged_executor: HedgedExecutor | None = None,
+    ) -> None:
+        """
+        Initialize the sports data service with API and cache configuration.
+
+        Args:
+            app_config: Application configuration containing cache settings
+            http_client: Optional HTTP client used instead of a default one
+            metrics_service: Metrics service recording upstream requests
+            shared_cache: Optional cache backend shared with other workers
+            hedged_executor: Optional executor hedging slow lookup requests
+        """
         self._api_base_url = "https://www.thesportsdb.com/api/v1/json"
         self._api_key = "3"
-        self._http_client = AsyncClient(timeout=Timeout(10.0, connect=5.0))
+        self._metrics_service = metrics_service or MetricsService()
+        self._http_client = http_client or AsyncClient(
+            timeout=Timeout(10.0, connect=5.0)
+        )
+
+        self._response_cache = TTLCache(app_config.SPORTS_DATA_CACHE_MAX_ENTRIES)
+        self._shared_cache = shared_cache
+        self._hedged_executor = hedged_executor
+        self._single_flight = SingleFlight()
+        self._endpoint_ttls = {
+            "searchteams.php": app_config.SPORTS_DATA_SEARCH_TTL_SECONDS,
+            "lookupteam.php": app_config.SPORTS_DATA_LOOKUP_TTL_SECONDS,
+        }
+        self._negative_ttl = app_config.SPORTS_DATA_NEGATIVE_TTL_SECONDS
+        self._stale_ttl = app_config.SPORTS_DATA_STALE_TTL_SECONDS
+
+        self._cache_hits = 0
+        self._stale_hits = 0
+        self._cache_misses = 0
+        self._shared_hits = 0
+        self._upstream_requests = 0
+        self._failed_revalidations = 0
 
     @staticmethod
-    def _transform_api_data_to_team(raw_data: dict[str, Any]) -> FootballTeam | None:
+    def _transform_api_data_to_team(raw_data: dict[str, Any]) -> TeamRecord | None:
         """
-        Transform raw API data into a FootballTeam model.
+        Transform raw API data into a compact team record.
+
+        Field values are coerced to the FootballTeam field types here, so
+        records returned by searches match the schema that lookups validate
+        without building a pydantic model per team.
 
         Args:
             raw_data: Raw data dictionary from the API
 
         Returns:
-            FootballTeam instance if data is valid, None otherwise
+            TeamRecord instance if the team plays soccer, None otherwise
         """
         if raw_data.get("strSport") != "Soccer":
             return None
 
-        return FootballTeam(
-            team_id=raw_data.get("idTeam", ""),
-            team_name=raw_data.get("strTeam", ""),
-            alternate_name=raw_data.get("strAlternate"),
-            formation_year=raw_data.get("intFormedYear"),
-            sport_type=raw_data.get("strSport", ""),
+        return TeamRecord(
+            team_id=_parse_str(raw_data.get("idTeam")) or "",
+            team_name=_parse_str(raw_data.get("strTeam")) or "",
+            alternate_name=_parse_str(raw_data.get("strAlternate")),
+            formation_year=_parse_str(raw_data.get("intFormedYear")),
+            sport_type="Soccer",
+            league_name=_parse_str(raw_data.get("strLeague")),
+            stadium_name=_parse_str(raw_data.get("strStadium")),
+            stadium_location=_parse_str(raw_data.get("strStadiumLocation")),
+            team_description=_parse_str(raw_data.get("strDescriptionEN")),
+            badge_image_url=_parse_str(raw_data.get("strTeamBadge")),
+            jersey_image_url=_parse_str(raw_data.get("strTeamJersey")),
+            official_website=_parse_str(raw_data.get("strWebsite")),
+            facebook_url=_parse_str(raw_data.get("strFacebook")),
+            twitter_url=_parse_str(raw_data.get("strTwitter")),
+            youtube_url=_parse_str(raw_data.get("strYoutube")),
+        )
+
+    @staticmethod
+    def _transform_api_data_to_event(raw_data: dict[str, Any]) -> MatchEvent | None:
+        """
+        Transform raw API data into a compact match event.
+
+        Args:
+            raw_data: Raw event dictionary from the API
+
+        Returns:
+            MatchEvent instance if both teams are known, None otherwise
+        """
+        if not (raw_data.get("idHomeTeam") and raw_data.get("idAwayTeam")):
+            return None
+
+        kickoff = raw_data.get("strTimestamp") or (
+            f"{raw_data['dateEvent']}T{raw_data.get('strTime') or '00:00:00'}"
+            if raw_data.get("dateEvent")
+            else None
+        )
+        return MatchEvent(
+            event_id=raw_data.get("idEvent", ""),
             league_name=raw_data.get("strLeague"),
-            stadium_name=raw_data.get("strStadium"),
-            stadium_location=raw_data.get("strStadiumLocation"),
-            team_description=raw_data.get("strDescriptionEN"),
-            badge_image_url=raw_data.get("strTeamBadge"),
-            jersey_image_url=raw_data.get("strTeamJersey"),
-            official_website=raw_data.get("strWebsite"),
-            facebook_url=raw_data.get("strFacebook"),
-            twitter_url=raw_data.get("strTwitter"),
-            youtube_url=raw_data.get("strYoutube"),
+            round=raw_data.get("intRound"),
+            home_team_id=raw_data["idHomeTeam"],
+            home_team_name=raw_data.get("strHomeTeam", ""),
+            away_team_id=raw_data["idAwayTeam"],
+            away_team_name=raw_data.get("strAwayTeam", ""),
+            kickoff=kickoff[:19] if kickoff else None,
+            venue=raw_data.get("strVenue"),
+            home_score=_parse_int(raw_data.get("intHomeScore")),
+            away_score=_parse_int(raw_data.get("intAwayScore")),
+            status=raw_data.get("strStatus"),
+        )
+
+    @staticmethod
+    def _transform_api_data_to_standing(
+        raw_data: dict[str, Any],
+    ) -> StandingRow | None:
+        """
+        Transform raw API data into a compact league table row.
+
+        Args:
+            raw_data: Raw table row dictionary from the API
+
+        Returns:
+            StandingRow instance if the row has a team and rank, None otherwise
+        """
+        rank = _parse_int(raw_data.get("intRank"))
+        if rank is None or not raw_data.get("idTeam"):
+            return None
+
+        return StandingRow(
+            rank=rank,
+            team_id=raw_data["idTeam"],
+            team_name=raw_data.get("strTeam", ""),
+            played=_parse_int(raw_data.get("intPlayed")) or 0,
+            wins=_parse_int(raw_data.get("intWin")) or 0,
+            draws=_parse_int(raw_data.get("intDraw")) or 0,
+            losses=_parse_int(raw_data.get("intLoss")) or 0,
+            goals_for=_parse_int(raw_data.get("intGoalsFor")) or 0,
+            goals_against=_parse_int(raw_data.get("intGoalsAgainst")) or 0,
+            goal_difference=_parse_int(raw_data.get("intGoalDifference")) or 0,
+            points=_parse_int(raw_data.get("intPoints")) or 0,
+            form=raw_data.get("strForm"),
         )
 
+    @staticmethod
+    def _project_api_response(api_response: dict[str, Any]) -> dict[str, Any]:
+        """
+        Drop the raw team fields that are never transformed.
+
+        TheSportsDB returns dozens of fields per team, including descriptions
+        in every language; only the mapped ones are kept in the caches.
+
+        Args:
+            api_response: Decoded API response
+
+        Returns:
+            Response with every team reduced to the mapped fields
+        """
+        if not api_response.get("teams"):
+            return api_response
+
+        return {
+            **api_response,
+            "teams": [
+                {
+                    field: raw_team[field]
+                    for field in _RAW_TEAM_FIELDS
+                    if field in raw_team
+                }
+                for raw_team in api_response["teams"]
+            ],
+        }
+
     async def _execute_api_request(self, endpoint: str) -> dict[str, Any]:
         """
         Execute HTTP request to the sports API.
 
+        GET requests are idempotent, so slow ones are hedged when a hedged
+        executor is configured.
+
         Args:
             endpoint: API endpoint to call
 
         Returns:
             JSON response data
 
+        Raises:
+            HTTPStatusError: If the API request fails
+        """
+        endpoint_name = endpoint.partition("?")[0]
+        if self._hedged_executor is None:
+            return await self._send_api_request(endpoint, endpoint_name)
+        return await self._hedged_executor.run(
+            endpoint_name, lambda: self._send_api_request(endpoint, endpoint_name)
+        )
+
+    async def _send_api_request(
+        self, endpoint: str, endpoint_name: str
+    ) -> dict[str, Any]:
+        """
+        Send one GET request to the sports API.
+
+        Args:
+            endpoint: API endpoint to call
+            endpoint_name: Endpoint without query parameters, used as metric label
+
+        Returns:
+            JSON response data
+
         Raises:
             HTTPStatusError: If the API request fails
         """
         full_url = f"{self._api_base_url}/{self._api_key}/{endpoint}"
-        response = await self._http_client.get(full_url)
-        response.raise_for_status()
-        return response.json()
+        self._upstream_requests += 1
+        with self._metrics_service.track_upstream("thesportsdb", endpoint_name):
+            response = await self._http_client.get(full_url)
+            response.raise_for_status()
+        return self._project_api_response(decode_json(response.content))
+
+    async def _execute_cached_api_request(self, endpoint: str) -> dict[str, Any]:
+        """
+        Execute an API request through the response cache.
+
+        Fresh entries are returned directly, stale entries are returned while a
+        background revalidation runs, and misses are fetched once no matter how
+        many callers ask for the same endpoint concurrently.
+
+        Args:
+            endpoint: API endpoint to call
+
+        Returns:
+            JSON response data
+
+        Raises:
+            HTTPStatusError: If the API request fails on a cache miss
+        """
+        cache_key = endpoint.casefold()
+        cache_entry = self._response_cache.get(cache_key)
+
+        if cache_entry is not None and cache_entry.is_fresh(time.monotonic()):
+            self._cache_hits += 1
+            return cache_entry.value
+
+        if cache_entry is not None:
+            self._stale_hits += 1
+            revalidation = self._single_flight.start(
+                cache_key, lambda: self._fetch_and_cache(cache_key, endpoint)
+            )
+            revalidation.add_done_callback(self._record_revalidation_result)
+            return cache_entry.value
+
+        self._cache_misses += 1
+        return await self._single_flight.run(
+            cache_key, lambda: self._fetch_and_cache(cache_key, endpoint)
+        )
+
+    async def _fetch_and_cache(self, cache_key: str, endpoint: str) -> dict[str, Any]:
+        """
+        Fetch an endpoint from the API and store the response in the cache.
+
+        A fresh response stored in the shared cache by another worker is used
+        instead of calling the API. Empty results are cached with the short
+        negative TTL and no stale window.
 
-    async def search_teams_by_name(self, team_name: str) -> list[FootballTeam]:
+        Args:
+            cache_key: Key under which the response is cached
+            endpoint: API endpoint to call
+
+        Returns:
+            JSON response data
+        """
+        shared_cache_key = f"sports_data:{cache_key}"
+        if self._shared_cache is not None:
+            shared_entry = await self._shared_cache.get(shared_cache_key)
+            if shared_entry is not None:
+                fresh_seconds = shared_entry["fresh_until"] - time.time()
+                if fresh_seconds > 0:
+                    self._shared_hits += 1
+                    self._response_cache.set(
+                        cache_key,
+                        shared_entry["value"],
+                        ttl=fresh_seconds,
+                        stale_ttl=shared_entry["stale_until"]
+                        - shared_entry["fresh_until"],
+                    )
+                    return shared_entry["value"]
+
+        api_response = await self._execute_api_request(endpoint)
+
+        if api_response.get("teams"):
+            endpoint_name = endpoint.partition("?")[0]
+            ttl = self._endpoint_ttls.get(endpoint_name, self._negative_ttl)
+            stale_ttl = self._stale_ttl
+        else:
+            ttl = self._negative_ttl
+            stale_ttl = 0.0
+        self._response_cache.set(cache_key, api_response, ttl=ttl, stale_ttl=stale_ttl)
+
+        if self._shared_cache is not None:
+            fresh_until = time.time() + ttl
+            await self._shared_cache.set(
+                shared_cache_key,
+                {
+                    "value": api_response,
+                    "fresh_until": fresh_until,
+                    "stale_until": fresh_until + stale_ttl,
+                },
+                ttl=ttl + stale_ttl,
+            )
+
+        return api_response
+
+    def _record_revalidation_result(self, revalidation: asyncio.Task) -> None:
+        """
+        Consume the outcome of a background revalidation.
+
+        A failed revalidation keeps serving the stale entry until its stale
+        window ends.
+
+        Args:
+            revalidation: Finished revalidation task
+        """
+        if not revalidation.cancelled() and revalidation.exception() is not None:
+            self._failed_revalidations += 1
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """
+        Get response cache statistics.
+
+        Returns:
+            Hit, stale-hit, shared-hit and miss counters, upstream requests and
+            cache occupancy
+        """
+        lookups = self._cache_hits + self._stale_hits + self._cache_misses
+        return {
+            "hits": self._cache_hits,
+            "stale_hits": self._stale_hits,
+            "misses": self._cache_misses,
+            "shared_hits": self._shared_hits,
+            "hit_ratio": (self._cache_hits + self._stale_hits) / lookups
+            if lookups
+            else 0.0,
+            "upstream_requests": self._upstream_requests,
+            "failed_revalidations": self._failed_revalidations,
+            **self._response_cache.get_stats(),
+            **self._single_flight.get_stats(),
+        }
+
+    async def search_teams_by_name(
+        self, team_name: str, fields: Iterable[str] | None = None
+    ) -> list[dict[str, Any]]:
         """
         Search for football teams by name.
 
         Args:
             team_name: Name or partial name of the team to search
+            fields: Names of the FootballTeam fields to return; all if None
 
         Returns:
-            List of matching FootballTeam instances
+            List of matching teams projected to the requested fields
         """
         try:
-            api_response = await self._execute_api_request(
-                f"searchteams.php?t={team_name}"
+            api_response = await self._execute_cached_api_request(
+                f"searchteams.php?t={team_name.strip()}"
             )
             teams = [
-                team.model_dump()
-                for raw_team_data in api_response.get("teams", [])
+                team.project(fields)
+                for raw_team_data in api_response.get("teams") or []
                 if (team := self._transform_api_data_to_team(raw_team_data)) is not None
             ]
             return teams
@@ -102,14 +460,186 @@ class SportsDataService:
             FootballTeam instance if found, None otherwise
         """
         try:
-            api_response = await self._execute_api_request(
-                f"lookupteam.php?id={team_id}"
+            api_response = await self._execute_cached_api_request(
+                f"lookupteam.php?id={team_id.strip()}"
             )
             raw_team_data = (api_response.get("teams") or [None])[0]
-            return (
+            team = (
                 self._transform_api_data_to_team(raw_team_data)
                 if raw_team_data
                 else None
             )
+            return team.to_model() if team is not None else None
         except (TimeoutException, HTTPStatusError):
             return None
+
+    async def list_soccer_leagues(self) -> list[str]:
+        """
+        List the names of all soccer leagues known to the API.
+
+        Returns:
+            League names, or an empty list on timeout/HTTP error
+        """
+        return [
+            league["strLeague"] for league in await self.list_soccer_league_details()
+        ]
+
+    async def list_soccer_league_details(self) -> list[dict[str, Any]]:
+        """
+        List all soccer leagues known to the API with their IDs and alternate names.
+
+        Returns:
+            Raw league entries with idLeague, strLeague and strLeagueAlternate,
+            or an empty list on timeout/HTTP error
+        """
+        try:
+            api_response = await self._execute_api_request("all_leagues.php")
+        except (TimeoutException, HTTPStatusError):
+            return []
+
+        return [
+            league
+            for league in api_response.get("leagues") or []
+            if league.get("strSport") == "Soccer" and league.get("strLeague")
+        ]
+
+    async def get_league_teams(
+        self, league_name: str, previous_version: str | None = None
+    ) -> tuple[list[TeamRecord] | None, str | None]:
+        """
+        Get all teams of a league unless they changed since the previous version.
+
+        Args:
+            league_name: Exact name of the league
+            previous_version: Version returned by an earlier call for this league
+
+        Returns:
+            Tuple of teams (None when unchanged) and the current version
+
+        Raises:
+            HTTPStatusError: If the API request fails
+        """
+        api_response, current_version = await self._execute_versioned_api_request(
+            f"search_all_teams.php?l={league_name}", previous_version
+        )
+        if api_response is None:
+            return None, current_version
+
+        teams = [
+            team
+            for raw_team_data in api_response.get("teams") or []
+            if (team := self._transform_api_data_to_team(raw_team_data)) is not None
+        ]
+        return teams, current_version
+
+    async def get_league_events(
+        self, league_id: str, upcoming: bool, previous_version: str | None = None
+    ) -> tuple[list[MatchEvent] | None, str | None]:
+        """
+        Get the upcoming or latest matches of a league unless they changed.
+
+        Args:
+            league_id: TheSportsDB ID of the league
+            upcoming: Whether to fetch upcoming matches instead of played ones
+            previous_version: Version returned by an earlier call for this league
+
+        Returns:
+            Tuple of matches (None when unchanged) and the current version
+
+        Raises:
+            HTTPStatusError: If the API request fails
+        """
+        endpoint_name = "eventsnextleague.php" if upcoming else "eventspastleague.php"
+        api_response, current_version = await self._execute_versioned_api_request(
+            f"{endpoint_name}?id={league_id}", previous_version
+        )
+        if api_response is None:
+            return None, current_version
+
+        events = [
+            event
+            for raw_event_data in api_response.get("events") or []
+            if (event := self._transform_api_data_to_event(raw_event_data)) is not None
+        ]
+        return events, current_version
+
+    async def get_league_table(
+        self, league_id: str, season: str = "", previous_version: str | None = None
+    ) -> tuple[list[StandingRow] | None, str | None]:
+        """
+        Get the table of a league unless it changed since the previous version.
+
+        Args:
+            league_id: TheSportsDB ID of the league
+            season: Season such as "2024-2025"; the current season if empty
+            previous_version: Version returned by an earlier call for this league
+
+        Returns:
+            Tuple of table rows ordered by rank (None when unchanged) and the
+            current version
+
+        Raises:
+            HTTPStatusError: If the API request fails
+        """
+        endpoint = f"lookuptable.php?l={league_id}"
+        if season:
+            endpoint += f"&s={season}"
+        api_response, current_version = await self._execute_versioned_api_request(
+            endpoint, previous_version
+        )
+        if api_response is None:
+            return None, current_version
+
+        standing_rows = [
+            standing_row
+            for raw_row_data in api_response.get("table") or []
+            if (standing_row := self._transform_api_data_to_standing(raw_row_data))
+            is not None
+        ]
+        return sorted(standing_rows, key=lambda row: row.rank), current_version
+
+    async def _execute_versioned_api_request(
+        self, endpoint: str, previous_version: str | None
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        """
+        Fetch a bulk endpoint unless its content changed since the previous version.
+
+        Uses a conditional request when the API supplied an ETag before and
+        falls back to comparing a content hash otherwise. Bulk endpoints are
+        polled by background refreshes, so they bypass the response cache.
+
+        Args:
+            endpoint: API endpoint to call
+            previous_version: Version returned by an earlier call for the endpoint
+
+        Returns:
+            Tuple of the decoded response (None when unchanged) and the
+            current version
+
+        Raises:
+            HTTPStatusError: If the API request fails
+        """
+        endpoint_name = endpoint.partition("?")[0]
+        full_url = f"{self._api_base_url}/{self._api_key}/{endpoint}"
+        headers = {}
+        if previous_version and previous_version.startswith("etag:"):
+            headers["If-None-Match"] = previous_version.removeprefix("etag:")
+
+        self._upstream_requests += 1
+        with self._metrics_service.track_upstream("thesportsdb", endpoint_name):
+            response = await self._http_client.get(full_url, headers=headers)
+            if response.status_code != 304:
+                response.raise_for_status()
+        if response.status_code == 304:
+            return None, previous_version
+
+        etag = response.headers.get("ETag")
+        current_version = (
+            f"etag:{etag}"
+            if etag
+            else f"sha:{hashlib.blake2b(response.content, digest_size=16).hexdigest()}"
+        )
+        if current_version == previous_version:
+            return None, current_version
+
+        return decode_json(response.content), current_version
@@ -0,0 +1,428 @@
+import asyncio
+import logging
+import re
+import sys
+import time
+import unicodedata
+from collections import Counter
+from typing import Any, Callable, Iterable
+
+from httpx import HTTPError
+
+from app.domain.models.team_models import TeamRecord
+from app.services.sports_data_service import SportsDataService
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_NOISE_TOKENS = frozenset(
+    {"fc", "afc", "cf", "sc", "ac", "fk", "sk", "cd", "club", "the"}
+)
+_TRIGRAM_SIZE = 3
+
+
+def normalize_team_name(team_name: str) -> str:
+    """
+    Normalize a team name for matching.
+
+    Strips accents and punctuation, lowercases, and drops common club affixes
+    such as "FC" or "AFC".
+
+    Args:
+        team_name: Raw team name or alias
+
+    Returns:
+        Normalized name, possibly empty
+    """
+    ascii_name = (
+        unicodedata.normalize("NFKD", team_name).encode("ascii", "ignore").decode()
+    )
+    tokens = _TOKEN_PATTERN.findall(ascii_name.lower())
+    meaningful_tokens = [token for token in tokens if token not in _NOISE_TOKENS]
+    return " ".join(meaningful_tokens or tokens)
+
+
+def _extract_trigrams(normalized_name: str) -> set[str]:
+    """
+    Split a normalized name into padded character trigrams.
+
+    Args:
+        normalized_name: Name produced by normalize_team_name
+
+    Returns:
+        Set of trigrams
+    """
+    padded_name = f"  {normalized_name} "
+    return {
+        padded_name[start : start + _TRIGRAM_SIZE]
+        for start in range(len(padded_name) - _TRIGRAM_SIZE + 1)
+    }
+
+
+class TeamIndexService:
+    """
+    Local in-memory index of soccer teams bulk-loaded from TheSportsDB API.
+
+    Supports O(1) lookup by team ID and fuzzy matching over team names and
+    alternate names using character trigrams. A background task periodically
+    refreshes the index and re-indexes only the leagues whose data changed.
+
+    TheSportsDB sends no ETags for league teams, so every refresh downloads
+    every league once and compares content hashes; downloads are paced to
+    stay within the API's request rate limit.
+    """
+
+    def __init__(
+        self,
+        sports_data_service: SportsDataService,
+        refresh_interval_seconds: float,
+        load_concurrency: int = 4,
+        league_names: Iterable[str] | None = None,
+        max_requests_per_minute: float = 0.0,
+    ) -> None:
+        """
+        Initialize the team index.
+
+        Args:
+            sports_data_service: Service used to fetch leagues and their teams
+            refresh_interval_seconds: Delay between background refreshes
+            load_concurrency: Maximum number of leagues fetched concurrently
+            league_names: Optional fixed set of leagues to index instead of all soccer leagues
+            max_requests_per_minute: Maximum rate of league downloads; 0 disables pacing
+        """
+        self._sports_data_service = sports_data_service
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._load_semaphore = asyncio.Semaphore(load_concurrency)
+        self._configured_league_names = tuple(league_names or ())
+        self._request_interval_seconds = (
+            60.0 / max_requests_per_minute if max_requests_per_minute > 0 else 0.0
+        )
+        self._next_request_at = 0.0
+
+        self._teams_by_id: dict[str, TeamRecord] = {}
+        self._team_ids_by_league: dict[str, set[str]] = {}
+        self._league_memberships: Counter[str] = Counter()
+        self._league_versions: dict[str, str | None] = {}
+        self._team_ids_by_alias: dict[str, set[str]] = {}
+        self._aliases_by_team_id: dict[str, tuple[str, ...]] = {}
+        self._alias_keys_by_trigram: dict[str, set[tuple[str, str]]] = {}
+        self._trigram_counts: dict[str, int] = {}
+
+        self._refresh_listeners: list[Callable[["TeamIndexService"], None]] = []
+        self._refresh_task: asyncio.Task | None = None
+        self._is_ready = False
+        self._refresh_count = 0
+        self._league_downloads = 0
+        self._reindexed_leagues = 0
+        self._unchanged_leagues = 0
+        self._failed_leagues = 0
+        self._failed_refreshes = 0
+
+    @property
+    def is_ready(self) -> bool:
+        """
+        Whether the initial bulk load has completed.
+
+        Returns:
+            True once the index can serve lookups
+        """
+        return self._is_ready
+
+    def add_refresh_listener(
+        self, listener: Callable[["TeamIndexService"], None]
+    ) -> None:
+        """
+        Register a callback invoked after every successful refresh.
+
+        Args:
+            listener: Callable receiving the refreshed index
+        """
+        self._refresh_listeners.append(listener)
+
+    def start_background_refresh(self) -> None:
+        """Start the background task that loads and periodically refreshes the index."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._run_refresh_loop())
+
+    async def stop(self) -> None:
+        """Stop the background refresh task."""
+        if self._refresh_task is None:
+            return
+
+        self._refresh_task.cancel()
+        try:
+            await self._refresh_task
+        except asyncio.CancelledError:
+            pass
+        self._refresh_task = None
+
+    async def refresh(self) -> None:
+        """
+        Refresh the index from the API.
+
+        Fetches the league list, downloads the teams of every league,
+        re-indexes leagues whose teams changed and drops leagues that no
+        longer exist.
+        """
+        league_names = (
+            list(self._configured_league_names)
+            or await self._sports_data_service.list_soccer_leagues()
+        )
+        if not league_names:
+            return
+
+        for removed_league in set(self._team_ids_by_league) - set(league_names):
+            self._replace_league_teams(removed_league, [])
+            self._league_versions.pop(removed_league, None)
+
+        await asyncio.gather(
+            *(self._refresh_league(league_name) for league_name in league_names)
+        )
+
+        self._is_ready = True
+        self._refresh_count += 1
+        for listener in self._refresh_listeners:
+            listener(self)
+
+    def get_by_id(self, team_id: str) -> TeamRecord | None:
+        """
+        Look up a team by its unique ID.
+
+        Args:
+            team_id: Unique identifier of the team
+
+        Returns:
+            TeamRecord if indexed, None otherwise
+        """
+        return self._teams_by_id.get(team_id.strip())
+
+    def has_alias(self, normalized_alias: str) -> bool:
+        """
+        Check whether an alias names at least one indexed team.
+
+        Args:
+            normalized_alias: Alias produced by normalize_team_name
+
+        Returns:
+            True if the alias is known, even if it is ambiguous
+        """
+        return normalized_alias in self._team_ids_by_alias
+
+    def canonicalize_alias(self, normalized_alias: str) -> str | None:
+        """
+        Resolve an alias to the primary name of the single team it denotes.
+
+        Args:
+            normalized_alias: Alias produced by normalize_team_name
+
+        Returns:
+            Normalized primary team name, or None if unknown or ambiguous
+        """
+        team_ids = self._team_ids_by_alias.get(normalized_alias)
+        if not team_ids or len(team_ids) > 1:
+            return None
+
+        (team_id,) = team_ids
+        return self._aliases_by_team_id[team_id][0]
+
+    def search(
+        self, team_name: str, limit: int = 5, min_score: float = 0.45
+    ) -> list[TeamRecord]:
+        """
+        Find teams whose name or alternate name matches the query.
+
+        Exact alias matches win, otherwise candidates are ranked by the Dice
+        coefficient of their character trigrams.
+
+        Args:
+            team_name: Full, partial or misspelled team name
+            limit: Maximum number of teams to return
+            min_score: Minimum trigram similarity for fuzzy matches
+
+        Returns:
+            Matching teams ordered by relevance
+        """
+        normalized_query = normalize_team_name(team_name)
+        if not normalized_query:
+            return []
+
+        exact_team_ids = self._team_ids_by_alias.get(normalized_query)
+        if exact_team_ids:
+            return [self._teams_by_id[team_id] for team_id in exact_team_ids][:limit]
+
+        query_trigrams = _extract_trigrams(normalized_query)
+        shared_trigrams: Counter[tuple[str, str]] = Counter()
+        for trigram in query_trigrams:
+            shared_trigrams.update(self._alias_keys_by_trigram.get(trigram, ()))
+
+        best_scores: dict[str, float] = {}
+        for (team_id, alias), shared_count in shared_trigrams.items():
+            score = (
+                2 * shared_count / (len(query_trigrams) + self._trigram_counts[alias])
+            )
+            if alias.startswith(normalized_query):
+                score = max(score, 0.9)
+            if score >= min_score and score > best_scores.get(team_id, 0.0):
+                best_scores[team_id] = score
+
+        ranked_team_ids = sorted(best_scores, key=best_scores.__getitem__, reverse=True)
+        return [self._teams_by_id[team_id] for team_id in ranked_team_ids[:limit]]
+
+    def iter_team_names(self) -> Iterable[str]:
+        """
+        Iterate over the names of all indexed teams.
+
+        Returns:
+            Team name of every indexed team as returned by the API
+        """
+        return (team.team_name for team in self._teams_by_id.values())
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Index size, refresh counters and readiness
+        """
+        return {
+            "ready": self._is_ready,
+            "teams": len(self._teams_by_id),
+            "leagues": len(self._team_ids_by_league),
+            "aliases": len(self._team_ids_by_alias),
+            "trigrams": len(self._alias_keys_by_trigram),
+            "refreshes": self._refresh_count,
+            "league_downloads": self._league_downloads,
+            "reindexed_leagues": self._reindexed_leagues,
+            "unchanged_leagues": self._unchanged_leagues,
+            "failed_leagues": self._failed_leagues,
+            "failed_refreshes": self._failed_refreshes,
+        }
+
+    async def _run_refresh_loop(self) -> None:
+        """
+        Load the index and keep refreshing it at the configured interval.
+
+        A failed refresh is logged and counted; the loop keeps running and
+        the index keeps serving the teams of the last successful refresh.
+        """
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                self._failed_refreshes += 1
+                logger.exception("Team index refresh failed")
+            await asyncio.sleep(self._refresh_interval_seconds)
+
+    async def _refresh_league(self, league_name: str) -> None:
+        """
+        Re-fetch a single league and re-index it if its teams changed.
+
+        Args:
+            league_name: Exact name of the league
+        """
+        async with self._load_semaphore:
+            await self._wait_for_request_slot()
+            self._league_downloads += 1
+            try:
+                teams, version = await self._sports_data_service.get_league_teams(
+                    league_name, self._league_versions.get(league_name)
+                )
+            except HTTPError:
+                self._failed_leagues += 1
+                return
+
+        self._league_versions[league_name] = version
+        if teams is None:
+            self._unchanged_leagues += 1
+            return
+
+        self._replace_league_teams(league_name, teams)
+        self._reindexed_leagues += 1
+
+    async def _wait_for_request_slot(self) -> None:
+        """Delay a league download until the request rate limit allows it."""
+        now = time.monotonic()
+        request_at = max(now, self._next_request_at)
+        self._next_request_at = request_at + self._request_interval_seconds
+        if request_at > now:
+            await asyncio.sleep(request_at - now)
+
+    def _replace_league_teams(self, league_name: str, teams: list[TeamRecord]) -> None:
+        """
+        Replace all indexed teams of a league.
+
+        Args:
+            league_name: Exact name of the league
+            teams: Current teams of the league
+        """
+        previous_team_ids = self._team_ids_by_league.pop(league_name, set())
+        current_team_ids = {sys.intern(team.team_id) for team in teams}
+
+        for team_id in previous_team_ids - current_team_ids:
+            self._league_memberships[team_id] -= 1
+            if not self._league_memberships[team_id]:
+                del self._league_memberships[team_id]
+                self._remove_team(team_id)
+
+        for team in teams:
+            team_id = sys.intern(team.team_id)
+            if team_id not in previous_team_ids:
+                self._league_memberships[team_id] += 1
+            self._remove_team(team_id)
+            self._add_team(team_id, team)
+
+        if current_team_ids:
+            self._team_ids_by_league[league_name] = current_team_ids
+
+    def _add_team(self, team_id: str, team: TeamRecord) -> None:
+        """
+        Add a team and its aliases to the lookup structures.
+
+        Args:
+            team_id: Interned unique identifier of the team
+            team: Team to index
+        """
+        raw_aliases = [team.team_name, *(team.alternate_name or "").split(",")]
+        aliases = tuple(
+            dict.fromkeys(
+                sys.intern(alias)
+                for raw_alias in raw_aliases
+                if (alias := normalize_team_name(raw_alias))
+            )
+        )
+
+        self._teams_by_id[team_id] = team
+        self._aliases_by_team_id[team_id] = aliases
+        for alias in aliases:
+            self._team_ids_by_alias.setdefault(alias, set()).add(team_id)
+            trigrams = _extract_trigrams(alias)
+            self._trigram_counts[alias] = len(trigrams)
+            for trigram in trigrams:
+                self._alias_keys_by_trigram.setdefault(trigram, set()).add(
+                    (team_id, alias)
+                )
+
+    def _remove_team(self, team_id: str) -> None:
+        """
+        Remove a team and its aliases from the lookup structures.
+
+        Args:
+            team_id: Unique identifier of the team
+        """
+        if self._teams_by_id.pop(team_id, None) is None:
+            return
+
+        for alias in self._aliases_by_team_id.pop(team_id, ()):
+            alias_team_ids = self._team_ids_by_alias.get(alias)
+            if alias_team_ids is not None:
+                alias_team_ids.discard(team_id)
+                if not alias_team_ids:
+                    del self._team_ids_by_alias[alias]
+                    self._trigram_counts.pop(alias, None)
+
+            for trigram in _extract_trigrams(alias):
+                alias_keys = self._alias_keys_by_trigram.get(trigram)
+                if alias_keys is not None:
+                    alias_keys.discard((team_id, alias))
+                    if not alias_keys:
+                        del self._alias_keys_by_trigram[trigram]
@@ -0,0 +1,270 @@
+import re
+import unicodedata
+from typing import Any
+from urllib.parse import urlsplit
+
+from langchain_core.tools import BaseTool
+
+from app.services.config_service import AppConfig
+from app.services.metrics_service import MetricsService
+from app.services.route_classifier_data import TIME_SENSITIVE_LEXICON
+from app.utils.cache_backend import CacheBackend
+from app.utils.single_flight import SingleFlight
+from app.utils.text_similarity import NearDuplicateFilter
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_POSSESSIVE_PATTERN = re.compile(r"['’]s\b")
+_QUERY_STOPWORDS = frozenset(
+    {
+        "a",
+        "an",
+        "the",
+        "is",
+        "are",
+        "was",
+        "were",
+        "do",
+        "does",
+        "did",
+        "of",
+        "in",
+        "on",
+        "for",
+        "to",
+        "me",
+        "tell",
+        "please",
+        "about",
+        "what",
+        "whats",
+        "who",
+        "how",
+        "any",
+        "there",
+    }
+)
+_NEAR_DUPLICATE_THRESHOLD = 0.7
+
+
+class WebSearchService:
+    """
+    Web search layer in front of the Tavily search tool.
+
+    Questions are normalized into an order-insensitive query key, so that
+    rephrasings of the same news question share one cached result and
+    concurrent identical searches share one request. Results about
+    time-sensitive topics such as scores or transfers expire sooner than
+    others. Before results are cached and handed to the agents, duplicate
+    URLs and near-duplicate snippets are dropped and long bodies truncated.
+    """
+
+    def __init__(
+        self,
+        app_config: AppConfig,
+        search_tool: BaseTool | None = None,
+        metrics_service: MetricsService | None = None,
+        cache_backend: CacheBackend | None = None,
+    ) -> None:
+        """
+        Initialize the web search service.
+
+        Args:
+            app_config: Application configuration containing cache and result limits
+            search_tool: Optional search tool used instead of Tavily
+            metrics_service: Metrics service recording search requests
+            cache_backend: Optional cache for processed results keyed by query
+        """
+        if search_tool is None:
+            from langchain_tavily import TavilySearch
+
+            search_tool = TavilySearch(topic="general")
+
+        self._search_tool = search_tool
+        self._metrics_service = metrics_service or MetricsService()
+        self._cache_backend = cache_backend
+        self._ttl_seconds = app_config.WEB_SEARCH_CACHE_TTL_SECONDS
+        self._time_sensitive_ttl_seconds = (
+            app_config.WEB_SEARCH_CACHE_TIME_SENSITIVE_TTL_SECONDS
+        )
+        self._max_results = app_config.WEB_SEARCH_MAX_RESULTS
+        self._max_result_characters = app_config.WEB_SEARCH_RESULT_MAX_CHARACTERS
+        self._single_flight = SingleFlight()
+
+        self._searches = 0
+        self._dropped_results = 0
+        self._truncated_results = 0
+        self._raw_characters = 0
+        self._kept_characters = 0
+
+    async def search(self, question: str) -> Any:
+        """
+        Search the web for football content answering a question.
+
+        Args:
+            question: Raw user question
+
+        Returns:
+            Processed search results with query and results, or the raw tool
+            output if the search failed
+        """
+        normalized_query = self.normalize_query(question)
+        return await self._single_flight.run(
+            normalized_query,
+            lambda: self._search(f"football soccer {question}", normalized_query),
+        )
+
+    @staticmethod
+    def normalize_query(question: str) -> str:
+        """
+        Normalize a question into a search cache key.
+
+        Strips accents, punctuation, possessives and filler words, and sorts
+        the remaining tokens so that word order does not matter. Letters of
+        any script are kept, so non-Latin questions get keys of their own.
+
+        Args:
+            question: Raw user question
+
+        Returns:
+            Normalized query, or the case-folded question if no tokens remain
+        """
+        folded_question = "".join(
+            character
+            for character in unicodedata.normalize("NFKD", question.casefold())
+            if not unicodedata.combining(character)
+        )
+        tokens = _TOKEN_PATTERN.findall(_POSSESSIVE_PATTERN.sub("", folded_question))
+        return (
+            " ".join(
+                sorted({token for token in tokens if token not in _QUERY_STOPWORDS})
+            )
+            or question.strip().casefold()
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get web search statistics.
+
+        Returns:
+            Upstream searches, coalescing and cache counters, and the share of
+            result characters kept after post-processing
+        """
+        stats = {
+            "searches": self._searches,
+            "dropped_results": self._dropped_results,
+            "truncated_results": self._truncated_results,
+            "kept_character_ratio": self._kept_characters / self._raw_characters
+            if self._raw_characters
+            else 0.0,
+            **self._single_flight.get_stats(),
+        }
+        if self._cache_backend is not None:
+            stats["cache"] = self._cache_backend.get_stats()
+        return stats
+
+    async def _search(self, query: str, normalized_query: str) -> Any:
+        """
+        Run one search request through the result cache and the search tool.
+
+        Failed searches are not cached.
+
+        Args:
+            query: Search query sent to the search tool
+            normalized_query: Normalized question used as cache key
+
+        Returns:
+            Processed search results, or the raw tool output on failure
+        """
+        cache_key = f"web_search:{normalized_query}"
+        if self._cache_backend is not None:
+            cached_results = await self._cache_backend.get(cache_key)
+            if cached_results is not None:
+                return cached_results
+
+        self._searches += 1
+        with self._metrics_service.track_upstream("tavily", "search"):
+            raw_results = await self._search_tool.ainvoke(query)
+
+        if not isinstance(raw_results, dict) or "error" in raw_results:
+            return raw_results
+
+        search_results = self._process_results(raw_results)
+        if self._cache_backend is not None:
+            await self._cache_backend.set(
+                cache_key, search_results, self._get_ttl(normalized_query)
+            )
+        return search_results
+
+    def _get_ttl(self, normalized_query: str) -> float:
+        """
+        Get how long the results of a query stay cached.
+
+        Args:
+            normalized_query: Normalized question
+
+        Returns:
+            Short TTL for time-sensitive topics, the default TTL otherwise
+        """
+        if TIME_SENSITIVE_LEXICON.intersection(normalized_query.split()):
+            return self._time_sensitive_ttl_seconds
+        return self._ttl_seconds
+
+    def _process_results(self, raw_results: dict[str, Any]) -> dict[str, Any]:
+        """
+        Deduplicate, truncate and slim down raw search results.
+
+        Results are kept in relevance order with only their title, URL and
+        truncated content; results whose URL or snippet repeats an earlier
+        result are dropped.
+
+        Args:
+            raw_results: Raw output of the search tool
+
+        Returns:
+            Query and processed results
+        """
+        seen_urls: set[str] = set()
+        near_duplicate_filter = NearDuplicateFilter(_NEAR_DUPLICATE_THRESHOLD)
+        search_results: list[dict[str, Any]] = []
+
+        for raw_result in raw_results.get("results") or []:
+            content = " ".join((raw_result.get("content") or "").split())
+            self._raw_characters += len(content)
+            url_key = self._normalize_url(raw_result.get("url") or "")
+            if (
+                len(search_results) >= self._max_results
+                or url_key in seen_urls
+                or near_duplicate_filter.is_duplicate(content)
+            ):
+                self._dropped_results += 1
+                continue
+
+            seen_urls.add(url_key)
+            if len(content) > self._max_result_characters:
+                self._truncated_results += 1
+                content = content[: self._max_result_characters].rsplit(" ", 1)[0] + "…"
+            self._kept_characters += len(content)
+            search_results.append(
+                {
+                    "title": raw_result.get("title") or "",
+                    "url": raw_result.get("url") or "",
+                    "content": content,
+                }
+            )
+
+        return {"query": raw_results.get("query"), "results": search_results}
+
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """
+        Reduce a URL to the parts that identify the page.
+
+        Args:
+            url: Result URL
+
+        Returns:
+            Host without "www." and path without trailing slash
+        """
+        split_url = urlsplit(url.strip())
+        host = split_url.netloc.casefold().removeprefix("www.")
+        return f"{host}{split_url.path.rstrip('/')}"
@@ -1,3 +1,11 @@
 from app.tools.football_api_tools import FootballAPITools
+from app.tools.tavily_search_tools import (
+    PooledTavilySearchTool,
+    create_tavily_search_tool,
+)
 
-__all__ = ["FootballAPITools"]
+__all__ = [
+    "FootballAPITools",
+    "PooledTavilySearchTool",
+    "create_tavily_search_tool",
+]
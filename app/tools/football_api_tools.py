@@ -1,11 +1,17 @@
-from langchain.tools import StructuredTool
+from dataclasses import asdict
+from typing import Any, Iterable
+
+from langchain_core.tools import StructuredTool
 from httpx import TimeoutException, HTTPStatusError
 
+from app.services.fixtures_store_service import FixturesStoreService
 from app.services.sports_data_service import SportsDataService
+from app.services.team_index_service import TeamIndexService
+from app.domain.models.fixture_models import LeagueTableInput, TeamFixturesInput
 from app.domain.models.team_models import (
     SearchTeamsInput,
     GetTeamDetailsInput,
-    FootballTeam,
+    TEAM_FIELDS,
 )
 
 
@@ -13,27 +19,55 @@ class FootballAPITools:
     """
     Collection of LangChain StructuredTool instances for football data operations.
 
-    Provides two high-level tools:
+    Provides five high-level tools:
     - search_teams_by_name: find soccer teams by name or partial name
     - get_team_details_by_id: fetch comprehensive team info by its unique ID
-
-    Both tools delegate actual HTTP interactions and JSON parsing
-    to a SportsDataService, and handle transient errors gracefully.
+    - get_upcoming_matches: list the next matches of a team
+    - get_recent_results: list the latest results of a team
+    - get_league_table: fetch the current table of a league
+
+    The team tools are served from the local TeamIndexService when it is
+    loaded and delegate to a SportsDataService otherwise, handling transient
+    errors gracefully. Teams are projected to the configured fields, so the
+    agent context only carries the data answers are built from. The fixture
+    tools are served from the local FixturesStoreService only.
     """
 
-    def __init__(self, sports_data_service: SportsDataService):
+    def __init__(
+        self,
+        sports_data_service: SportsDataService,
+        team_index: TeamIndexService | None = None,
+        team_fields: Iterable[str] | None = None,
+        fixtures_store: FixturesStoreService | None = None,
+    ):
         """
         Initialize the FootballAPITools with a SportsDataService.
 
         Args:
             sports_data_service: Service instance responsible for talking to
-                                 TheSportsDB API and returning FootballTeam models.
+                                 TheSportsDB API and returning team data.
+            team_index: Optional local team index probed before the API.
+            team_fields: FootballTeam fields returned by the tools; all if None.
+            fixtures_store: Optional local store of fixtures, results and tables.
+
+        Raises:
+            ValueError: If a requested field does not exist on FootballTeam.
 
         Attributes:
             search_teams_by_name (StructuredTool): Tool for searching teams.
             get_team_details_by_id (StructuredTool): Tool for retrieving team details.
+            get_upcoming_matches (StructuredTool): Tool for a team's next matches.
+            get_recent_results (StructuredTool): Tool for a team's latest results.
+            get_league_table (StructuredTool): Tool for retrieving a league table.
         """
         self._sports_data_service = sports_data_service
+        self._team_index = team_index
+        self._fixtures_store = fixtures_store
+        self._team_fields = tuple(team_fields) if team_fields else None
+        if unknown_fields := set(self._team_fields or ()) - set(TEAM_FIELDS):
+            raise ValueError(
+                "Unknown team fields: {}".format(", ".join(sorted(unknown_fields)))
+            )
 
         self.search_teams_by_name = StructuredTool.from_function(
             name="search_teams_by_name",
@@ -51,7 +85,31 @@ class FootballAPITools:
             return_direct=True,
         )
 
-    async def _search_teams_by_name(self, team_name: str) -> list[FootballTeam]:
+        self.get_upcoming_matches = StructuredTool.from_function(
+            name="get_upcoming_matches",
+            description="Get the next scheduled matches of a soccer team",
+            coroutine=self._get_upcoming_matches,
+            args_schema=TeamFixturesInput,
+            return_direct=True,
+        )
+
+        self.get_recent_results = StructuredTool.from_function(
+            name="get_recent_results",
+            description="Get the latest match results of a soccer team",
+            coroutine=self._get_recent_results,
+            args_schema=TeamFixturesInput,
+            return_direct=True,
+        )
+
+        self.get_league_table = StructuredTool.from_function(
+            name="get_league_table",
+            description="Get the current standings table of a soccer league",
+            coroutine=self._get_league_table,
+            args_schema=LeagueTableInput,
+            return_direct=True,
+        )
+
+    async def _search_teams_by_name(self, team_name: str) -> list[dict[str, Any]]:
         """
         Internal method: search for football teams matching a name.
 
@@ -61,15 +119,22 @@ class FootballAPITools:
             team_name: Full or partial name of the soccer team to look up.
 
         Returns:
-            A list of FootballTeam objects matching the query.
+            A list of team dictionaries matching the query, projected to the
+            configured fields.
             Returns an empty list if no teams found or on timeout/HTTP error.
         """
+        if self._team_index is not None and self._team_index.is_ready:
+            if indexed_teams := self._team_index.search(team_name):
+                return [team.project(self._team_fields) for team in indexed_teams]
+
         try:
-            return await self._sports_data_service.search_teams_by_name(team_name)
+            return await self._sports_data_service.search_teams_by_name(
+                team_name, self._team_fields
+            )
         except (TimeoutException, HTTPStatusError):
             return []
 
-    async def _get_team_details_by_id(self, team_id: str) -> FootballTeam | None:
+    async def _get_team_details_by_id(self, team_id: str) -> dict[str, Any] | None:
         """
         Internal method: fetch detailed football team info by its ID.
 
@@ -79,10 +144,79 @@ class FootballAPITools:
             team_id: Unique identifier for the soccer team in TheSportsDB.
 
         Returns:
-            FootballTeam instance with complete data if found.
+            Team dictionary projected to the configured fields if found.
             None if the team does not exist or on timeout/HTTP error.
         """
+        if self._team_index is not None and self._team_index.is_ready:
+            if indexed_team := self._team_index.get_by_id(team_id):
+                return indexed_team.project(self._team_fields)
+
         try:
-            return await self._sports_data_service.get_team_details_by_id(team_id)
+            team = await self._sports_data_service.get_team_details_by_id(team_id)
         except (TimeoutException, HTTPStatusError):
             return None
+        return (
+            team.model_dump(include=set(self._team_fields or TEAM_FIELDS))
+            if team is not None
+            else None
+        )
+
+    async def _get_upcoming_matches(self, team_name: str) -> list[dict[str, Any]]:
+        """
+        Internal method: list the next matches of a team.
+
+        Wrapped by the `get_upcoming_matches` StructuredTool.
+
+        Args:
+            team_name: Full or partial name of the soccer team.
+
+        Returns:
+            Upcoming matches ordered by kickoff.
+            Returns an empty list if the team is unknown or the store is not loaded.
+        """
+        if self._fixtures_store is None or not self._fixtures_store.is_ready:
+            return []
+        return [
+            asdict(match)
+            for match in self._fixtures_store.get_upcoming_matches(team_name)
+        ]
+
+    async def _get_recent_results(self, team_name: str) -> list[dict[str, Any]]:
+        """
+        Internal method: list the latest results of a team.
+
+        Wrapped by the `get_recent_results` StructuredTool.
+
+        Args:
+            team_name: Full or partial name of the soccer team.
+
+        Returns:
+            Played matches ordered by kickoff, latest first.
+            Returns an empty list if the team is unknown or the store is not loaded.
+        """
+        if self._fixtures_store is None or not self._fixtures_store.is_ready:
+            return []
+        return [
+            asdict(match)
+            for match in self._fixtures_store.get_recent_results(team_name)
+        ]
+
+    async def _get_league_table(self, league_name: str) -> list[dict[str, Any]]:
+        """
+        Internal method: fetch the table of a league.
+
+        Wrapped by the `get_league_table` StructuredTool.
+
+        Args:
+            league_name: Name or alternate name of the soccer league.
+
+        Returns:
+            Table rows ordered by rank.
+            Returns an empty list if the league is unknown or the store is not loaded.
+        """
+        if self._fixtures_store is None or not self._fixtures_store.is_ready:
+            return []
+        return [
+            asdict(standing_row)
+            for standing_row in self._fixtures_store.get_league_table(league_name)
+        ]
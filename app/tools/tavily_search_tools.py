@@ -0,0 +1,128 @@
+from typing import Any
+
+import httpx
+from langchain_core.tools import BaseTool
+from pydantic import PrivateAttr, SecretStr
+
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+
+
+class PooledTavilySearchTool(BaseTool):
+    """
+    Tavily search tool sending its requests through a shared httpx client.
+
+    Replaces the stock langchain-tavily tool, whose wrapper opens a new
+    aiohttp session, and therefore a new TLS connection, for every search.
+    Failed searches return an error payload instead of raising, like the
+    stock tool.
+    """
+
+    name: str = "tavily_search"
+    description: str = (
+        "A search engine optimized for comprehensive, accurate, and trusted results. "
+        "Useful for when you need to answer questions about current events."
+    )
+    tavily_api_key: SecretStr
+    topic: str = "general"
+    max_results: int = 5
+    search_depth: str = "basic"
+
+    _http_client: httpx.AsyncClient = PrivateAttr()
+
+    def __init__(self, http_client: httpx.AsyncClient, **data: Any) -> None:
+        """
+        Initialize the tool.
+
+        Args:
+            http_client: Pooled client used for all asynchronous searches
+            **data: Tool fields such as tavily_api_key and topic
+        """
+        super().__init__(**data)
+        self._http_client = http_client
+
+    def _run(self, query: str) -> dict[str, Any]:
+        """
+        Search synchronously with a one-off connection.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Decoded Tavily response, or an error payload if the search failed
+        """
+        try:
+            response = httpx.post(
+                TAVILY_SEARCH_URL,
+                json=self._build_payload(query),
+                headers=self._build_headers(),
+                timeout=self._http_client.timeout,
+            )
+            response.raise_for_status()
+            return response.json()
+        except (httpx.HTTPError, ValueError) as exc:
+            return {"error": str(exc) or type(exc).__name__}
+
+    async def _arun(self, query: str) -> dict[str, Any]:
+        """
+        Search asynchronously through the pooled client.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Decoded Tavily response, or an error payload if the search failed
+        """
+        try:
+            response = await self._http_client.post(
+                TAVILY_SEARCH_URL,
+                json=self._build_payload(query),
+                headers=self._build_headers(),
+            )
+            response.raise_for_status()
+            return response.json()
+        except (httpx.HTTPError, ValueError) as exc:
+            return {"error": str(exc) or type(exc).__name__}
+
+    def _build_payload(self, query: str) -> dict[str, Any]:
+        """
+        Build the body of a search request.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Tavily search parameters
+        """
+        return {
+            "query": query,
+            "topic": self.topic,
+            "max_results": self.max_results,
+            "search_depth": self.search_depth,
+        }
+
+    def _build_headers(self) -> dict[str, str]:
+        """
+        Build the headers of a search request.
+
+        Returns:
+            Authorization header carrying the API key
+        """
+        return {"Authorization": f"Bearer {self.tavily_api_key.get_secret_value()}"}
+
+
+def create_tavily_search_tool(
+    http_client: httpx.AsyncClient, tavily_api_key: str
+) -> PooledTavilySearchTool:
+    """
+    Create the general-topic Tavily search tool backed by a pooled client.
+
+    Args:
+        http_client: Pooled client used for all asynchronous searches
+        tavily_api_key: API key of the Tavily account
+
+    Returns:
+        Configured Tavily search tool
+    """
+    return PooledTavilySearchTool(
+        http_client, tavily_api_key=tavily_api_key, topic="general"
+    )
@@ -0,0 +1,53 @@
+from app.utils.admission_controller import (
+    AdmissionController,
+    AdmissionRejectedError,
+)
+from app.utils.event_loop_monitor import EventLoopMonitor
+from app.utils.cache_backend import (
+    CacheBackend,
+    MemoryCacheBackend,
+    RemoteCacheBackend,
+    SQLiteCacheBackend,
+)
+from app.utils.hedged_executor import HedgedExecutor
+from app.utils.json_codec import decode_json
+from app.utils.latency_tracker import LatencyTracker
+from app.utils.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    OperationTimer,
+)
+from app.utils.sampling_profiler import ProfileSession, SamplingProfiler
+from app.utils.single_flight import SingleFlight
+from app.utils.speculative_executor import SpeculativeExecutor
+from app.utils.sqlite_cache import SQLiteTTLCache
+from app.utils.text_similarity import NearDuplicateFilter
+from app.utils.ttl_cache import CacheEntry, TTLCache
+
+__all__ = [
+    "AdmissionController",
+    "AdmissionRejectedError",
+    "CacheBackend",
+    "MemoryCacheBackend",
+    "RemoteCacheBackend",
+    "SQLiteCacheBackend",
+    "EventLoopMonitor",
+    "HedgedExecutor",
+    "decode_json",
+    "LatencyTracker",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "OperationTimer",
+    "ProfileSession",
+    "SamplingProfiler",
+    "SingleFlight",
+    "SpeculativeExecutor",
+    "SQLiteTTLCache",
+    "NearDuplicateFilter",
+    "CacheEntry",
+    "TTLCache",
+]
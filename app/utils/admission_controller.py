@@ -0,0 +1,216 @@
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when a request is not admitted because the service is saturated."""
+
+    def __init__(self, status_code: int, detail: str, retry_after: int) -> None:
+        """
+        Initialize the rejection.
+
+        Args:
+            status_code: HTTP status the rejection maps to (429 or 503)
+            detail: Human-readable reason of the rejection
+            retry_after: Seconds after which the client may retry
+        """
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Bounds the number of concurrently running workflows.
+
+    Requests above the in-flight limit wait in a bounded FIFO queue for at
+    most the queue timeout. A full queue is rejected immediately with 429 and
+    an expired wait with 503, both with a Retry-After hint, so overload turns
+    into fast rejections instead of every request timing out together.
+
+    With a latency target the limit adapts (AIMD): it grows by one slot per
+    limit's worth of requests finishing within the target and shrinks by the
+    backoff ratio, at most once per target interval, when they do not.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        max_queue: int,
+        queue_timeout_seconds: float,
+        target_latency_seconds: float = 0.0,
+        min_in_flight: int = 1,
+        backoff_ratio: float = 0.9,
+    ) -> None:
+        """
+        Initialize the admission controller.
+
+        Args:
+            max_in_flight: Maximum number of admitted requests at once
+            max_queue: Maximum number of requests waiting for admission
+            queue_timeout_seconds: Maximum time a request waits in the queue
+            target_latency_seconds: Latency above which the limit shrinks;
+                0 keeps the limit fixed at max_in_flight
+            min_in_flight: Lower bound of the adaptive limit
+            backoff_ratio: Factor applied to the limit when latency is too high
+        """
+        self._max_in_flight = max_in_flight
+        self._max_queue = max_queue
+        self._queue_timeout_seconds = queue_timeout_seconds
+        self._target_latency_seconds = target_latency_seconds
+        self._min_in_flight = min(min_in_flight, max_in_flight)
+        self._backoff_ratio = backoff_ratio
+
+        self._limit = float(max_in_flight)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._last_decrease_at = 0.0
+
+        self._admitted = 0
+        self._queued = 0
+        self._rejected_queue_full = 0
+        self._rejected_queue_timeout = 0
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """
+        Hold an admission slot for the duration of the block.
+
+        Raises:
+            AdmissionRejectedError: If the request cannot be admitted in time
+        """
+        started_at = await self.acquire()
+        try:
+            yield
+        finally:
+            self.release(started_at)
+
+    async def acquire(self) -> float:
+        """
+        Wait for an admission slot.
+
+        Returns:
+            Admission time to pass to release
+
+        Raises:
+            AdmissionRejectedError: If the queue is full or the wait times out
+        """
+        if self._in_flight < self._current_limit() and not self._waiters:
+            self._in_flight += 1
+            self._admitted += 1
+            return time.monotonic()
+
+        if len(self._waiters) >= self._max_queue:
+            self._rejected_queue_full += 1
+            raise AdmissionRejectedError(
+                429, "Too many concurrent requests", self._get_retry_after()
+            )
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._queued += 1
+        try:
+            await asyncio.wait_for(waiter, self._queue_timeout_seconds)
+        except asyncio.TimeoutError:
+            self._remove_waiter(waiter)
+            self._rejected_queue_timeout += 1
+            raise AdmissionRejectedError(
+                503, "Service overloaded", self._get_retry_after()
+            ) from None
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release(time.monotonic())
+            else:
+                self._remove_waiter(waiter)
+            raise
+
+        self._admitted += 1
+        return time.monotonic()
+
+    def release(self, started_at: float) -> None:
+        """
+        Release an admission slot and hand it to the next waiting request.
+
+        Args:
+            started_at: Admission time returned by acquire
+        """
+        self._in_flight -= 1
+        if self._target_latency_seconds > 0:
+            self._adapt_limit(time.monotonic() - started_at)
+
+        while self._waiters and self._in_flight < self._current_limit():
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                self._in_flight += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get admission statistics.
+
+        Returns:
+            Current limit, in-flight and queued requests and rejection counters
+        """
+        return {
+            "limit": self._current_limit(),
+            "max_in_flight": self._max_in_flight,
+            "in_flight": self._in_flight,
+            "queue_length": len(self._waiters),
+            "admitted": self._admitted,
+            "queued": self._queued,
+            "rejected_queue_full": self._rejected_queue_full,
+            "rejected_queue_timeout": self._rejected_queue_timeout,
+        }
+
+    def _current_limit(self) -> int:
+        """
+        Get the integer in-flight limit.
+
+        Returns:
+            Current limit, at least the minimum
+        """
+        return max(self._min_in_flight, int(self._limit))
+
+    def _adapt_limit(self, latency_seconds: float) -> None:
+        """
+        Adjust the in-flight limit to the latency of a finished request.
+
+        Args:
+            latency_seconds: Time the request held its admission slot
+        """
+        if latency_seconds <= self._target_latency_seconds:
+            self._limit = min(float(self._max_in_flight), self._limit + 1 / self._limit)
+            return
+
+        now = time.monotonic()
+        if now - self._last_decrease_at >= self._target_latency_seconds:
+            self._last_decrease_at = now
+            self._limit = max(
+                float(self._min_in_flight), self._limit * self._backoff_ratio
+            )
+
+    def _remove_waiter(self, waiter: asyncio.Future) -> None:
+        """
+        Remove a waiter that gave up from the queue.
+
+        Args:
+            waiter: Future of the waiting request
+        """
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def _get_retry_after(self) -> int:
+        """
+        Estimate when a rejected client should retry.
+
+        Returns:
+            Whole seconds, at least one
+        """
+        return max(1, math.ceil(self._queue_timeout_seconds))
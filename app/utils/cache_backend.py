@@ -0,0 +1,206 @@
+import asyncio
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from typing import Any
+from urllib.parse import quote
+
+import httpx
+
+from app.utils.sqlite_cache import SQLiteTTLCache
+from app.utils.ttl_cache import TTLCache
+
+
+class CacheBackend(ABC):
+    """
+    Asynchronous key-value cache with per-entry TTLs.
+
+    Values must be JSON-serializable so every backend can store them.
+    Backends treat their own transient failures as misses instead of
+    raising, so a broken cache never fails a request.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the shared hit, miss and error counters."""
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+
+    async def get(self, key: str) -> Any | None:
+        """
+        Get the value for the key if it has not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss or backend failure
+        """
+        try:
+            value = await self._get(key)
+        except (OSError, sqlite3.Error, httpx.HTTPError, ValueError):
+            self._errors += 1
+            return None
+
+        if value is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Store a value under the key.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Seconds until the value expires
+        """
+        if ttl <= 0:
+            return
+
+        try:
+            await self._set(key, value, ttl)
+        except (OSError, sqlite3.Error, httpx.HTTPError, ValueError):
+            self._errors += 1
+
+    async def aclose(self) -> None:
+        """Release resources held by the backend."""
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Backend name, hit/miss/error counters and hit ratio
+        """
+        lookups = self._hits + self._misses
+        return {
+            "backend": self.backend_name,
+            "hits": self._hits,
+            "misses": self._misses,
+            "errors": self._errors,
+            "hit_ratio": self._hits / lookups if lookups else 0.0,
+        }
+
+    @property
+    @abstractmethod
+    def backend_name(self) -> str:
+        """Short name of the backend reported in statistics."""
+
+    @abstractmethod
+    async def _get(self, key: str) -> Any | None:
+        """Backend-specific lookup."""
+
+    @abstractmethod
+    async def _set(self, key: str, value: Any, ttl: float) -> None:
+        """Backend-specific store."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Per-process cache backend on top of a bounded in-memory LRU."""
+
+    backend_name = "memory"
+
+    def __init__(self, max_entries: int) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            max_entries: Maximum number of entries kept in memory
+        """
+        super().__init__()
+        self._cache = TTLCache(max_entries)
+
+    async def _get(self, key: str) -> Any | None:
+        entry = self._cache.get(key)
+        if entry is None or not entry.is_fresh(time.monotonic()):
+            return None
+        return entry.value
+
+    async def _set(self, key: str, value: Any, ttl: float) -> None:
+        self._cache.set(key, value, ttl)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {**super().get_stats(), **self._cache.get_stats()}
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Host-local cache backend shared by all worker processes.
+
+    Every worker opens its own connection to the same SQLite database in
+    WAL mode, so readers never block and a value fetched by one worker is
+    visible to the others. Database calls run in a worker thread.
+    """
+
+    backend_name = "sqlite"
+
+    def __init__(self, database_path: str, max_entries: int) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            database_path: Path of the SQLite database file shared by the workers
+            max_entries: Maximum number of rows kept in the database
+        """
+        super().__init__()
+        self._cache = SQLiteTTLCache(database_path, max_entries)
+
+    async def _get(self, key: str) -> Any | None:
+        return await asyncio.to_thread(self._cache.get, key)
+
+    async def _set(self, key: str, value: Any, ttl: float) -> None:
+        await asyncio.to_thread(self._cache.set, key, value, ttl)
+
+    async def aclose(self) -> None:
+        self._cache.close()
+
+
+class RemoteCacheBackend(CacheBackend):
+    """
+    Cache backend talking to an external cache server over HTTP.
+
+    Speaks the small key-value protocol of app.cache_server, which stands in
+    for a dedicated cache server shared by several hosts.
+    """
+
+    backend_name = "remote"
+
+    def __init__(self, base_url: str, http_client: httpx.AsyncClient) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            base_url: Base URL of the cache server
+            http_client: Pooled HTTP client used for cache requests
+        """
+        super().__init__()
+        self._base_url = base_url.rstrip("/")
+        self._http_client = http_client
+
+    async def _get(self, key: str) -> Any | None:
+        response = await self._http_client.get(self._get_entry_url(key))
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()["value"]
+
+    async def _set(self, key: str, value: Any, ttl: float) -> None:
+        response = await self._http_client.put(
+            self._get_entry_url(key), json={"value": value, "ttl": ttl}
+        )
+        response.raise_for_status()
+
+    def _get_entry_url(self, key: str) -> str:
+        """
+        Build the URL of a cache entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Entry URL with the key percent-encoded
+        """
+        return f"{self._base_url}/cache/{quote(key, safe='')}"
@@ -0,0 +1,137 @@
+import asyncio
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any
+
+from app.utils.latency_tracker import LatencyTracker
+from app.utils.sampling_profiler import extract_stack
+
+
+class EventLoopMonitor:
+    """
+    Measures event loop lag and records the stacks of blocking stalls.
+
+    A heartbeat task sleeps for a fixed interval and records how much later
+    than scheduled it wakes up. A watchdog thread notices when the heartbeat
+    is overdue by more than the stall threshold and captures the stack of
+    the event loop thread at that moment, which is the code blocking the
+    loop. Only one stack is captured per stall and only the most recent
+    stalls are kept, so the monitor is cheap enough to run permanently.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = 0.05,
+        stall_threshold_seconds: float = 0.1,
+        max_recorded_stalls: int = 20,
+        stack_limit: int = 30,
+    ) -> None:
+        """
+        Initialize the event loop monitor.
+
+        Args:
+            interval_seconds: Sleep interval of the heartbeat task
+            stall_threshold_seconds: Lag from which a delay counts as a stall
+            max_recorded_stalls: Number of most recent stalls kept with their stack
+            stack_limit: Maximum number of innermost frames kept per stack
+        """
+        self._interval_seconds = interval_seconds
+        self._stall_threshold_seconds = stall_threshold_seconds
+        self._stack_limit = stack_limit
+
+        self._heartbeat_task: asyncio.Task | None = None
+        self._watchdog_thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._loop_thread_id: int | None = None
+        self._expected_heartbeat_at = 0.0
+        self._stall_stack: list[str] | None = None
+
+        self._lag = LatencyTracker()
+        self._stalls = 0
+        self._max_lag_seconds = 0.0
+        self._recent_stalls: deque[dict[str, Any]] = deque(maxlen=max_recorded_stalls)
+
+    def start(self) -> None:
+        """Start the heartbeat task and the watchdog thread on the running loop."""
+        if self._heartbeat_task is not None:
+            return
+
+        self._loop_thread_id = threading.get_ident()
+        self._expected_heartbeat_at = time.monotonic() + self._interval_seconds
+        self._stopped.clear()
+        self._heartbeat_task = asyncio.create_task(self._run_heartbeat())
+        self._watchdog_thread = threading.Thread(
+            target=self._run_watchdog, name="event-loop-watchdog", daemon=True
+        )
+        self._watchdog_thread.start()
+
+    async def stop(self) -> None:
+        """Stop the heartbeat task and the watchdog thread."""
+        if self._heartbeat_task is None:
+            return
+
+        self._stopped.set()
+        self._heartbeat_task.cancel()
+        try:
+            await self._heartbeat_task
+        except asyncio.CancelledError:
+            pass
+        self._watchdog_thread.join()
+        self._heartbeat_task = None
+        self._watchdog_thread = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get event loop lag statistics.
+
+        Returns:
+            Lag percentiles, stall count, maximum lag and the most recent
+            stalls with the stack that blocked the loop
+        """
+        return {
+            "lag_seconds": self._lag.get_stats(),
+            "max_lag_seconds": self._max_lag_seconds,
+            "stall_threshold_seconds": self._stall_threshold_seconds,
+            "stalls": self._stalls,
+            "recent_stalls": list(self._recent_stalls),
+        }
+
+    async def _run_heartbeat(self) -> None:
+        """Record how late every heartbeat wakes up until cancelled."""
+        while True:
+            await asyncio.sleep(self._interval_seconds)
+            now = time.monotonic()
+            lag_seconds = max(0.0, now - self._expected_heartbeat_at)
+            self._expected_heartbeat_at = now + self._interval_seconds
+            self._lag.record(lag_seconds)
+            self._max_lag_seconds = max(self._max_lag_seconds, lag_seconds)
+
+            stall_stack, self._stall_stack = self._stall_stack, None
+            if lag_seconds >= self._stall_threshold_seconds:
+                self._stalls += 1
+                self._recent_stalls.append(
+                    {
+                        "lag_seconds": lag_seconds,
+                        "ended_at": time.time(),
+                        "stack": stall_stack or [],
+                    }
+                )
+
+    def _run_watchdog(self) -> None:
+        """Capture the loop thread's stack once per overdue heartbeat."""
+        poll_interval_seconds = self._stall_threshold_seconds / 2
+        captured_for: float | None = None
+        while not self._stopped.wait(poll_interval_seconds):
+            expected_heartbeat_at = self._expected_heartbeat_at
+            if (
+                captured_for == expected_heartbeat_at
+                or time.monotonic() - expected_heartbeat_at
+                < self._stall_threshold_seconds
+            ):
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            self._stall_stack = extract_stack(frame, self._stack_limit)
+            captured_for = expected_heartbeat_at
@@ -0,0 +1,132 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+from app.utils.latency_tracker import LatencyTracker
+
+
+class HedgedExecutor:
+    """
+    Runs idempotent operations with a hedged second attempt.
+
+    When the first attempt has not finished after the recent latency
+    percentile of its key, an identical second attempt is started and the
+    first successful result wins; the other attempt is cancelled. The delay
+    adapts per key, so only the slow tail pays for extra requests.
+    """
+
+    def __init__(
+        self,
+        hedge_quantile: float = 0.95,
+        min_delay_seconds: float = 0.05,
+        max_delay_seconds: float = 2.0,
+        min_samples: int = 20,
+    ) -> None:
+        """
+        Initialize the hedged executor.
+
+        Args:
+            hedge_quantile: Latency quantile after which the second attempt starts
+            min_delay_seconds: Lower bound of the hedge delay
+            max_delay_seconds: Upper bound of the hedge delay, used until enough
+                samples were recorded for a key
+            min_samples: Samples required before the percentile is trusted
+        """
+        self._hedge_quantile = hedge_quantile
+        self._min_delay_seconds = min_delay_seconds
+        self._max_delay_seconds = max_delay_seconds
+        self._min_samples = min_samples
+        self._latency_by_key: dict[str, LatencyTracker] = {}
+
+        self._calls = 0
+        self._hedged_calls = 0
+        self._hedge_wins = 0
+
+    async def run(self, key: str, operation: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run an operation, hedging it when the first attempt is slow.
+
+        Args:
+            key: Operation family whose latency determines the hedge delay
+            operation: Factory producing one attempt of the idempotent operation
+
+        Returns:
+            Result of the first successful attempt
+
+        Raises:
+            Exception: Error of the last attempt when all attempts fail
+        """
+        latency_tracker = self._latency_by_key.setdefault(key, LatencyTracker(512))
+        self._calls += 1
+        started_at = time.perf_counter()
+
+        first_attempt = asyncio.ensure_future(operation())
+        pending = {first_attempt}
+        try:
+            done, pending = await asyncio.wait(
+                pending, timeout=self._get_hedge_delay(latency_tracker)
+            )
+            if not done:
+                self._hedged_calls += 1
+                pending.add(asyncio.ensure_future(operation()))
+
+            while True:
+                failures = [
+                    attempt.exception()
+                    for attempt in done
+                    if attempt.exception() is not None
+                ]
+                for attempt in done:
+                    if attempt.exception() is None:
+                        latency_tracker.record(time.perf_counter() - started_at)
+                        if attempt is not first_attempt:
+                            self._hedge_wins += 1
+                        return attempt.result()
+                if failures and not pending:
+                    raise failures[-1]
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            for attempt in pending:
+                attempt.cancel()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get hedging statistics.
+
+        Returns:
+            Calls, hedged calls, calls won by the hedge and current delay per key
+        """
+        return {
+            "calls": self._calls,
+            "hedged_calls": self._hedged_calls,
+            "hedge_wins": self._hedge_wins,
+            "hedge_ratio": self._hedged_calls / self._calls if self._calls else 0.0,
+            "hedge_delay_seconds": {
+                key: self._get_hedge_delay(latency_tracker)
+                for key, latency_tracker in self._latency_by_key.items()
+            },
+        }
+
+    def _get_hedge_delay(self, latency_tracker: LatencyTracker) -> float:
+        """
+        Get the time after which a second attempt is started.
+
+        Args:
+            latency_tracker: Recent latencies of the operation family
+
+        Returns:
+            Hedge delay in seconds
+        """
+        if latency_tracker.sample_count < self._min_samples:
+            return self._max_delay_seconds
+
+        return min(
+            self._max_delay_seconds,
+            max(
+                self._min_delay_seconds,
+                latency_tracker.percentile(self._hedge_quantile),
+            ),
+        )
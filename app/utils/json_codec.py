@@ -0,0 +1,27 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # e.g. on PyPy, where orjson is not installed
+    orjson = None
+
+
+def decode_json(payload: bytes | str) -> Any:
+    """
+    Decode a JSON document with the fastest available parser.
+
+    Uses orjson when it is installed and the standard library otherwise.
+
+    Args:
+        payload: Raw JSON document, e.g. an HTTP response body
+
+    Returns:
+        Decoded JSON value
+
+    Raises:
+        ValueError: If the payload is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
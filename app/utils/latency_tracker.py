@@ -0,0 +1,74 @@
+import math
+from collections import deque
+
+
+class LatencyTracker:
+    """
+    Sliding-window latency recorder with percentile summaries.
+
+    Keeps the most recent samples in a bounded buffer so percentiles reflect
+    current behaviour and memory stays constant.
+    """
+
+    def __init__(self, window_size: int = 2048) -> None:
+        """
+        Initialize the tracker.
+
+        Args:
+            window_size: Number of most recent samples kept for percentiles
+        """
+        self._samples: deque[float] = deque(maxlen=window_size)
+        self._total_count = 0
+
+    @property
+    def sample_count(self) -> int:
+        """
+        Number of samples in the current window.
+
+        Returns:
+            Sample count, at most the window size
+        """
+        return len(self._samples)
+
+    def record(self, latency_seconds: float) -> None:
+        """
+        Record a latency sample.
+
+        Args:
+            latency_seconds: Observed latency in seconds
+        """
+        self._samples.append(latency_seconds)
+        self._total_count += 1
+
+    def percentile(self, quantile: float) -> float | None:
+        """
+        Compute a latency percentile over the current window.
+
+        Args:
+            quantile: Quantile between 0 and 1, e.g. 0.95
+
+        Returns:
+            Latency in seconds, or None when no samples were recorded
+        """
+        if not self._samples:
+            return None
+
+        ordered_samples = sorted(self._samples)
+        rank = max(math.ceil(quantile * len(ordered_samples)) - 1, 0)
+        return ordered_samples[rank]
+
+    def get_stats(self) -> dict[str, float | int | None]:
+        """
+        Summarize the recorded latencies.
+
+        Returns:
+            Sample counts, mean and p50/p95/p99 latencies in seconds
+        """
+        return {
+            "count": self._total_count,
+            "window": len(self._samples),
+            "mean": sum(self._samples) / len(self._samples) if self._samples else None,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+        }
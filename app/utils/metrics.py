@@ -0,0 +1,425 @@
+import asyncio
+import bisect
+import math
+import time
+from abc import ABC, abstractmethod
+from typing import Generic, TypeVar
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+_LABEL_VALUE_ESCAPES = str.maketrans({"\\": "\\\\", "\n": "\\n", '"': '\\"'})
+
+
+def _format_value(value: float) -> str:
+    """
+    Format a sample value in Prometheus text notation.
+
+    Args:
+        value: Sample value
+
+    Returns:
+        Value as text, with infinities spelled the Prometheus way
+    """
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _format_labels(label_pairs: tuple[tuple[str, str], ...]) -> str:
+    """
+    Format label pairs in Prometheus text notation.
+
+    Args:
+        label_pairs: Label names paired with their values
+
+    Returns:
+        Label block including braces, empty if there are no labels
+    """
+    if not label_pairs:
+        return ""
+    escaped_pairs = (
+        f'{name}="{value.translate(_LABEL_VALUE_ESCAPES)}"'
+        for name, value in label_pairs
+    )
+    return "{" + ",".join(escaped_pairs) + "}"
+
+
+class _CounterChild:
+    """Counter value of one label combination."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increase the counter.
+
+        Args:
+            amount: Non-negative increment
+        """
+        self.value += amount
+
+
+class _GaugeChild:
+    """Gauge value of one label combination."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increase the gauge.
+
+        Args:
+            amount: Increment
+        """
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """
+        Decrease the gauge.
+
+        Args:
+            amount: Decrement
+        """
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        """
+        Set the gauge.
+
+        Args:
+            value: New value
+        """
+        self.value = value
+
+
+class _HistogramChild:
+    """Bucket counts, sum and count of one label combination."""
+
+    __slots__ = ("upper_bounds", "bucket_counts", "sum", "count")
+
+    def __init__(self, upper_bounds: tuple[float, ...]) -> None:
+        self.upper_bounds = upper_bounds
+        self.bucket_counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value: Observed value
+        """
+        self.bucket_counts[bisect.bisect_left(self.upper_bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+ChildT = TypeVar("ChildT", _CounterChild, _GaugeChild, _HistogramChild)
+
+
+class _Metric(ABC, Generic[ChildT]):
+    """
+    Base class of a labelled metric family.
+
+    Children are created once per label combination and cached, so the
+    recording hot path is a dictionary lookup plus an arithmetic update.
+    """
+
+    def __init__(
+        self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> None:
+        """
+        Initialize the metric family.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            label_names: Names of the labels distinguishing children
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._children: dict[tuple[str, ...], ChildT] = {}
+
+    def labels(self, *label_values: str) -> ChildT:
+        """
+        Get the child of a label combination.
+
+        Args:
+            *label_values: Label values in the order of the label names
+
+        Returns:
+            Child recording values for these labels
+
+        Raises:
+            ValueError: If the number of values does not match the label names
+        """
+        child = self._children.get(label_values)
+        if child is None:
+            if len(label_values) != len(self.label_names):
+                raise ValueError(
+                    f"{self.name} expects labels {self.label_names}, got {label_values}"
+                )
+            child = self._children[label_values] = self._create_child()
+        return child
+
+    def render(self) -> list[str]:
+        """
+        Render the metric family in Prometheus text format.
+
+        Returns:
+            Exposition lines including HELP and TYPE headers
+        """
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        for label_values, child in self._children.items():
+            lines.extend(
+                self._render_child(tuple(zip(self.label_names, label_values)), child)
+            )
+        return lines
+
+    @property
+    @abstractmethod
+    def metric_type(self) -> str:
+        """Prometheus type of the metric reported in the TYPE header."""
+
+    @abstractmethod
+    def _create_child(self) -> ChildT:
+        """Create the child of a new label combination."""
+
+    @abstractmethod
+    def _render_child(
+        self, label_pairs: tuple[tuple[str, str], ...], child: ChildT
+    ) -> list[str]:
+        """Render the exposition lines of one child."""
+
+
+class Counter(_Metric[_CounterChild]):
+    """Monotonically increasing counter."""
+
+    metric_type = "counter"
+
+    def _create_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def _render_child(
+        self, label_pairs: tuple[tuple[str, str], ...], child: _CounterChild
+    ) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(label_pairs)} {_format_value(child.value)}"
+        ]
+
+
+class Gauge(_Metric[_GaugeChild]):
+    """Value that can go up and down."""
+
+    metric_type = "gauge"
+
+    def _create_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def _render_child(
+        self, label_pairs: tuple[tuple[str, str], ...], child: _GaugeChild
+    ) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(label_pairs)} {_format_value(child.value)}"
+        ]
+
+
+class Histogram(_Metric[_HistogramChild]):
+    """Distribution of observations over fixed cumulative buckets."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        """
+        Initialize the histogram family.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            label_names: Names of the labels distinguishing children
+            buckets: Sorted upper bounds of the finite buckets
+        """
+        super().__init__(name, documentation, label_names)
+        self._upper_bounds = tuple(sorted(buckets))
+
+    def _create_child(self) -> _HistogramChild:
+        return _HistogramChild(self._upper_bounds)
+
+    def _render_child(
+        self, label_pairs: tuple[tuple[str, str], ...], child: _HistogramChild
+    ) -> list[str]:
+        lines = []
+        cumulative_count = 0
+        for upper_bound, bucket_count in zip(
+            (*child.upper_bounds, math.inf), child.bucket_counts
+        ):
+            cumulative_count += bucket_count
+            bucket_labels = _format_labels(
+                (*label_pairs, ("le", _format_value(upper_bound)))
+            )
+            lines.append(f"{self.name}_bucket{bucket_labels} {cumulative_count}")
+
+        labels = _format_labels(label_pairs)
+        lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+        lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class OperationTimer:
+    """
+    Context manager recording duration, in-flight count and errors of an operation.
+
+    Works around both synchronous and awaited code since it only touches
+    the clock and pre-resolved metric children.
+    """
+
+    __slots__ = ("_duration", "_in_flight", "_errors", "_started_at")
+
+    def __init__(
+        self,
+        duration: _HistogramChild,
+        in_flight: _GaugeChild,
+        errors: _CounterChild,
+    ) -> None:
+        """
+        Initialize the timer.
+
+        Args:
+            duration: Histogram child receiving the duration in seconds
+            in_flight: Gauge child counting running operations
+            errors: Counter child incremented when the operation raises;
+                cancellation, e.g. of a losing hedged request, is not an error
+        """
+        self._duration = duration
+        self._in_flight = in_flight
+        self._errors = errors
+        self._started_at = 0.0
+
+    def __enter__(self) -> "OperationTimer":
+        self._in_flight.inc()
+        self._started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._duration.observe(time.perf_counter() - self._started_at)
+        self._in_flight.dec()
+        if exc_type is not None and not issubclass(exc_type, asyncio.CancelledError):
+            self._errors.inc()
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together on the metrics endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, _Metric] = {}
+
+    def counter(
+        self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> Counter:
+        """
+        Register a counter.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            label_names: Names of the labels distinguishing children
+
+        Returns:
+            Registered counter
+        """
+        return self._register(Counter(name, documentation, label_names))
+
+    def gauge(
+        self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> Gauge:
+        """
+        Register a gauge.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            label_names: Names of the labels distinguishing children
+
+        Returns:
+            Registered gauge
+        """
+        return self._register(Gauge(name, documentation, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """
+        Register a histogram.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            label_names: Names of the labels distinguishing children
+            buckets: Sorted upper bounds of the finite buckets
+
+        Returns:
+            Registered histogram
+        """
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def render(self) -> str:
+        """
+        Render all registered metrics in Prometheus text format.
+
+        Returns:
+            Exposition text ending with a newline
+        """
+        lines = [line for metric in self._metrics.values() for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: _Metric) -> _Metric:
+        """
+        Add a metric family to the registry.
+
+        Args:
+            metric: Metric family to add
+
+        Returns:
+            The same metric family
+
+        Raises:
+            ValueError: If a metric with the same name is already registered
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
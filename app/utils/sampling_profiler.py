@@ -0,0 +1,258 @@
+import inspect
+import os
+import sys
+import sysconfig
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Any
+
+_SELECTOR_FUNCTION_NAMES = frozenset({"select"})
+_LOOP_RUNNER_FUNCTION_NAMES = frozenset({"run", "run_until_complete", "run_forever"})
+_PATH_MARKERS = (
+    "site-packages" + os.sep,
+    sysconfig.get_paths()["stdlib"] + os.sep,
+    os.getcwd() + os.sep,
+)
+
+
+def format_frame(frame: FrameType) -> str:
+    """
+    Format a stack frame as a short, readable label.
+
+    Args:
+        frame: Frame to format
+
+    Returns:
+        Qualified function name with a shortened file path and line number
+    """
+    code = frame.f_code
+    filename = code.co_filename
+    for marker in _PATH_MARKERS:
+        if marker in filename:
+            filename = filename.rsplit(marker, 1)[1]
+            break
+    return f"{code.co_qualname} ({filename}:{frame.f_lineno})"
+
+
+def is_idle_frame(frame: FrameType) -> bool:
+    """
+    Check whether the innermost frame of the loop thread shows an idle loop.
+
+    The pure-Python event loop waits in its selector. A loop implemented in
+    C, such as uvloop, waits below its runner, so a runner function like
+    asyncio.Runner.run is then the innermost Python frame.
+
+    Args:
+        frame: Innermost frame of the sampled thread
+
+    Returns:
+        True if the loop is waiting for I/O or timers
+    """
+    code = frame.f_code
+    if code.co_name in _SELECTOR_FUNCTION_NAMES:
+        return True
+    return code.co_name in _LOOP_RUNNER_FUNCTION_NAMES and not (
+        code.co_flags & inspect.CO_COROUTINE
+    )
+
+
+def extract_stack(frame: FrameType | None, limit: int = 64) -> list[str]:
+    """
+    Extract the formatted frames of a stack, outermost first.
+
+    Args:
+        frame: Innermost frame of the stack
+        limit: Maximum number of innermost frames kept
+
+    Returns:
+        Formatted frames from the outermost to the innermost kept frame
+    """
+    stack: list[str] = []
+    while frame is not None and len(stack) < limit:
+        stack.append(format_frame(frame))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+class ProfileSession:
+    """
+    Running sampling profile of one thread.
+
+    A daemon thread records the stack of the target thread at a fixed
+    interval until the session is stopped or reaches its maximum duration.
+    Samples taken while the event loop waits for I/O are counted as idle, so
+    the profile separates CPU work on the loop from time spent waiting on
+    upstreams.
+    """
+
+    def __init__(
+        self,
+        target_thread_id: int,
+        sample_interval_seconds: float,
+        max_duration_seconds: float,
+        max_stacks: int,
+    ) -> None:
+        """
+        Start sampling a thread.
+
+        Args:
+            target_thread_id: Identifier of the sampled thread
+            sample_interval_seconds: Time between two samples
+            max_duration_seconds: Time after which sampling stops on its own
+            max_stacks: Number of most frequent stacks and functions reported
+        """
+        self._target_thread_id = target_thread_id
+        self._sample_interval_seconds = sample_interval_seconds
+        self._max_duration_seconds = max_duration_seconds
+        self._max_stacks = max_stacks
+
+        self._stack_samples: Counter[tuple[str, ...]] = Counter()
+        self._idle_samples = 0
+        self._stopped = threading.Event()
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._sample, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> dict[str, Any]:
+        """
+        Stop sampling and summarize the profile.
+
+        Returns:
+            Sample counts, the busy share of samples, and the most frequent
+            stacks in folded format and functions by self samples
+        """
+        self._stopped.set()
+        self._thread.join()
+
+        busy_samples = sum(self._stack_samples.values())
+        total_samples = busy_samples + self._idle_samples
+        function_samples: Counter[str] = Counter()
+        for stack, samples in self._stack_samples.items():
+            function_samples[stack[-1]] += samples
+
+        return {
+            "duration_seconds": time.perf_counter() - self._started_at,
+            "sample_interval_seconds": self._sample_interval_seconds,
+            "samples": total_samples,
+            "idle_samples": self._idle_samples,
+            "busy_ratio": busy_samples / total_samples if total_samples else 0.0,
+            "stacks": [
+                {"stack": ";".join(stack), "samples": samples}
+                for stack, samples in self._stack_samples.most_common(self._max_stacks)
+            ],
+            "functions": [
+                {"function": function, "self_samples": samples}
+                for function, samples in function_samples.most_common(self._max_stacks)
+            ],
+        }
+
+    def _sample(self) -> None:
+        """Record stacks of the target thread until the session is stopped."""
+        deadline = self._started_at + self._max_duration_seconds
+        while not self._stopped.wait(self._sample_interval_seconds):
+            if time.perf_counter() >= deadline:
+                return
+            frame = sys._current_frames().get(self._target_thread_id)
+            if frame is None:
+                return
+            if is_idle_frame(frame):
+                self._idle_samples += 1
+            else:
+                self._stack_samples[tuple(extract_stack(frame))] += 1
+
+
+class SamplingProfiler:
+    """
+    Rate-limited sampling profiler of the event loop thread.
+
+    A profile covers everything the loop runs while it is active, including
+    other requests served concurrently, not just the request that started
+    it. At most one profile runs at a time and a new one starts no sooner than
+    the minimum interval after the previous one, so profiling requests
+    cannot add noticeable overhead even if clients ask for it constantly.
+    """
+
+    def __init__(
+        self,
+        sample_interval_seconds: float = 0.005,
+        min_interval_seconds: float = 10.0,
+        max_duration_seconds: float = 60.0,
+        max_stacks: int = 30,
+    ) -> None:
+        """
+        Initialize the sampling profiler.
+
+        Args:
+            sample_interval_seconds: Time between two samples
+            min_interval_seconds: Minimum time between the starts of two profiles
+            max_duration_seconds: Time after which a profile stops sampling
+            max_stacks: Number of most frequent stacks and functions reported
+        """
+        self._sample_interval_seconds = sample_interval_seconds
+        self._min_interval_seconds = min_interval_seconds
+        self._max_duration_seconds = max_duration_seconds
+        self._max_stacks = max_stacks
+
+        self._active_session: ProfileSession | None = None
+        self._last_started_at: float | None = None
+
+        self._profiles = 0
+        self._rate_limited = 0
+
+    def start(self) -> ProfileSession | None:
+        """
+        Start profiling the calling thread, unless the rate limit forbids it.
+
+        Returns:
+            Running profile session, or None if profiling was rate-limited
+        """
+        now = time.monotonic()
+        if self._active_session is not None or (
+            self._last_started_at is not None
+            and now - self._last_started_at < self._min_interval_seconds
+        ):
+            self._rate_limited += 1
+            return None
+
+        self._last_started_at = now
+        self._profiles += 1
+        self._active_session = ProfileSession(
+            threading.get_ident(),
+            self._sample_interval_seconds,
+            self._max_duration_seconds,
+            self._max_stacks,
+        )
+        return self._active_session
+
+    def stop(self, session: ProfileSession) -> dict[str, Any]:
+        """
+        Stop a profile session and release the profiler for the next one.
+
+        Args:
+            session: Session returned by start
+
+        Returns:
+            Profile summary of the session
+        """
+        if session is self._active_session:
+            self._active_session = None
+        return session.stop()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get profiling statistics.
+
+        Returns:
+            Captured and rate-limited profiles and whether one is running
+        """
+        return {
+            "profiles": self._profiles,
+            "rate_limited": self._rate_limited,
+            "active": self._active_session is not None,
+            "min_interval_seconds": self._min_interval_seconds,
+        }
@@ -0,0 +1,64 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one in-flight operation.
+
+    The first caller starts the operation, later callers with the same key
+    await its result instead of issuing a duplicate upstream request.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the single-flight group."""
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self._coalesced_calls = 0
+
+    async def run(self, key: Hashable, operation: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run the operation once per key among concurrent callers.
+
+        Args:
+            key: Identity of the operation
+            operation: Factory producing the awaitable to execute
+
+        Returns:
+            Result of the shared operation
+        """
+        return await asyncio.shield(self.start(key, operation))
+
+    def start(
+        self, key: Hashable, operation: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Task:
+        """
+        Start the operation unless one is already in flight for the key.
+
+        Args:
+            key: Identity of the operation
+            operation: Factory producing the awaitable to execute
+
+        Returns:
+            Task executing the shared operation
+        """
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._coalesced_calls += 1
+            return task
+
+        task = asyncio.ensure_future(operation())
+        self._in_flight[key] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return task
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Number of operations in flight and calls that joined one
+        """
+        return {
+            "in_flight": len(self._in_flight),
+            "coalesced_calls": self._coalesced_calls,
+        }
@@ -0,0 +1,99 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+
+class SpeculativeExecutor:
+    """
+    Registry of speculatively started work keyed by request and branch.
+
+    Branches are launched before it is known whether they are needed.
+    The consumer later claims the ones it wants and cancels the rest,
+    and the registry accounts for used and wasted work.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the executor."""
+        self._pending: dict[tuple[str, str], tuple[asyncio.Task, float]] = {}
+        self._launched = 0
+        self._claimed = 0
+        self._cancelled = 0
+        self._cancelled_after_completion = 0
+        self._wasted_seconds = 0.0
+
+    def launch(
+        self,
+        request_id: str,
+        branch: str,
+        operation: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """
+        Start a branch speculatively.
+
+        Args:
+            request_id: Identifier of the request the branch belongs to
+            branch: Name of the branch
+            operation: Factory producing the awaitable to execute
+        """
+        key = (request_id, branch)
+        if key in self._pending:
+            return
+
+        self._pending[key] = (asyncio.ensure_future(operation()), time.perf_counter())
+        self._launched += 1
+
+    def claim(self, request_id: str, branch: str) -> asyncio.Task | None:
+        """
+        Take ownership of a speculatively started branch.
+
+        Args:
+            request_id: Identifier of the request the branch belongs to
+            branch: Name of the branch
+
+        Returns:
+            Task running the branch, or None if it was not launched
+        """
+        pending = self._pending.pop((request_id, branch), None)
+        if pending is None:
+            return None
+
+        self._claimed += 1
+        return pending[0]
+
+    def cancel_unselected(self, request_id: str, selected_branches: set[str]) -> None:
+        """
+        Cancel every branch of the request that was not selected.
+
+        Args:
+            request_id: Identifier of the request
+            selected_branches: Branches that will be claimed later
+        """
+        for key in [key for key in self._pending if key[0] == request_id]:
+            if key[1] in selected_branches:
+                continue
+
+            task, started_at = self._pending.pop(key)
+            self._cancelled += 1
+            self._wasted_seconds += time.perf_counter() - started_at
+            if task.done():
+                self._cancelled_after_completion += 1
+                if not task.cancelled():
+                    task.exception()
+            else:
+                task.cancel()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get speculation statistics.
+
+        Returns:
+            Launched, claimed and cancelled branch counts and wasted time
+        """
+        return {
+            "launched": self._launched,
+            "claimed": self._claimed,
+            "cancelled": self._cancelled,
+            "cancelled_after_completion": self._cancelled_after_completion,
+            "wasted_seconds": self._wasted_seconds,
+            "pending": len(self._pending),
+        }
@@ -0,0 +1,89 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Any
+
+
+class SQLiteTTLCache:
+    """
+    Persistent key-value cache with TTLs backed by a SQLite database.
+
+    Values are stored as JSON and survive process restarts. The database runs
+    in WAL mode, so several processes can share it. The table is bounded by
+    evicting the entries that expire first once it is full.
+    """
+
+    def __init__(self, database_path: str, max_entries: int) -> None:
+        """
+        Initialize the cache and create its table if necessary.
+
+        Args:
+            database_path: Path of the SQLite database file
+            max_entries: Maximum number of rows kept in the table
+        """
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA busy_timeout=5000")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS cache_entries_expires_at "
+            "ON cache_entries (expires_at)"
+        )
+        self._connection.commit()
+
+    def get(self, key: str) -> Any | None:
+        """
+        Get the value for the key if it has not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Decoded value, or None if missing or expired
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM cache_entries WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+
+        return json.loads(row[0]) if row is not None else None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Store a JSON-serializable value under the key.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Seconds until the value expires
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), now + ttl),
+            )
+            self._connection.execute(
+                "DELETE FROM cache_entries WHERE expires_at <= ?", (now,)
+            )
+            self._connection.execute(
+                "DELETE FROM cache_entries WHERE key IN ("
+                "SELECT key FROM cache_entries ORDER BY expires_at "
+                "LIMIT max(0, (SELECT count(*) FROM cache_entries) - ?))",
+                (self._max_entries,),
+            )
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
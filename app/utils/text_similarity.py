@@ -0,0 +1,49 @@
+import re
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+class NearDuplicateFilter:
+    """
+    Detects texts that repeat an earlier text almost word for word.
+
+    Texts are compared by the Jaccard similarity of their word shingles, so
+    reordered punctuation, casing or a few changed words do not make a copy
+    look new.
+    """
+
+    def __init__(self, threshold: float = 0.8, shingle_size: int = 3) -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            threshold: Similarity at or above which a text is a near-duplicate
+            shingle_size: Number of consecutive words per shingle
+        """
+        self._threshold = threshold
+        self._shingle_size = shingle_size
+        self._seen_shingles: list[set[tuple[str, ...]]] = []
+
+    def is_duplicate(self, text: str) -> bool:
+        """
+        Check a text against all texts seen so far and remember it if it is new.
+
+        Args:
+            text: Text to check
+
+        Returns:
+            True if the text is a near-duplicate of an earlier one
+        """
+        words = _WORD_PATTERN.findall(text.lower())
+        shingles = {
+            tuple(words[start : start + self._shingle_size])
+            for start in range(max(len(words) - self._shingle_size + 1, 1))
+        }
+        if any(
+            len(shingles & previous) / len(shingles | previous) >= self._threshold
+            for previous in self._seen_shingles
+        ):
+            return True
+
+        self._seen_shingles.append(shingles)
+        return False
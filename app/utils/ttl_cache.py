@@ -0,0 +1,113 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """Cached value together with its freshness and staleness deadlines."""
+
+    value: Any
+    fresh_until: float
+    stale_until: float
+
+    def is_fresh(self, now: float) -> bool:
+        """
+        Check whether the entry can be served without revalidation.
+
+        Args:
+            now: Current monotonic time
+
+        Returns:
+            True if the entry has not reached its TTL yet
+        """
+        return now < self.fresh_until
+
+
+class TTLCache:
+    """
+    Bounded in-memory LRU cache with per-entry TTLs.
+
+    Entries past their TTL stay available as stale values until their
+    stale window ends, which allows callers to serve them while revalidating.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept before evicting the least recently used
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> CacheEntry | None:
+        """
+        Get a fresh or stale entry for the key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cache entry, or None if missing or past its stale window
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if time.monotonic() >= entry.stale_until:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(
+        self, key: Hashable, value: Any, ttl: float, stale_ttl: float = 0.0
+    ) -> None:
+        """
+        Store a value under the key.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Seconds during which the value is fresh
+            stale_ttl: Additional seconds during which the value may be served stale
+        """
+        now = time.monotonic()
+        self._entries[key] = CacheEntry(
+            value=value, fresh_until=now + ttl, stale_until=now + ttl + stale_ttl
+        )
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove the entry for the key if present.
+
+        Args:
+            key: Cache key
+        """
+        self._entries.pop(key, None)
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get cache occupancy statistics.
+
+        Returns:
+            Number of entries, capacity and evictions so far
+        """
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "evictions": self._evictions,
+        }
@@ -0,0 +1,398 @@
+import asyncio
+import hashlib
+import json
+import re
+import time
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Iterator, AsyncIterator
+
+import httpx
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.tools import BaseTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+_QUESTION_PATTERN = re.compile(r'User question: "?(.*?)"?$', re.MULTILINE)
+_FAKE_LEAGUE_NAMES = ("Premier League", "La Liga")
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Local stand-in for the Azure OpenAI chat model.
+
+    Answers routing prompts from a question-to-route table, answers
+    structured-output planning calls with the known team names found in the
+    question, and produces a fixed-length answer otherwise. Every reply waits
+    for the configured time to first token plus the time needed to emit its
+    tokens at the configured rate.
+    """
+
+    routes: dict[str, str] = {}
+    default_route: str = "search_agent"
+    team_names: list[str] = []
+    first_token_latency_seconds: float = 0.3
+    tokens_per_second: float = 50.0
+    answer_tokens: int = 60
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat-model"
+
+    def bind_tools(self, tools: list[Any], **kwargs: Any):
+        """
+        Bind tool schemas so structured-output calls receive a tool call.
+
+        Args:
+            tools: Tools or schemas the model may call
+            **kwargs: Additional arguments passed through to the model call
+
+        Returns:
+            Runnable that calls the model with the tool schemas
+        """
+        kwargs.pop("tool_choice", None)
+        kwargs.pop("ls_structured_output_format", None)
+        return self.bind(
+            tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs
+        )
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        message, token_count = self._build_reply(messages, kwargs.get("tools"))
+        time.sleep(self._get_generation_seconds(token_count))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        message, token_count = self._build_reply(messages, kwargs.get("tools"))
+        await asyncio.sleep(self._get_generation_seconds(token_count))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        raise NotImplementedError("FakeChatModel only streams asynchronously")
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        message, token_count = self._build_reply(messages, kwargs.get("tools"))
+        await asyncio.sleep(self.first_token_latency_seconds)
+
+        if message.tool_calls:
+            tool_call = message.tool_calls[0]
+            yield ChatGenerationChunk(
+                message=AIMessageChunk(
+                    content="",
+                    tool_call_chunks=[
+                        {
+                            "name": tool_call["name"],
+                            "args": json.dumps(tool_call["args"]),
+                            "id": tool_call["id"],
+                            "index": 0,
+                        }
+                    ],
+                )
+            )
+            return
+
+        for position, token in enumerate(message.content.split(" ")):
+            if position:
+                await asyncio.sleep(1 / self.tokens_per_second)
+            chunk = ChatGenerationChunk(
+                message=AIMessageChunk(content=token if not position else f" {token}")
+            )
+            if run_manager is not None:
+                await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+    def _build_reply(
+        self, messages: list[BaseMessage], tools: list[dict[str, Any]] | None
+    ) -> tuple[AIMessage, int]:
+        """
+        Build the reply to a prompt.
+
+        Args:
+            messages: Prompt messages
+            tools: Bound tool schemas, if the call expects a tool call
+
+        Returns:
+            Reply message and the number of tokens it represents
+        """
+        prompt = str(messages[-1].content) if messages else ""
+        match = _QUESTION_PATTERN.search(prompt)
+        question = match.group(1).strip() if match else prompt
+
+        if tools:
+            folded_question = question.casefold()
+            mentioned_teams = [
+                team_name
+                for team_name in self.team_names
+                if team_name.casefold() in folded_question
+            ]
+            tool_call = {
+                "name": tools[0]["function"]["name"],
+                "args": {
+                    "team_names": mentioned_teams,
+                    "team_ids": [],
+                    "upcoming_match_teams": mentioned_teams
+                    if "next" in folded_question
+                    else [],
+                    "recent_result_teams": mentioned_teams
+                    if "results" in folded_question
+                    else [],
+                    "league_tables": [
+                        league_name
+                        for league_name in _FAKE_LEAGUE_NAMES
+                        if league_name.casefold() in folded_question
+                    ]
+                    if "table" in folded_question
+                    else [],
+                },
+                "id": f"call_{uuid.uuid4().hex[:12]}",
+            }
+            return AIMessage(content="", tool_calls=[tool_call]), 16
+
+        if "SupervisorAgent" in prompt:
+            return AIMessage(content=self.routes.get(question, self.default_route)), 1
+
+        answer = " ".join(["football"] * self.answer_tokens)
+        return AIMessage(content=answer), self.answer_tokens
+
+    def _get_generation_seconds(self, token_count: int) -> float:
+        """
+        Get the simulated time a reply takes.
+
+        Args:
+            token_count: Number of tokens in the reply
+
+        Returns:
+            Time to first token plus the time to emit the remaining tokens
+        """
+        return (
+            self.first_token_latency_seconds
+            + max(token_count - 1, 0) / self.tokens_per_second
+        )
+
+
+class FakeWebSearchTool(BaseTool):
+    """Local stand-in for the Tavily search tool returning recorded results."""
+
+    name: str = "tavily_search"
+    description: str = "Search the web and return recorded results"
+    results: list[dict[str, Any]] = []
+    latency_seconds: float = 0.4
+
+    def _run(self, query: str) -> dict[str, Any]:
+        time.sleep(self.latency_seconds)
+        return {"query": query, "results": self.results}
+
+    async def _arun(self, query: str) -> dict[str, Any]:
+        await asyncio.sleep(self.latency_seconds)
+        return {"query": query, "results": self.results}
+
+
+class SportsDataFixtures:
+    """
+    Recorded TheSportsDB data served through an httpx mock transport.
+
+    Answers the endpoints used by SportsDataService from the recorded team
+    and league lists, including ETags for league bulk endpoints. League
+    matches and tables are derived from the recorded teams, with kickoff
+    dates relative to the current day.
+    """
+
+    def __init__(self, fixtures_dir: Path, latency_seconds: float = 0.15) -> None:
+        """
+        Load the recorded responses.
+
+        Args:
+            fixtures_dir: Directory containing teams.json and all_leagues.json
+            latency_seconds: Simulated latency of every API response
+        """
+        self._teams: list[dict[str, Any]] = json.loads(
+            (fixtures_dir / "teams.json").read_text()
+        )["teams"]
+        self._leagues: dict[str, Any] = json.loads(
+            (fixtures_dir / "all_leagues.json").read_text()
+        )
+        self._latency_seconds = latency_seconds
+        self.request_count = 0
+
+    @property
+    def team_names(self) -> list[str]:
+        """
+        Get the names of all recorded teams.
+
+        Returns:
+            Primary team names
+        """
+        return [team["strTeam"] for team in self._teams]
+
+    def build_transport(self) -> httpx.MockTransport:
+        """
+        Build an httpx transport serving the recorded responses.
+
+        Returns:
+            Mock transport for an httpx AsyncClient
+        """
+        return httpx.MockTransport(self._handle_request)
+
+    async def _handle_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Answer one API request from the recorded data.
+
+        Args:
+            request: Outgoing request of SportsDataService
+
+        Returns:
+            Recorded response, or an empty result for unknown queries
+        """
+        self.request_count += 1
+        await asyncio.sleep(self._latency_seconds)
+
+        endpoint = request.url.path.rsplit("/", 1)[-1]
+        if endpoint == "all_leagues.php":
+            return httpx.Response(200, json=self._leagues)
+
+        if endpoint == "searchteams.php":
+            query = request.url.params.get("t", "").casefold()
+            teams = [
+                team
+                for team in self._teams
+                if query
+                and (
+                    query in team["strTeam"].casefold()
+                    or query in (team.get("strAlternate") or "").casefold()
+                )
+            ]
+        elif endpoint == "lookupteam.php":
+            team_id = request.url.params.get("id", "")
+            teams = [team for team in self._teams if team["idTeam"] == team_id]
+        elif endpoint == "search_all_teams.php":
+            league_name = request.url.params.get("l", "")
+            teams = [team for team in self._teams if team["strLeague"] == league_name]
+            return self._build_versioned_response({"teams": teams or None}, request)
+        elif endpoint in ("eventsnextleague.php", "eventspastleague.php"):
+            events = self._build_league_events(
+                request.url.params.get("id", ""), endpoint == "eventsnextleague.php"
+            )
+            return self._build_versioned_response({"events": events or None}, request)
+        elif endpoint == "lookuptable.php":
+            table = self._build_league_table(request.url.params.get("l", ""))
+            return self._build_versioned_response({"table": table or None}, request)
+        else:
+            return httpx.Response(404)
+
+        return httpx.Response(200, json={"teams": teams or None})
+
+    def _build_league_events(
+        self, league_id: str, upcoming: bool
+    ) -> list[dict[str, Any]]:
+        """
+        Derive one round of matches between the recorded teams of a league.
+
+        Args:
+            league_id: TheSportsDB ID of the league
+            upcoming: Whether to build upcoming matches instead of played ones
+
+        Returns:
+            Raw event entries as returned by the API
+        """
+        teams = [team for team in self._teams if team.get("idLeague") == league_id]
+        events = []
+        for position, (home_team, away_team) in enumerate(zip(teams, teams[1:])):
+            day_offset = position + 1 if upcoming else -(position + 1)
+            kickoff_date = (date.today() + timedelta(days=day_offset)).isoformat()
+            events.append(
+                {
+                    "idEvent": f"{league_id}{position:03d}{int(upcoming)}",
+                    "strLeague": home_team["strLeague"],
+                    "intRound": "1",
+                    "idHomeTeam": home_team["idTeam"],
+                    "strHomeTeam": home_team["strTeam"],
+                    "idAwayTeam": away_team["idTeam"],
+                    "strAwayTeam": away_team["strTeam"],
+                    "dateEvent": kickoff_date,
+                    "strTime": "15:00:00",
+                    "strTimestamp": f"{kickoff_date}T15:00:00",
+                    "strVenue": home_team.get("strStadium"),
+                    "intHomeScore": None if upcoming else str(position % 3),
+                    "intAwayScore": None if upcoming else str((position + 1) % 2),
+                    "strStatus": "NS" if upcoming else "FT",
+                }
+            )
+        return events
+
+    def _build_league_table(self, league_id: str) -> list[dict[str, Any]]:
+        """
+        Derive a league table from the recorded teams of a league.
+
+        Args:
+            league_id: TheSportsDB ID of the league
+
+        Returns:
+            Raw table rows as returned by the API
+        """
+        teams = [team for team in self._teams if team.get("idLeague") == league_id]
+        return [
+            {
+                "intRank": str(rank),
+                "idTeam": team["idTeam"],
+                "strTeam": team["strTeam"],
+                "intPlayed": "10",
+                "intWin": str(10 - rank),
+                "intDraw": str(rank - 1),
+                "intLoss": "1",
+                "intGoalsFor": str(25 - rank),
+                "intGoalsAgainst": str(5 + rank),
+                "intGoalDifference": str(20 - 2 * rank),
+                "intPoints": str(3 * (10 - rank) + rank - 1),
+                "strForm": "WWDLW",
+            }
+            for rank, team in enumerate(teams, start=1)
+        ]
+
+    @staticmethod
+    def _build_versioned_response(
+        payload: dict[str, Any], request: httpx.Request
+    ) -> httpx.Response:
+        """
+        Build a JSON response with an ETag honouring conditional requests.
+
+        Args:
+            payload: Response body
+            request: Incoming request, possibly carrying If-None-Match
+
+        Returns:
+            Response with the payload, or 304 if the client's ETag matches
+        """
+        content = json.dumps(payload).encode()
+        etag = f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(
+            200,
+            content=content,
+            headers={"ETag": etag, "Content-Type": "application/json"},
+        )
@@ -0,0 +1,370 @@
+"""
+Offline load test of the chat API.
+
+Builds the real application stack with local stand-ins for Azure OpenAI,
+TheSportsDB and Tavily, serves it with uvicorn on the loopback interface,
+drives it at a fixed concurrency and reports latency percentiles,
+throughput, per-node time and peak RSS as JSON.
+
+Usage:
+    python -m benchmarks.run_benchmark --requests 200 --concurrency 20 --output result.json
+    python -m benchmarks.run_benchmark --baseline result.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://benchmark.invalid")
+os.environ.setdefault("AZURE_OPENAI_KEY", "benchmark")
+os.environ.setdefault("TAVILY_API_KEY", "benchmark")
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+
+from app.main import create_app  # noqa: E402
+from app.services.config_service import AppConfig  # noqa: E402
+from app.utils.latency_tracker import LatencyTracker  # noqa: E402
+from benchmarks.fakes import (  # noqa: E402
+    FakeChatModel,
+    FakeWebSearchTool,
+    SportsDataFixtures,
+)
+
+_FIXTURES_DIR = Path(__file__).parent / "fixtures"
+_COMPARED_METRICS = ("p50", "p95", "p99")
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+
+    Returns:
+        Parsed benchmark options
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=0)
+    parser.add_argument("--endpoint", choices=("chat", "stream"), default="chat")
+    parser.add_argument("--llm-first-token-latency", type=float, default=0.3)
+    parser.add_argument("--llm-tokens-per-second", type=float, default=50.0)
+    parser.add_argument("--llm-answer-tokens", type=int, default=60)
+    parser.add_argument("--sports-api-latency", type=float, default=0.15)
+    parser.add_argument("--web-search-latency", type=float, default=0.4)
+    parser.add_argument(
+        "--workload", type=Path, default=_FIXTURES_DIR / "workload.json"
+    )
+    parser.add_argument(
+        "--set",
+        dest="config_overrides",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Override an AppConfig field, may be repeated",
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--baseline", type=Path, help="Compare with a saved report")
+    return parser.parse_args()
+
+
+def build_app(options: argparse.Namespace, workload: list[dict[str, str]]):
+    """
+    Build the application with local stand-ins for all external services.
+
+    The answer cache is disabled unless overridden, so every request runs
+    the workflow.
+
+    Args:
+        options: Parsed benchmark options
+        workload: Questions with the route the fake model should choose
+
+    Returns:
+        Tuple of the FastAPI app and the TheSportsDB fixtures
+    """
+    sports_data_fixtures = SportsDataFixtures(
+        _FIXTURES_DIR / "thesportsdb", options.sports_api_latency
+    )
+    web_results = json.loads(
+        (_FIXTURES_DIR / "tavily" / "search_results.json").read_text()
+    )["results"]
+
+    config_values = {**os.environ, "ANSWER_CACHE_ENABLED": "false"}
+    for override in options.config_overrides:
+        key, _, value = override.partition("=")
+        config_values[key.strip()] = value.strip()
+
+    app = create_app(
+        AppConfig(config_values),
+        http_client=httpx.AsyncClient(transport=sports_data_fixtures.build_transport()),
+        chat_model=FakeChatModel(
+            routes={item["question"]: item["route"] for item in workload},
+            team_names=sports_data_fixtures.team_names,
+            first_token_latency_seconds=options.llm_first_token_latency,
+            tokens_per_second=options.llm_tokens_per_second,
+            answer_tokens=options.llm_answer_tokens,
+        ),
+        search_tool=FakeWebSearchTool(
+            results=web_results, latency_seconds=options.web_search_latency
+        ),
+    )
+    return app, sports_data_fixtures
+
+
+async def send_request(
+    client: httpx.AsyncClient, endpoint: str, question: str
+) -> tuple[bool, float, float | None]:
+    """
+    Send one chat request and measure it.
+
+    Args:
+        client: Client bound to the application
+        endpoint: Either "chat" or "stream"
+        question: Question to ask
+
+    Returns:
+        Success flag, total latency and time to the first streamed token
+    """
+    started_at = time.perf_counter()
+    if endpoint == "chat":
+        response = await client.post("/api/v1/chat", json={"question": question})
+        return response.status_code == 200, time.perf_counter() - started_at, None
+
+    first_token_seconds = None
+    succeeded = False
+    async with client.stream(
+        "POST", "/api/v1/chat/stream", json={"question": question}
+    ) as response:
+        async for line in response.aiter_lines():
+            if line == "event: token" and first_token_seconds is None:
+                first_token_seconds = time.perf_counter() - started_at
+            elif line == "event: done":
+                succeeded = response.status_code == 200
+    return succeeded, time.perf_counter() - started_at, first_token_seconds
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    options: argparse.Namespace,
+    questions: list[str],
+    request_count: int,
+) -> dict[str, Any]:
+    """
+    Send requests at a fixed concurrency.
+
+    Args:
+        client: Client bound to the application
+        options: Parsed benchmark options
+        questions: Questions sent in round-robin order
+        request_count: Number of requests to send
+
+    Returns:
+        Request counts, throughput and latency summaries
+    """
+    latency_tracker = LatencyTracker(window_size=max(request_count, 1))
+    first_token_tracker = LatencyTracker(window_size=max(request_count, 1))
+    semaphore = asyncio.Semaphore(options.concurrency)
+    failures = 0
+
+    async def run_one(position: int) -> None:
+        nonlocal failures
+        async with semaphore:
+            try:
+                succeeded, latency, first_token_seconds = await send_request(
+                    client, options.endpoint, questions[position % len(questions)]
+                )
+            except httpx.HTTPError:
+                succeeded, latency, first_token_seconds = False, 0.0, None
+
+        if not succeeded:
+            failures += 1
+            return
+        latency_tracker.record(latency)
+        if first_token_seconds is not None:
+            first_token_tracker.record(first_token_seconds)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(run_one(position) for position in range(request_count)))
+    duration_seconds = time.perf_counter() - started_at
+
+    report = {
+        "requests": request_count,
+        "failures": failures,
+        "duration_seconds": duration_seconds,
+        "requests_per_second": (request_count - failures) / duration_seconds
+        if duration_seconds
+        else 0.0,
+        "latency_seconds": latency_tracker.get_stats(),
+    }
+    if options.endpoint == "stream":
+        report["time_to_first_token_seconds"] = first_token_tracker.get_stats()
+    return report
+
+
+async def run_benchmark(options: argparse.Namespace) -> dict[str, Any]:
+    """
+    Run the benchmark end to end.
+
+    Args:
+        options: Parsed benchmark options
+
+    Returns:
+        JSON-serializable benchmark report
+    """
+    workload = json.loads(options.workload.read_text())
+    app, sports_data_fixtures = build_app(options, workload)
+    questions = [item["question"] for item in workload]
+
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning")
+    )
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        if server_task.done():
+            server_task.result()
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}",
+            timeout=None,
+            trust_env=False,
+            limits=httpx.Limits(max_connections=options.concurrency),
+        ) as client:
+            await wait_for_team_index(client)
+            if options.warmup:
+                await run_load(client, options, questions, options.warmup)
+            sports_api_requests_before = sports_data_fixtures.request_count
+
+            report = await run_load(client, options, questions, options.requests)
+            stats = (await client.get("/api/v1/stats")).json()["data"]
+    finally:
+        server.should_exit = True
+        await server_task
+
+    return {
+        "commit": get_git_commit(),
+        "options": {
+            key: str(value) if isinstance(value, Path) else value
+            for key, value in vars(options).items()
+            if key not in ("output", "baseline")
+        },
+        **report,
+        "nodes": stats.get("node_latency", {}),
+        "sports_api_requests": sports_data_fixtures.request_count
+        - sports_api_requests_before,
+        "peak_rss_mb": get_peak_rss_mb(),
+    }
+
+
+async def wait_for_team_index(
+    client: httpx.AsyncClient, timeout_seconds: float = 10.0
+) -> None:
+    """
+    Wait until the team index finished its initial load, if it is enabled.
+
+    Args:
+        client: Client bound to the application
+        timeout_seconds: Maximum time to wait
+    """
+    deadline = time.monotonic() + timeout_seconds
+    while time.monotonic() < deadline:
+        stats = (await client.get("/api/v1/stats")).json()["data"]
+        if stats.get("team_index", {"ready": True})["ready"]:
+            return
+        await asyncio.sleep(0.05)
+
+
+def get_peak_rss_mb() -> float:
+    """
+    Get the peak resident set size of this process.
+
+    Returns:
+        Peak RSS in megabytes
+    """
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def get_git_commit() -> str | None:
+    """
+    Get the commit the benchmark runs against.
+
+    Returns:
+        Short commit hash, or None outside a git checkout
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_reports(report: dict[str, Any], baseline: dict[str, Any]) -> str:
+    """
+    Summarize the change of the key metrics against a baseline report.
+
+    Args:
+        report: Report of the current run
+        baseline: Previously saved report
+
+    Returns:
+        Human-readable comparison, one metric per line
+    """
+
+    def format_change(name: str, current: float | None, previous: float | None):
+        if not current or not previous:
+            return f"{name}: {previous} -> {current}"
+        return f"{name}: {previous:.4f} -> {current:.4f} ({(current / previous - 1) * 100:+.1f}%)"
+
+    lines = [
+        f"baseline {baseline.get('commit')} vs current {report.get('commit')}",
+        format_change(
+            "requests_per_second",
+            report["requests_per_second"],
+            baseline["requests_per_second"],
+        ),
+        format_change("peak_rss_mb", report["peak_rss_mb"], baseline["peak_rss_mb"]),
+    ]
+    lines.extend(
+        format_change(
+            f"latency_{metric}",
+            report["latency_seconds"][metric],
+            baseline["latency_seconds"][metric],
+        )
+        for metric in _COMPARED_METRICS
+    )
+    return "\n".join(lines)
+
+
+def run() -> None:
+    """Run the benchmark from the command line."""
+    options = parse_arguments()
+    report = asyncio.run(run_benchmark(options))
+
+    serialized_report = json.dumps(report, indent=2)
+    if options.output:
+        options.output.write_text(serialized_report + "\n")
+    print(serialized_report)
+
+    if options.baseline:
+        print(
+            compare_reports(report, json.loads(options.baseline.read_text())),
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,152 @@
+"""
+Cold-start budget check.
+
+Measures, in fresh interpreters, how long importing app.main and building
+the app with create_app() take, and verifies that heavy optional modules
+stay unloaded. Exits with status 1 when a budget is exceeded so CI can
+gate on it; tests/test_startup_budget.py runs the same check under pytest.
+
+Usage:
+    python -m benchmarks.startup_budget --import-budget-ms 1500 --create-app-budget-ms 3000
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+LAZY_MODULES = ("IPython", "langchain.agents")
+IMPORT_BUDGET_MS = 2000.0
+CREATE_APP_BUDGET_MS = 3000.0
+
+_MEASUREMENT_SCRIPT = """
+import json, sys, time
+started_at = time.perf_counter()
+import app.main
+imported_at = time.perf_counter()
+app.main.create_app()
+created_at = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported_at - started_at) * 1000,
+    "create_app_ms": (created_at - imported_at) * 1000,
+    "loaded_lazy_modules": [name for name in %r if name in sys.modules],
+}))
+"""
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+
+    Returns:
+        Parsed budget options
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--import-budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument(
+        "--create-app-budget-ms", type=float, default=CREATE_APP_BUDGET_MS
+    )
+    return parser.parse_args()
+
+
+def measure_startup() -> dict:
+    """
+    Measure one cold start in a fresh interpreter.
+
+    Returns:
+        Import and create_app durations and the lazy modules that got loaded
+    """
+    environment = {
+        "AZURE_OPENAI_ENDPOINT": "https://startup-budget.invalid",
+        "AZURE_OPENAI_KEY": "startup-budget",
+        "TAVILY_API_KEY": "startup-budget",
+        **os.environ,
+        "TEAM_INDEX_ENABLED": "false",
+    }
+    completed_process = subprocess.run(
+        [sys.executable, "-c", _MEASUREMENT_SCRIPT % (LAZY_MODULES,)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=environment,
+    )
+    return json.loads(completed_process.stdout.strip().splitlines()[-1])
+
+
+def measure_startups(runs: int) -> dict:
+    """
+    Measure several cold starts and keep the fastest of each duration.
+
+    Args:
+        runs: Number of fresh interpreters to measure
+
+    Returns:
+        Best import and create_app durations and every lazy module that got
+        loaded in any run
+    """
+    measurements = [measure_startup() for _ in range(runs)]
+    return {
+        "import_ms": min(measurement["import_ms"] for measurement in measurements),
+        "create_app_ms": min(
+            measurement["create_app_ms"] for measurement in measurements
+        ),
+        "loaded_lazy_modules": sorted(
+            {
+                module_name
+                for measurement in measurements
+                for module_name in measurement["loaded_lazy_modules"]
+            }
+        ),
+    }
+
+
+def find_violations(
+    report: dict, import_budget_ms: float, create_app_budget_ms: float
+) -> list[str]:
+    """
+    Compare a startup report with the budgets.
+
+    Args:
+        report: Report returned by measure_startups
+        import_budget_ms: Maximum duration of importing app.main
+        create_app_budget_ms: Maximum duration of create_app()
+
+    Returns:
+        Description of every exceeded budget, empty if all are met
+    """
+    violations = []
+    if report["import_ms"] > import_budget_ms:
+        violations.append(
+            f"import app.main took {report['import_ms']:.0f} ms "
+            f"(budget {import_budget_ms:.0f} ms)"
+        )
+    if report["create_app_ms"] > create_app_budget_ms:
+        violations.append(
+            f"create_app() took {report['create_app_ms']:.0f} ms "
+            f"(budget {create_app_budget_ms:.0f} ms)"
+        )
+    if report["loaded_lazy_modules"]:
+        violations.append(
+            f"modules expected to load lazily were imported: {report['loaded_lazy_modules']}"
+        )
+    return violations
+
+
+def run() -> None:
+    """Run the startup budget check from the command line."""
+    options = parse_arguments()
+    report = measure_startups(options.runs)
+    print(json.dumps(report, indent=2))
+
+    violations = find_violations(
+        report, options.import_budget_ms, options.create_app_budget_ms
+    )
+    if violations:
+        print("\n".join(violations), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run()
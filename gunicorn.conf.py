@@ -0,0 +1,24 @@
+"""
+Gunicorn settings derived from the server runtime profile in AppConfig.
+
+Gunicorn loads this file from the working directory on start, e.g.
+``gunicorn "app.main:create_app()"``.
+"""
+
+import os
+
+from app.core.server_runtime import get_worker_class, get_worker_count
+from app.services.config_service import AppConfig
+
+_app_config = AppConfig(os.environ)
+
+bind = _app_config.SERVER_BIND
+workers = get_worker_count(_app_config)
+worker_class = get_worker_class(_app_config)
+backlog = _app_config.SERVER_BACKLOG
+keepalive = _app_config.SERVER_KEEPALIVE_SECONDS
+
+# The app factory opens HTTP connection pools, cache and checkpoint
+# connections. It must run in every worker after the fork, never in the
+# master, so no pool or socket is shared between processes.
+preload_app = False
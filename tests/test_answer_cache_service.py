@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from app.services.answer_cache_service import AnswerCacheService
+from app.services.config_service import AppConfig
+
+
+@pytest.fixture
+def answer_cache() -> AnswerCacheService:
+    return AnswerCacheService(
+        AppConfig(
+            {
+                "AZURE_OPENAI_ENDPOINT": "https://answer-cache.invalid",
+                "AZURE_OPENAI_KEY": "answer-cache",
+                "TAVILY_API_KEY": "answer-cache",
+            }
+        )
+    )
+
+
+def test_non_latin_questions_get_distinct_keys(
+    answer_cache: AnswerCacheService,
+) -> None:
+    founded_key = answer_cache.normalize_question("Когда основан Arsenal?")
+    stadium_key = answer_cache.normalize_question("Где стадион Arsenal?")
+
+    assert founded_key != stadium_key
+    assert founded_key != answer_cache.normalize_question("Arsenal")
+
+
+def test_non_latin_question_key_ignores_case_and_punctuation(
+    answer_cache: AnswerCacheService,
+) -> None:
+    assert answer_cache.normalize_question(
+        "Когда основан Arsenal?"
+    ) == answer_cache.normalize_question("когда ОСНОВАН arsenal")
+
+
+def test_accents_are_folded(answer_cache: AnswerCacheService) -> None:
+    assert answer_cache.normalize_question(
+        "Where do Bayern München play?"
+    ) == answer_cache.normalize_question("where do bayern munchen play")
+
+
+def test_non_latin_questions_do_not_share_cached_answers(
+    answer_cache: AnswerCacheService,
+) -> None:
+    async def store_and_look_up() -> str | None:
+        await answer_cache.set("Когда основан Arsenal?", "1886", "fotmob_agent", 1.0)
+        return await answer_cache.get("Где стадион Arsenal?")
+
+    assert asyncio.run(store_and_look_up()) is None
@@ -0,0 +1,24 @@
+from app.domain.models.conversation_state import ConversationState
+from app.services.answer_synthesizer_service import (
+    NOT_RELEVANT_ANSWER,
+    AnswerSynthesizerService,
+)
+
+
+def test_empty_context_without_session_is_not_relevant() -> None:
+    conversation_state = ConversationState(user_question="Who discovered America?")
+
+    assert (
+        AnswerSynthesizerService().try_synthesize(conversation_state, "")
+        == NOT_RELEVANT_ANSWER
+    )
+
+
+def test_empty_context_with_session_summary_is_left_to_the_llm() -> None:
+    conversation_state = ConversationState(
+        user_question="What did you say about them?",
+        session_id="session",
+        session_summary=["Q: Where do Arsenal play? A: At the Emirates Stadium."],
+    )
+
+    assert AnswerSynthesizerService().try_synthesize(conversation_state, "") is None
@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from app.main import create_app
+from app.services.chat_job_service import ChatJobService
+from app.services.config_service import AppConfig, AppConfigError
+from app.utils.cache_backend import MemoryCacheBackend
+
+
+def _create_config(**settings: str) -> AppConfig:
+    return AppConfig(
+        {
+            "AZURE_OPENAI_ENDPOINT": "https://chat-jobs.invalid",
+            "AZURE_OPENAI_KEY": "chat-jobs",
+            "TAVILY_API_KEY": "chat-jobs",
+            **settings,
+        }
+    )
+
+
+def test_cancelled_job_is_stored_as_failed_in_the_shared_cache() -> None:
+    async def cancel_running_job() -> object:
+        shared_cache = MemoryCacheBackend(10)
+        chat_jobs = ChatJobService(1, 10, 60.0, shared_cache)
+        started = asyncio.Event()
+
+        async def operation() -> str:
+            started.set()
+            await asyncio.Event().wait()
+            return "never"
+
+        chat_jobs.start()
+        job = await chat_jobs.submit(operation)
+        await started.wait()
+        await chat_jobs.stop()
+        return await shared_cache.get(f"chat_job:{job.job_id}")
+
+    assert asyncio.run(cancel_running_job()) == {
+        "status": "failed",
+        "answer": None,
+        "error": "Job cancelled",
+    }
+
+
+def test_several_workers_without_shared_cache_fail_at_startup() -> None:
+    with pytest.raises(AppConfigError, match="SHARED_CACHE_BACKEND"):
+        create_app(_create_config(SERVER_WORKERS="2"))
+
+
+def test_several_workers_without_chat_jobs_start() -> None:
+    create_app(_create_config(SERVER_WORKERS="2", CHAT_JOBS_ENABLED="false"))
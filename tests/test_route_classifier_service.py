@@ -0,0 +1,63 @@
+import pytest
+
+from app.domain.enums import WorkflowRouteDecision
+from app.services.route_classifier_service import RouteClassifierService
+
+
+@pytest.fixture(scope="module")
+def route_classifier() -> RouteClassifierService:
+    return RouteClassifierService()
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "Where does Kylian Mbappe play?",
+        "Who is Erling Haaland?",
+        "How old is Cristiano Ronaldo?",
+        "Where does Jude Bellingham play?",
+        "Who does Pep Guardiola coach?",
+        "Is Lionel Messi retired?",
+    ],
+)
+def test_player_and_manager_questions_are_not_refused(
+    route_classifier: RouteClassifierService, question: str
+) -> None:
+    assert route_classifier.try_classify(question) in (
+        None,
+        WorkflowRouteDecision.WEB_SEARCH,
+        WorkflowRouteDecision.COMBINED_APPROACH,
+    )
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "What is the weather in Valencia?",
+        "What is the weather in Dallas?",
+        "Who discovered America?",
+        "What is the capital of France?",
+    ],
+)
+def test_off_topic_questions_fall_back_to_the_llm(
+    route_classifier: RouteClassifierService, question: str
+) -> None:
+    assert route_classifier.try_classify(question) is None
+
+
+def test_team_fact_question_is_served_locally(
+    route_classifier: RouteClassifierService,
+) -> None:
+    assert (
+        route_classifier.try_classify("What stadium does Arsenal play in?")
+        == WorkflowRouteDecision.FOOTBALL_DATA
+    )
+
+
+def test_threshold_is_calibrated_on_held_out_questions(
+    route_classifier: RouteClassifierService,
+) -> None:
+    stats = route_classifier.get_stats()
+
+    assert stats["confidence_threshold"] >= 0.8
+    assert stats["held_out_precision"] == 1.0
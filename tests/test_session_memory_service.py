@@ -0,0 +1,84 @@
+import pytest
+
+from app.domain.models.conversation_state import ConversationState
+from app.services.config_service import AppConfig
+from app.services.session_memory_service import SessionMemoryService
+
+
+class _KnownEntities:
+    def is_known_entity(self, normalized_name: str) -> bool:
+        return normalized_name in {"arsenal", "chelsea", "premier league"}
+
+
+@pytest.fixture
+def session_memory() -> SessionMemoryService:
+    return SessionMemoryService(
+        AppConfig(
+            {
+                "AZURE_OPENAI_ENDPOINT": "https://session-memory.invalid",
+                "AZURE_OPENAI_KEY": "session-memory",
+                "TAVILY_API_KEY": "session-memory",
+            }
+        ),
+        fixtures_store=_KnownEntities(),
+    )
+
+
+@pytest.fixture
+def arsenal_session(session_memory: SessionMemoryService) -> ConversationState:
+    first_turn = ConversationState(
+        user_question="Where do Arsenal play?",
+        session_id="session",
+        retrieved_context=[{"role": "tool", "content": "Arsenal: Emirates Stadium"}],
+    )
+    return first_turn.model_copy(
+        update=session_memory.record_turn(
+            first_turn, "Arsenal play at the Emirates Stadium."
+        )
+    )
+
+
+def test_record_turn_remembers_named_entity(
+    arsenal_session: ConversationState,
+) -> None:
+    assert arsenal_session.session_entity == "arsenal"
+
+
+def test_follow_up_about_covered_facts_reuses_context(
+    session_memory: SessionMemoryService, arsenal_session: ConversationState
+) -> None:
+    follow_up = arsenal_session.model_copy(
+        update={"user_question": "How big is their stadium?"}
+    )
+
+    assert session_memory.get_reusable_context(follow_up)
+    assert session_memory.resolve_follow_up(follow_up) is None
+
+
+@pytest.mark.parametrize(
+    ("question", "resolved_question"),
+    [
+        ("When do they play next?", "When do arsenal play next?"),
+        ("What is their latest result?", "What is arsenal's latest result?"),
+    ],
+)
+def test_follow_up_needing_fresh_data_names_the_entity(
+    session_memory: SessionMemoryService,
+    arsenal_session: ConversationState,
+    question: str,
+    resolved_question: str,
+) -> None:
+    follow_up = arsenal_session.model_copy(update={"user_question": question})
+
+    assert session_memory.get_reusable_context(follow_up) is None
+    assert session_memory.resolve_follow_up(follow_up) == resolved_question
+
+
+def test_follow_up_naming_another_team_is_not_rewritten(
+    session_memory: SessionMemoryService, arsenal_session: ConversationState
+) -> None:
+    follow_up = arsenal_session.model_copy(
+        update={"user_question": "Did they beat Chelsea?"}
+    )
+
+    assert session_memory.resolve_follow_up(follow_up) is None
@@ -0,0 +1,51 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.config_service import AppConfig
+from app.services.sports_data_service import SportsDataService
+
+_RAW_TEAM = {
+    "idTeam": 133604,
+    "strTeam": "Arsenal",
+    "intFormedYear": 1892,
+    "strSport": "Soccer",
+    "strLeague": "English Premier League",
+    "strStadium": "Emirates Stadium",
+    "strFacebook": None,
+}
+
+
+@pytest.fixture
+def sports_data() -> SportsDataService:
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json={"teams": [_RAW_TEAM]})
+    )
+    return SportsDataService(
+        AppConfig(
+            {
+                "AZURE_OPENAI_ENDPOINT": "https://sports-data.invalid",
+                "AZURE_OPENAI_KEY": "sports-data",
+                "TAVILY_API_KEY": "sports-data",
+            }
+        ),
+        httpx.AsyncClient(transport=transport),
+    )
+
+
+def test_search_and_lookup_return_the_same_team_values(
+    sports_data: SportsDataService,
+) -> None:
+    async def search_and_look_up() -> tuple[list[dict], object]:
+        return (
+            await sports_data.search_teams_by_name("Arsenal"),
+            await sports_data.get_team_details_by_id("133604"),
+        )
+
+    search_results, looked_up_team = asyncio.run(search_and_look_up())
+
+    assert looked_up_team is not None
+    assert search_results == [looked_up_team.model_dump()]
+    assert looked_up_team.team_id == "133604"
+    assert looked_up_team.formation_year == "1892"
@@ -0,0 +1,12 @@
+from benchmarks.startup_budget import (
+    CREATE_APP_BUDGET_MS,
+    IMPORT_BUDGET_MS,
+    find_violations,
+    measure_startups,
+)
+
+
+def test_cold_start_stays_within_budget() -> None:
+    report = measure_startups(runs=3)
+
+    assert find_violations(report, IMPORT_BUDGET_MS, CREATE_APP_BUDGET_MS) == []